@@ -0,0 +1,43 @@
+"""Benchmark passing camera frames in BGR order instead of converting them.
+
+Compares the time per frame of converting each BGR frame to RGB before
+detection and averaging with passing the BGR frame directly to a detector with
+`channel_order="bgr"`, which only swaps the channels of the averaged colors.
+
+Run with `python benchmarks/bench_channel_order.py [width] [height]`.
+"""
+
+import pathlib
+import sys
+import timeit
+
+import cv2
+import numpy as np
+
+from yarppg.processors.processor import roi_colors
+from yarppg.roi import SkinDetector
+
+IMAGE = pathlib.Path(__file__).parents[1] / "tests" / "face_example1.jpg"
+
+
+def main(width: int = 1920, height: int = 1080):
+    frame = cv2.resize(cv2.imread(str(IMAGE)), (width, height))
+    rgb_detector = SkinDetector(detect_interval=5)
+    bgr_detector = SkinDetector(detect_interval=5, channel_order="bgr")
+
+    def convert():
+        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        return roi_colors(rgb_detector.detect(rgb))[0]
+
+    def swap():
+        return roi_colors(bgr_detector.detect(frame))[0]
+
+    assert np.allclose(np.array(convert()), np.array(swap()))
+    for name, func in {"convert to RGB": convert, "BGR input": swap}.items():
+        n, total = timeit.Timer(func).autorange()
+        ms = 1e3 * total / n
+        print(f"{name:>15}: {ms:.3f} ms per frame ({1e3 / ms:.0f} fps)")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
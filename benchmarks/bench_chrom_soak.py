@@ -0,0 +1,45 @@
+"""Soak benchmark for the ChromProcessor in a long-running application.
+
+Feeds millions of frames (tiny synthetic ROIs) through the processor and
+reports the time per frame and the traced memory for successive blocks of
+frames. Both should stay constant over the entire run.
+
+Run with `python benchmarks/bench_chrom_soak.py [n_frames]`.
+"""
+
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+import yarppg
+
+
+def main(n_frames: int = 2_000_000, block: int = 200_000):
+    rng = np.random.default_rng(0)
+    rois = [
+        yarppg.RegionOfInterest(
+            np.ones((1, 1), dtype=np.uint8),
+            rng.integers(50, 200, size=(1, 1, 3), dtype=np.uint8),
+        )
+        for _ in range(1000)
+    ]
+    for method in ["fixed", "xovery"]:
+        processor = yarppg.ChromProcessor(method=method)
+        tracemalloc.start()
+        for start in range(0, n_frames, block):
+            t0 = time.perf_counter()
+            for i in range(start, start + block):
+                processor.process(rois[i % len(rois)])
+            dt = time.perf_counter() - t0
+            current, _ = tracemalloc.get_traced_memory()
+            print(
+                f"{method:>6} frames {start + block:>9}: "
+                f"{1e6 * dt / block:5.2f} us/frame, {current / 1024:8.1f} KiB traced"
+            )
+        tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
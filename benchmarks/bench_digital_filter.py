@@ -0,0 +1,50 @@
+"""Microbenchmark for the per-sample cost of DigitalFilter.process.
+
+Compares the live filter with the previous approach of calling
+`scipy.signal.lfilter` for every incoming sample, for a range of filter
+orders.
+
+Run with `python benchmarks/bench_digital_filter.py [n_samples]`.
+"""
+
+import sys
+import time
+
+import numpy as np
+import scipy.signal
+
+from yarppg import digital_filter
+
+
+def lfilter_per_sample(b, a, xs):
+    zi = scipy.signal.lfiltic(b, a, [0], 0)
+    for x in xs:
+        _, zi = scipy.signal.lfilter(b, a, [x], zi=zi)
+
+
+def main(n_samples: int = 100_000):
+    xs = np.random.default_rng(0).normal(size=n_samples).tolist()
+    for order in [2, 4, 8]:
+        cfg = digital_filter.FilterConfig(
+            30.0, f1=0.5, f2=4.0, btype="band", order=order
+        )
+        b, a = digital_filter.filtercoeffs_from_config(cfg)
+
+        t0 = time.perf_counter()
+        lfilter_per_sample(b, a, xs)
+        t_lfilter = time.perf_counter() - t0
+
+        live = digital_filter.make_digital_filter(cfg)
+        t0 = time.perf_counter()
+        for x in xs:
+            live.process(x)
+        t_live = time.perf_counter() - t0
+
+        print(
+            f"order {order}: lfilter {1e6 * t_lfilter / n_samples:6.2f} us/sample, "
+            f"DigitalFilter.process {1e6 * t_live / n_samples:5.2f} us/sample"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
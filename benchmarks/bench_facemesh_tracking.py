@@ -0,0 +1,47 @@
+"""Benchmark throughput and ROI drift of FaceMeshDetector's tracking mode.
+
+For each detection interval, the video is processed with a tracking detector
+and, as reference, with a detector that runs the landmarker on every frame.
+Drift is the mean distance (in pixels) between the corners of the tracked
+and the detected ROI polygons.
+
+Run with `python benchmarks/bench_facemesh_tracking.py <video file>`.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import yarppg
+
+
+def run_detector(detector: yarppg.FaceMeshDetector, frames: list[np.ndarray]):
+    t0 = time.perf_counter()
+    polygons = [detector.detect(frame).polygon for frame in frames]
+    return polygons, time.perf_counter() - t0
+
+
+def mean_drift(polygons, reference) -> float:
+    dists = [
+        np.linalg.norm(p - r, axis=1).mean()
+        for p, r in zip(polygons, reference)
+        if p is not None and r is not None
+    ]
+    return float(np.mean(dists)) if dists else np.nan
+
+
+def main(filename: str):
+    frames = list(yarppg.frames_from_video(filename))
+    reference, dt = run_detector(yarppg.FaceMeshDetector(), frames)
+    print(f"interval  1: {len(frames) / dt:6.1f} fps, drift 0.00 px")
+    for interval in [2, 3, 5, 10, 20]:
+        detector = yarppg.FaceMeshDetector(detect_interval=interval)
+        polygons, dt = run_detector(detector, frames)
+        drift = mean_drift(polygons, reference)
+        fps = len(frames) / dt
+        print(f"interval {interval:2d}: {fps:6.1f} fps, drift {drift:.2f} px")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1])
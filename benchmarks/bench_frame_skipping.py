@@ -0,0 +1,50 @@
+"""Benchmark processing only every k-th frame with resampling.
+
+Processes 20 seconds of a synthetic 30 fps video (720p, skin-colored block
+pulsating at 72 bpm) with the `SkinDetector`, passing only every k-th frame
+together with its timestamp. The resampled signal keeps the nominal rate, so
+the HR estimate should stay close to 72 bpm while the processing time drops.
+
+Run with `python benchmarks/bench_frame_skipping.py [max_stride]`.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import yarppg
+
+FPS = 30
+BPM = 72
+
+
+def make_frames(n: int) -> list[np.ndarray]:
+    frames = []
+    for i in range(n):
+        frame = np.full((720, 1280, 3), (90, 120, 160), dtype="uint8")
+        pulse = 3 * np.sin(2 * np.pi * BPM / 60 * i / FPS)
+        frame[200:500, 400:800] = (200, round(150 + pulse), 120)
+        frames.append(frame)
+    return frames
+
+
+def main(max_stride: int = 4):
+    frames = make_frames(20 * FPS)
+    for stride in range(1, max_stride + 1):
+        rppg = yarppg.Rppg(
+            yarppg.SkinDetector(face_cascade=False),
+            hr_calc=yarppg.PeakBasedHrCalculator(FPS, update_interval=1),
+            fps=FPS,
+            resample=True,
+        )
+        start = time.perf_counter()
+        for i in range(0, len(frames), stride):
+            result = rppg.process_frame(frames[i], lightweight=True, timestamp=i / FPS)
+        seconds = time.perf_counter() - start
+        bpm = yarppg.bpm_from_frames_per_beat(result.hr, FPS)
+        print(f"stride {stride}: {seconds:.2f} s for 20 s of video, HR {bpm:.1f} bpm")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
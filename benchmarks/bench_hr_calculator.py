@@ -0,0 +1,62 @@
+"""Latency of HR updates with long windows at high frame rates.
+
+Compares the `find_peaks`-based update of the PeakBasedHrCalculator (every 10
+frames) with the incremental peak tracker (every frame). Reports the mean and
+maximum time per `update` call. Afterwards, compares the time to compute the
+HR of the entire signal by calling `update` for each sample with the
+vectorized `process_trace`.
+
+Run with `python benchmarks/bench_hr_calculator.py [fps] [window_seconds]`.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import yarppg
+
+
+def measure(hrcalc: yarppg.HrCalculator, signal: list[float]) -> np.ndarray:
+    durations = []
+    for value in signal:
+        t0 = time.perf_counter()
+        hrcalc.update(value)
+        durations.append(time.perf_counter() - t0)
+    return np.array(durations)
+
+
+def main(fps: float = 60, window_seconds: float = 30):
+    n = int(20 * fps * window_seconds)
+    t = np.arange(n) / fps
+    rng = np.random.default_rng(0)
+    signal = (np.sin(2 * np.pi * 1.2 * t) + 0.1 * rng.normal(size=n)).tolist()
+
+    configs = {
+        "find_peaks (interval 10)": {},
+        "incremental (interval 1)": {"incremental": True, "update_interval": 1},
+    }
+    for label, kwargs in configs.items():
+        hrcalc = yarppg.PeakBasedHrCalculator(fps, window_seconds, **kwargs)
+        durations = measure(hrcalc, signal)
+        print(
+            f"{label}: mean {1e6 * durations.mean():6.2f} us, "
+            f"max {1e6 * durations.max():8.2f} us"
+        )
+
+    for hrcalc in [
+        yarppg.PeakBasedHrCalculator(fps, window_seconds),
+        yarppg.SpectralHrCalculator(fps, window_seconds, update_interval=10),
+    ]:
+        durations = measure(hrcalc, signal)
+        t0 = time.perf_counter()
+        hrcalc.process_trace(signal)
+        t_trace = time.perf_counter() - t0
+        print(
+            f"{type(hrcalc).__name__}: update loop {durations.sum():6.3f}s, "
+            f"process_trace {t_trace:6.4f}s"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(float, sys.argv[1:]))
@@ -0,0 +1,45 @@
+"""Benchmark the adaptive load controller on an expensive detector setup.
+
+Runs the `SkinDetector` with the face cascade on every full-resolution HD frame,
+which is too slow for the target frame rate on most machines. The controller
+reduces the cascade input and skips frames until the processing time per
+incoming frame fits into the budget.
+
+Run with `python benchmarks/bench_load_control.py [target_fps] [n_frames]`.
+"""
+
+import pathlib
+import sys
+import time
+
+import cv2
+
+import yarppg
+
+IMAGE = pathlib.Path(__file__).parents[1] / "tests" / "face_example1.jpg"
+
+
+def main(target_fps: int = 60, n_frames: int = 300):
+    frame = cv2.resize(cv2.imread(str(IMAGE)), (1920, 1080))
+    detector = yarppg.SkinDetector(
+        detect_interval=1, scale=1.0, crop_margin=None, channel_order="bgr"
+    )
+    controller = yarppg.LoadController(target_fps, cooldown=10)
+    rppg = yarppg.Rppg(detector, resample=True, load_controller=controller)
+
+    start = time.perf_counter()
+    for i in range(n_frames):
+        rppg.process_frame(frame, lightweight=True, timestamp=i / target_fps)
+        if (i + 1) % 50 == 0:
+            fps = (i + 1) / (time.perf_counter() - start)
+            telemetry = controller.telemetry()
+            print(
+                f"frame {i + 1}: {fps:.0f} fps, level {telemetry.level}, "
+                f"load {telemetry.load:.2f}, {telemetry.settings}"
+            )
+    for decision in controller.decisions:
+        print(decision)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
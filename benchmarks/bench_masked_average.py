@@ -0,0 +1,43 @@
+"""Benchmark full-frame against bounding box-local ROI masks on HD input.
+
+Compares creating the ROI mask and averaging the masked region for a typical
+lower-face polygon in a 1080p frame, using a full-frame mask and a compact
+mask covering only the bounding box of the polygon.
+
+Run with `python benchmarks/bench_masked_average.py`.
+"""
+
+import timeit
+
+import numpy as np
+
+from yarppg.roi import roi_tools
+
+SIZE = (1080, 1920)
+POLYGON = np.array(
+    [[960, 760], [1080, 700], [1130, 600], [1110, 520], [810, 520], [790, 600],
+     [840, 700]]
+)  # fmt: skip
+
+
+def full_frame(frame: np.ndarray):
+    mask = roi_tools.contour_to_mask(SIZE, POLYGON)
+    return roi_tools.masked_average(frame, mask)
+
+
+def local(frame: np.ndarray):
+    mask, rect = roi_tools.contour_to_local_mask(SIZE, POLYGON)
+    return roi_tools.masked_average(frame, mask, rect)
+
+
+def main():
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 255, SIZE + (3,), dtype=np.uint8)
+    assert np.allclose(full_frame(frame), local(frame))
+    for func in [full_frame, local]:
+        n, total = timeit.Timer(lambda f=func: f(frame)).autorange()
+        print(f"{func.__name__:>10}: {1e3 * total / n:.3f} ms per frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Cost of additional algorithms in a MultiRppg compared to separate Rppg's.
+
+A cheap detector selecting a central region of 1080p frames stands in for the
+ROI detection, so the numbers show the cost of color averaging and signal
+extraction only. With a real detector (FaceMesh), the savings are larger.
+
+Run with `python benchmarks/bench_multi_rppg.py [n_frames]`.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import yarppg
+
+
+class CenterDetector(yarppg.RoiDetector):
+    def detect(self, frame: np.ndarray) -> yarppg.RegionOfInterest:
+        h, w = frame.shape[:2]
+        mask = np.ones((h // 2, w // 2), dtype=np.uint8)
+        return yarppg.RegionOfInterest(
+            mask, frame, mask_rect=(w // 4, h // 4, w // 2, h // 2)
+        )
+
+
+def make_processors() -> dict[str, yarppg.Processor]:
+    return {
+        "green": yarppg.Processor(),
+        "chrom": yarppg.ChromProcessor(),
+        "fixed": yarppg.ChromProcessor(method="fixed"),
+    }
+
+
+def main(n_frames: int = 200):
+    rng = np.random.default_rng(0)
+    frames = rng.integers(0, 255, size=(4, 1080, 1920, 3), dtype=np.uint8)
+    detector = CenterDetector()
+
+    separate = [yarppg.Rppg(detector, p) for p in make_processors().values()]
+    t0 = time.perf_counter()
+    for i in range(n_frames):
+        for rppg in separate:
+            rppg.process_frame(frames[i % len(frames)])
+    t_separate = time.perf_counter() - t0
+
+    multi = yarppg.MultiRppg(detector, make_processors())
+    t0 = time.perf_counter()
+    for i in range(n_frames):
+        multi.process_frame(frames[i % len(frames)])
+    t_multi = time.perf_counter() - t0
+
+    print(
+        f"{len(separate)} algorithms: separate Rppg {1e3 * t_separate / n_frames:6.2f}"
+        f" ms/frame, MultiRppg {1e3 * t_multi / n_frames:6.2f} ms/frame"
+    )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,54 @@
+"""Benchmark patch-grid color extraction on HD input.
+
+Compares averaging each patch of a G x G grid over the face with its own mask
+against a single `patch_grid` call, which reads all patch sums from one
+summed-area table.
+
+Run with `python benchmarks/bench_patch_grid.py [grid]`.
+"""
+
+import sys
+import timeit
+
+import numpy as np
+
+from yarppg.roi import roi_tools
+
+SIZE = (1080, 1920)
+FACE_RECT = (760, 300, 400, 480)
+POLYGON = np.array(
+    [[860, 330], [1060, 330], [1120, 520], [1060, 760], [860, 760], [800, 520]]
+)
+
+
+def per_patch(frame: np.ndarray, mask: np.ndarray, grid: int):
+    x, y, w, h = FACE_RECT
+    means = np.full((grid, grid, 3), np.nan)
+    for i in range(grid):
+        for j in range(grid):
+            cell = np.zeros(SIZE, dtype=np.uint8)
+            y1, y2 = y + h * i // grid, y + h * (i + 1) // grid
+            x1, x2 = x + w * j // grid, x + w * (j + 1) // grid
+            cell[y1:y2, x1:x2] = mask[y1:y2, x1:x2]
+            means[i, j] = np.array(roi_tools.masked_average(frame, cell))
+    return means
+
+
+def grid_call(frame: np.ndarray, mask: np.ndarray, grid: int):
+    return roi_tools.patch_grid(frame, FACE_RECT, grid, mask)
+
+
+def main(grid: int = 8):
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 255, SIZE + (3,), dtype=np.uint8)
+    mask = roi_tools.contour_to_mask(SIZE, POLYGON)
+    assert np.allclose(
+        per_patch(frame, mask, grid), grid_call(frame, mask, grid), equal_nan=True
+    )
+    for func in [per_patch, grid_call]:
+        n, total = timeit.Timer(lambda f=func: f(frame, mask, grid)).autorange()
+        print(f"{func.__name__:>10}: {1e3 * total / n:.3f} ms per frame")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,55 @@
+"""Benchmark offline re-analysis of color traces with Processor.process_trace.
+
+Compares replaying a trace of ROI colors frame by frame through `process`
+with the vectorized `process_trace`, for all registered algorithms with and
+without a bandpass filter.
+
+Run with `python benchmarks/bench_process_trace.py [n_frames]`.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import yarppg
+from yarppg import digital_filter, processors
+
+
+def replay(processor: yarppg.Processor, trace: np.ndarray) -> np.ndarray:
+    processor.reset()
+    rois = [
+        yarppg.RegionOfInterest(np.ones((1, 1), dtype=np.uint8), rgb.reshape(1, 1, 3))
+        for rgb in trace
+    ]
+    return np.array([processor.process(roi).value for roi in rois])
+
+
+def main(n_frames: int = 100_000):
+    trace = np.random.default_rng(0).uniform(50, 200, size=(n_frames, 3))
+    cfg = digital_filter.FilterConfig(30.0, 0.5, 4.0, btype="band")
+    for name, factory in processors.algorithms.items():
+        for filtered in [False, True]:
+            processor = factory()
+            if filtered:
+                livefilter = digital_filter.make_digital_filter(cfg)
+                processor = yarppg.FilteredProcessor(processor, livefilter)
+
+            t0 = time.perf_counter()
+            streamed = replay(processor, trace)
+            t_stream = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            batch = processor.process_trace(trace)
+            t_batch = time.perf_counter() - t0
+
+            assert np.allclose(streamed, batch, equal_nan=True)
+            label = f"{name}{' + filter' if filtered else ''}"
+            print(
+                f"{label:>15}: process {t_stream:6.3f}s, "
+                f"process_trace {t_batch:6.4f}s ({t_stream / t_batch:5.0f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
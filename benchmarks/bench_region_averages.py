@@ -0,0 +1,44 @@
+"""Benchmark averaging several face regions on HD input.
+
+Compares one full-frame `masked_average` call per region (forehead and both
+cheeks) with a single `masked_averages` pass over a bounding box-local label
+image of all regions.
+
+Run with `python benchmarks/bench_region_averages.py`.
+"""
+
+import timeit
+
+import numpy as np
+
+from yarppg.roi import roi_tools
+
+SIZE = (1080, 1920)
+REGIONS = [
+    np.array([[860, 330], [960, 300], [1060, 330], [1050, 420], [870, 420]]),
+    np.array([[800, 560], [880, 540], [900, 640], [850, 700], [810, 660]]),
+    np.array([[1040, 540], [1120, 560], [1110, 660], [1070, 700], [1020, 640]]),
+]
+
+
+def per_region(frame: np.ndarray):
+    masks = [roi_tools.contour_to_mask(SIZE, points) for points in REGIONS]
+    return np.array([roi_tools.masked_average(frame, mask) for mask in masks])
+
+
+def labels(frame: np.ndarray):
+    labels, rect = roi_tools.contours_to_local_labels(SIZE, REGIONS)
+    return roi_tools.masked_averages(frame, labels, len(REGIONS), rect)
+
+
+def main():
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 255, SIZE + (3,), dtype=np.uint8)
+    assert np.allclose(per_region(frame), labels(frame))
+    for func in [per_region, labels]:
+        n, total = timeit.Timer(lambda f=func: f(frame)).autorange()
+        print(f"{func.__name__:>10}: {1e3 * total / n:.3f} ms per frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Benchmark the per-frame overhead of collecting results in `process_video`.
+
+Compares the previous approach (one `pd.Series` per frame, concatenated at the
+end) to the columnar `RppgResultTable`. No video decoding or ROI detection is
+involved; only the cost of storing results is measured.
+
+Run with `python benchmarks/bench_results.py`.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+import yarppg
+
+
+def make_results(n: int) -> list[yarppg.RppgResult]:
+    roi = yarppg.RegionOfInterest(np.zeros((1, 1)), np.zeros((1, 1, 3)))
+    rng = np.random.default_rng(0)
+    return [
+        yarppg.RppgResult(
+            v, roi, yarppg.Color(*rng.random(3)), yarppg.Color.null(), hr=30.0
+        )
+        for v in rng.random(n)
+    ]
+
+
+def collect_series(results: list[yarppg.RppgResult]):
+    return pd.concat([result.to_series() for result in results]).T
+
+
+def collect_table(results: list[yarppg.RppgResult]) -> pd.DataFrame:
+    table = yarppg.RppgResultTable()
+    for result in results:
+        table.append(result)
+    return table.to_dataframe()
+
+
+def main():
+    for n in [1_000, 10_000, 100_000]:
+        results = make_results(n)
+        for name, func in [("series", collect_series), ("table", collect_table)]:
+            t0 = time.perf_counter()
+            func(results)
+            dt = time.perf_counter() - t0
+            print(f"{name:>6} n={n:>7}: {dt:7.3f}s total, {1e6 * dt / n:6.2f}us/frame")
+
+
+if __name__ == "__main__":
+    main()
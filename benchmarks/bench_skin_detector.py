@@ -0,0 +1,37 @@
+"""Benchmark the model-free skin detector on HD input.
+
+Measures the time per frame of the `SkinDetector` with the face cascade running
+on every frame and every n-th frame, and without a face cascade.
+
+Run with `python benchmarks/bench_skin_detector.py [detect_interval]`.
+"""
+
+import pathlib
+import sys
+import timeit
+
+import cv2
+
+from yarppg.roi import SkinDetector
+
+IMAGE = pathlib.Path(__file__).parents[1] / "tests" / "face_example1.jpg"
+
+
+def main(detect_interval: int = 5):
+    frame = cv2.cvtColor(cv2.imread(str(IMAGE)), cv2.COLOR_BGR2RGB)
+    frame = cv2.resize(frame, (1920, 1080), interpolation=cv2.INTER_AREA)
+    detectors = {
+        "cascade every frame": SkinDetector(detect_interval=1),
+        f"cascade every {detect_interval}": SkinDetector(
+            detect_interval=detect_interval
+        ),
+        "no cascade": SkinDetector(face_cascade=False),
+    }
+    for name, detector in detectors.items():
+        n, total = timeit.Timer(lambda d=detector: d.detect(frame)).autorange()
+        ms = 1e3 * total / n
+        print(f"{name:>20}: {ms:.3f} ms per frame ({1e3 / ms:.0f} fps)")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
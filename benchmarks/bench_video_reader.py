@@ -0,0 +1,68 @@
+"""Benchmark video decoding with and without read-ahead and buffer reuse.
+
+Writes a temporary HD video and reads it while simulating some processing per
+frame. The plain loop decodes and processes one frame after another, while the
+`VideoReader` decodes the next frames on a background thread.
+
+Run with `python benchmarks/bench_video_reader.py [n_frames]`.
+"""
+
+import pathlib
+import sys
+import tempfile
+import time
+
+import cv2
+import numpy as np
+
+from yarppg.helpers import VideoReader
+
+SIZE = (1920, 1080)
+
+
+def write_video(filename: pathlib.Path, n_frames: int):
+    writer = cv2.VideoWriter(str(filename), cv2.VideoWriter.fourcc(*"MJPG"), 30, SIZE)
+    rng = np.random.default_rng(0)
+    base = rng.integers(0, 255, SIZE[::-1] + (3,), dtype=np.uint8)
+    for i in range(n_frames):
+        writer.write(np.roll(base, i, axis=1))
+    writer.release()
+
+
+def work(frame: np.ndarray):
+    cv2.GaussianBlur(frame[::4, ::4], (15, 15), 0)
+
+
+def plain(filename: pathlib.Path):
+    cap = cv2.VideoCapture(str(filename))
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        work(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+    cap.release()
+
+
+def reader(filename: pathlib.Path):
+    for frame in VideoReader(filename):
+        work(frame)
+
+
+def reader_reuse(filename: pathlib.Path):
+    for frame in VideoReader(filename, reuse_buffers=True):
+        work(frame)
+
+
+def main(n_frames: int = 150):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = pathlib.Path(tmpdir) / "video.avi"
+        write_video(filename, n_frames)
+        for func in [plain, reader, reader_reuse]:
+            start = time.perf_counter()
+            func(filename)
+            ms = 1e3 * (time.perf_counter() - start) / n_frames
+            print(f"{func.__name__:>12}: {ms:.3f} ms per frame")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
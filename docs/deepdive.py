@@ -65,7 +65,7 @@ roi_detector = yarppg.FaceMeshDetector()
 
 frame = next(yarppg.frames_from_video(filename))
 roi = roi_detector.detect(frame)
-plt.imshow(roi.mask > 0, cmap="Greys_r", aspect="auto")
+plt.imshow(roi.full_mask() > 0, cmap="Greys_r", aspect="auto")
 
 assert (
     roi.face_rect is not None
@@ -141,7 +141,7 @@ for i, frame in enumerate(yarppg.frames_from_video(filename)):
     results.append(result)
     if i % 30 == 0:
         print(
-            f"{i=} {(roi.mask > 0).mean()=:.1%} {result.value=:.2f}"
+            f"{i=} {(roi.full_mask() > 0).mean()=:.1%} {result.value=:.2f}"
             f" {result.hr=:.2f}"
         )
 
@@ -45,6 +45,8 @@ rppg = yarppg.Rppg(
 # that these include the raw image data from all frames and ROI masks
 # inside the [`RegionOfInterest`
 # container](/reference/containers#yarppg.containers.RegionOfInterst).
+# Pass `lightweight=True` to keep only the signal values and a compact
+# [`RoiSummary`](/reference/containers#yarppg.containers.RoiSummary) instead.
 # %%
 results = rppg.process_video(filename)
 # %% [markdown]
@@ -61,3 +63,12 @@ values = np.array(results)
 hrs = yarppg.bpm_from_frames_per_beat(values[:, -1], fps)
 plt.plot(values[int(2.5 * fps) :, 0])
 plt.twinx().plot(hrs[int(2.5 * fps) :], "C2")
+# %% [markdown]
+# If only the signal values are of interest, `process_video` can also return
+# a data frame with one row per frame and the same eight columns. This mode
+# does not keep the images and masks in memory and is much faster for long
+# recordings.
+# %%
+rppg.reset()
+df = rppg.process_video(filename, as_dataframe=True)
+df.head()
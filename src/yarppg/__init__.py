@@ -14,29 +14,70 @@ __all__ = [
     "get_config",
     "get_video_fps",
     "HrCalculator",
+    "LoadController",
+    "MultiRppg",
+    "MultiRppgResult",
+    "PatchGridProcessor",
     "PeakBasedHrCalculator",
+    "PeakTracker",
     "pixelate_mask",
     "pixelate",
     "Processor",
     "RegionOfInterest",
+    "Resampler",
     "RoiDetector",
+    "RoiSummary",
     "Rppg",
     "RppgResult",
+    "RppgResultTable",
     "SelfieDetector",
     "Settings",
+    "SkinDetector",
+    "SpectralHrCalculator",
+    "TraceCache",
     "UiSettings",
+    "VideoReader",
 ]
 
-from .containers import Color, RegionOfInterest, RppgResult
+from .containers import (
+    Color,
+    MultiRppgResult,
+    RegionOfInterest,
+    RoiSummary,
+    RppgResult,
+    RppgResultTable,
+)
 from .digital_filter import DigitalFilter
 from .helpers import (
     FpsTracker,
+    VideoReader,
     bpm_from_frames_per_beat,
     frames_from_video,
     get_video_fps,
 )
-from .hr_calculator import HrCalculator, PeakBasedHrCalculator
-from .processors import ChromProcessor, FilteredProcessor, Processor
-from .roi import FaceMeshDetector, RoiDetector, SelfieDetector, pixelate, pixelate_mask
+from .hr_calculator import (
+    HrCalculator,
+    PeakBasedHrCalculator,
+    PeakTracker,
+    SpectralHrCalculator,
+)
+from .load_control import LoadController
+from .multi_rppg import MultiRppg
+from .processors import (
+    ChromProcessor,
+    FilteredProcessor,
+    PatchGridProcessor,
+    Processor,
+)
+from .resampling import Resampler
+from .roi import (
+    FaceMeshDetector,
+    RoiDetector,
+    SelfieDetector,
+    SkinDetector,
+    pixelate,
+    pixelate_mask,
+)
 from .rppg import Rppg
 from .settings import Settings, UiSettings, get_config
+from .trace_cache import TraceCache
@@ -0,0 +1,218 @@
+"""Process many video files in parallel worker processes.
+
+[`process_videos`][yarppg.batch.process_videos] distributes a list of video
+files over a pool of worker processes. Each worker builds its own
+[`Rppg`][yarppg.Rppg] orchestrator from the given settings once, so that
+expensive models (e.g., MediaPipe's FaceLandmarker) are only loaded once per
+worker, not once per video. The scalar results of each video are written to a
+separate CSV file in the output directory.
+
+A failure in one video (unreadable file, crash in a worker) is recorded in the
+returned [`BatchResult`][yarppg.batch.BatchResult] and does not stop the
+remaining videos from being processed.
+
+The same functionality is available from the command line:
+
+```bash
+run-yarppg-batch "inputs=[videos/*.mp4]" outdir=results workers=4
+```
+"""
+
+import concurrent.futures
+import dataclasses
+import glob
+import itertools
+import logging
+import os
+import pathlib
+import time
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterable, Iterator
+
+from .rppg import Rppg
+from .settings import Settings
+
+logger = logging.getLogger(__name__)
+
+_worker_rppg: Rppg | None = None
+
+
+@dataclasses.dataclass
+class BatchResult:
+    """Outcome of processing a single video in a batch."""
+
+    filename: str
+    """Input video file."""
+    output: str | None = None
+    """CSV file with the results (None if processing failed)."""
+    n_frames: int = 0
+    """Number of processed frames."""
+    seconds: float = 0.0
+    """Processing time in seconds."""
+    error: str | None = None
+    """Error message if processing failed."""
+    worker: int | None = None
+    """Process ID of the worker that handled the video."""
+
+    @property
+    def ok(self) -> bool:
+        """True if the video was processed without errors."""
+        return self.error is None
+
+
+def expand_inputs(inputs: Iterable[str | pathlib.Path]) -> list[pathlib.Path]:
+    """Expand glob patterns and collect the matching files in sorted order.
+
+    Entries without glob characters are used as given, even if the file does
+    not exist (this will be reported as an error during processing).
+    """
+    files: list[pathlib.Path] = []
+    for entry in map(str, inputs):
+        if glob.has_magic(entry):
+            matches = sorted(glob.glob(entry, recursive=True))
+            files.extend(pathlib.Path(f) for f in matches)
+        else:
+            files.append(pathlib.Path(entry))
+    return list(dict.fromkeys(files))  # remove duplicates, keep order
+
+
+def output_path(filename: str | pathlib.Path, outdir: str | pathlib.Path):
+    """Get the CSV file the results for the given video are written to."""
+    return pathlib.Path(outdir) / (pathlib.Path(filename).stem + ".csv")
+
+
+def _shared_outputs(
+    files: list[pathlib.Path], outdir: pathlib.Path
+) -> dict[pathlib.Path, list[pathlib.Path]]:
+    """Find the files whose output path is shared with other files."""
+    by_output: dict[pathlib.Path, list[pathlib.Path]] = {}
+    for filename in files:
+        by_output.setdefault(output_path(filename, outdir), []).append(filename)
+    return {
+        filename: others
+        for others in by_output.values()
+        if len(others) > 1
+        for filename in others
+    }
+
+
+def _init_worker(settings: Settings) -> None:
+    global _worker_rppg  # noqa: PLW0603
+    _worker_rppg = Rppg.from_settings(settings)
+
+
+def _process_file(filename: pathlib.Path, outdir: pathlib.Path) -> BatchResult:
+    result = BatchResult(str(filename), worker=os.getpid())
+    start = time.perf_counter()
+    try:
+        if _worker_rppg is None:
+            raise RuntimeError("Worker process was not initialized.")
+        if not filename.is_file():
+            raise FileNotFoundError(f"{filename=!r} not found.")
+        _worker_rppg.reset()
+        df = _worker_rppg.process_video(filename, as_dataframe=True)
+        if len(df) == 0:
+            raise ValueError(f"Could not decode any frames from {filename=!r}.")
+        output = output_path(filename, outdir)
+        df.to_csv(output, index_label="frame")
+        result.output = str(output)
+        result.n_frames = len(df)
+    except Exception as exc:
+        result.error = f"{type(exc).__name__}: {exc}"
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def _log_result(result: BatchResult, done: int, total: int) -> None:
+    if result.ok:
+        status = f"{result.n_frames} frames in {result.seconds:.1f}s"
+    else:
+        status = f"failed - {result.error}"
+    logger.log(
+        logging.INFO if result.ok else logging.ERROR,
+        "[%d/%d] worker %s: %s (%s)",
+        done, total, result.worker, result.filename, status,
+    )  # fmt: skip
+
+
+def _run_pool(
+    files: list[pathlib.Path],
+    settings: Settings,
+    outdir: pathlib.Path,
+    workers: int | None,
+) -> Iterator[tuple[pathlib.Path, BatchResult | None]]:
+    """Process files in a new pool, yielding None for files hit by a crash."""
+    with concurrent.futures.ProcessPoolExecutor(
+        workers, initializer=_init_worker, initargs=(settings,)
+    ) as executor:
+        futures = {executor.submit(_process_file, f, outdir): f for f in files}
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                yield futures[future], future.result()
+            except BrokenProcessPool:
+                yield futures[future], None
+
+
+def process_videos(
+    inputs: Iterable[str | pathlib.Path],
+    settings: Settings,
+    outdir: str | pathlib.Path = ".",
+    workers: int | None = None,
+    overwrite: bool = False,
+) -> list[BatchResult]:
+    """Process all given videos in a pool of worker processes.
+
+    If a worker process crashes (e.g., a segmentation fault while decoding a
+    corrupt file), the whole pool becomes unusable. The videos that were not
+    finished at that point are then processed again, each in its own process,
+    so that the crash can only affect the video that caused it.
+
+    Args:
+        inputs: video files or glob patterns (see `expand_inputs`).
+        settings: configuration used to create one `Rppg` per worker.
+        outdir: directory to write the per-video CSV files to. Defaults to ".".
+        workers: number of worker processes. Defaults to the number of CPUs.
+        overwrite: process videos even if their output file exists already.
+            Defaults to False.
+
+    Returns:
+        One `BatchResult` per input file, in the order of the inputs. Files
+        with the same name (in different directories) would overwrite each
+        other's output, they are not processed and reported as failed.
+    """
+    outdir = pathlib.Path(outdir)
+    outdir.mkdir(parents=True, exist_ok=True)
+
+    files = expand_inputs(inputs)
+    shared = _shared_outputs(files, outdir)
+    results: dict[pathlib.Path, BatchResult] = {}
+    pending = []
+    for filename in files:
+        output = output_path(filename, outdir)
+        if filename in shared:
+            others = ", ".join(map(str, shared[filename]))
+            error = f"Output file {output} is shared by {others}."
+            results[filename] = BatchResult(str(filename), error=error)
+            _log_result(results[filename], len(results), len(files))
+        elif output.exists() and not overwrite:
+            logger.info("Skipping %s (%s exists).", filename, output)
+            results[filename] = BatchResult(str(filename), output=str(output))
+        else:
+            pending.append(filename)
+
+    crashed = []
+    for filename, result in _run_pool(pending, settings, outdir, workers):
+        if result is None:
+            crashed.append(filename)
+            continue
+        results[filename] = result
+        _log_result(result, len(results), len(files))
+
+    for filename, result in itertools.chain.from_iterable(
+        _run_pool([f], settings, outdir, workers=1) for f in crashed
+    ):
+        crash = BatchResult(str(filename), error="Worker process crashed.")
+        results[filename] = result or crash
+        _log_result(results[filename], len(results), len(files))
+
+    return [results[f] for f in files]
@@ -1,6 +1,8 @@
 """Defines some containers passed between objects of the yarPPG application."""
 
-from dataclasses import dataclass
+import dataclasses
+from dataclasses import dataclass, field
+from typing import Iterable
 
 import numpy as np
 import pandas as pd
@@ -8,13 +10,76 @@ import pandas as pd
 
 @dataclass
 class RegionOfInterest:
-    """Container for defining the region of interest (and background) in an image."""
+    """Container for defining the region of interest (and background) in an image.
+
+    The ROI mask can be given in a compact form, covering only the bounding box
+    `mask_rect` of the region instead of the full image. Use `full_mask` to get
+    the mask in the size of `baseimg` in either case. The background mask always
+    covers the full image.
+
+    Detectors may additionally split the face into several regions (e.g.,
+    forehead and cheeks), given as a single integer label image. The mean
+    colors of all regions are then computed in one pass (see
+    [`masked_averages`][yarppg.roi.roi_tools.masked_averages]).
+
+    The base image is passed on in the channel order of the input (see
+    [`RoiDetector`][yarppg.RoiDetector]). Instead of converting the whole
+    image, the channels of the averaged colors are swapped if necessary.
+    """
 
     mask: np.ndarray
+    """Binary ROI mask (bounding box-local if `mask_rect` is given)."""
     baseimg: np.ndarray
     bg_mask: np.ndarray | None = None
     face_rect: tuple[int, int, int, int] | None = None
     """Bounding box of the detected face (x, y, w, h)."""
+    polygon: np.ndarray | None = None
+    """Corner points (x, y) of the ROI polygon, if the detector provides them."""
+    mask_rect: tuple[int, int, int, int] | None = None
+    """Region (x, y, w, h) of `baseimg` covered by `mask` (None for full image)."""
+    labels: np.ndarray | None = None
+    """Integer label image of additional regions (0 outside all regions)."""
+    labels_rect: tuple[int, int, int, int] | None = None
+    """Region (x, y, w, h) of `baseimg` covered by `labels` (None for full image)."""
+    region_names: tuple[str, ...] | None = None
+    """Names of the labeled regions, the i-th name belonging to label `i + 1`."""
+    channel_order: str = "rgb"
+    """Channel order of `baseimg` ("rgb" or "bgr"). Mean colors are always RGB."""
+    _full_mask: np.ndarray | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def full_mask(self) -> np.ndarray:
+        """Get the ROI mask in the size of the base image.
+
+        For compact ROIs, the full mask is created on the first call.
+        """
+        if self.mask_rect is None:
+            return self.mask
+        if self._full_mask is None:
+            x, y, w, h = self.mask_rect
+            self._full_mask = np.zeros(self.baseimg.shape[:2], dtype=self.mask.dtype)
+            self._full_mask[y : y + h, x : x + w] = self.mask
+        return self._full_mask
+
+
+@dataclass
+class RoiSummary:
+    """Compact description of a region of interest without any image data.
+
+    Used in place of a [`RegionOfInterest`][yarppg.RegionOfInterest] when results
+    are kept for a long time, to avoid holding on to frames and masks.
+    """
+
+    face_rect: tuple[int, int, int, int] | None = None
+    """Bounding box of the detected face (x, y, w, h)."""
+    polygon: np.ndarray | None = None
+    """Corner points (x, y) of the ROI polygon, if available."""
+
+    @classmethod
+    def from_roi(cls, roi: "RegionOfInterest | RoiSummary") -> "RoiSummary":
+        """Extract the compact metadata from a region of interest."""
+        return cls(face_rect=roi.face_rect, polygon=roi.polygon)
 
 
 @dataclass
@@ -33,6 +98,13 @@ class Color:
     def __array__(self):
         return np.array([self.r, self.g, self.b])
 
+    @classmethod
+    def from_channels(cls, c0: float, c1: float, c2: float, channel_order="rgb"):
+        """Create a color from three channel values in the given channel order."""
+        if channel_order == "bgr":
+            return cls(c2, c1, c0)
+        return cls(c0, c1, c2)
+
     @classmethod
     def from_array(cls, arr: np.ndarray):
         """Convert numpy array to `Color` object."""
@@ -41,6 +113,10 @@ class Color:
         raise ValueError(f"Cannot interpret {arr=!r}")
 
 
+RESULT_COLUMNS = ["value", "roi_r", "roi_g", "roi_b", "bg_r", "bg_g", "bg_b", "hr"]
+"""Names of the values extracted from an `RppgResult` (see `RppgResult.to_series`)."""
+
+
 @dataclass
 class RppgResult:
     """Container for rPPG computation results.
@@ -50,26 +126,143 @@ class RppgResult:
     and the HR. `to_series` produces a clearer representation of the values with named
     indices.
 
-    Note that both `__array__` and `to_series` ignore the `roi` attribute.
+    Note that both `__array__` and `to_series` ignore the `roi` attribute, the
+    timestamp and the values of the labeled regions and patches.
+    Use `lightweight` to drop the image data held by the `roi` attribute.
     """
 
     value: float
     """Output value of the rPPG signal extractor."""
-    roi: RegionOfInterest
-    """Region of interest identified in the current frame."""
+    roi: RegionOfInterest | RoiSummary
+    """Region of interest identified in the current frame (or its summary)."""
     roi_mean: Color
     """Mean color of the ROI."""
     bg_mean: Color
     """Mean color of the background."""
     hr: float = np.nan
     """Heart rate estimate in frames per beat."""
+    region_means: np.ndarray | None = None
+    """(n_regions x 3)-array of mean colors of the labeled regions, if any."""
+    region_values: np.ndarray | None = None
+    """Signal value of each labeled region, if any."""
+    patch_means: np.ndarray | None = None
+    """(G x G x 3)-array of mean colors of the face patches, if computed."""
+    patch_values: np.ndarray | None = None
+    """(G x G)-array of signal values of the face patches, if computed."""
+    timestamp: float | None = None
+    """Capture time (or position in the video) of the frame in seconds."""
 
     def __array__(self):
         return np.r_[self.value, self.roi_mean, self.bg_mean, self.hr]
 
     def to_series(self):
         """Extract the rPPG signal values into a Pandas series."""
-        return pd.Series(
-            np.array(self),
-            index=["value", "roi_r", "roi_g", "roi_b", "bg_r", "bg_g", "bg_b", "hr"],
+        return pd.Series(np.array(self), index=RESULT_COLUMNS)
+
+    def lightweight(self) -> "RppgResult":
+        """Get a copy of the result, replacing the ROI with a `RoiSummary`."""
+        return dataclasses.replace(self, roi=RoiSummary.from_roi(self.roi))
+
+
+def multi_result_columns(branches: Iterable[str]) -> list[str]:
+    """Names of the values extracted from a `MultiRppgResult` with these branches.
+
+    The mean colors of ROI and background are followed by the signal value and
+    HR of each branch (e.g., `value_chrom` and `hr_chrom`).
+    """
+    columns = RESULT_COLUMNS[1:7]
+    for name in branches:
+        columns = [*columns, f"value_{name}", f"hr_{name}"]
+    return columns
+
+
+@dataclass
+class MultiRppgResult:
+    """Container for the results of several rPPG branches on the same frame.
+
+    All branches share the same ROI and mean colors, while each branch
+    contributes one signal value and one HR estimate. Indexing with a branch
+    name gives the corresponding `RppgResult`.
+    """
+
+    values: dict[str, float]
+    """Output value of each branch's signal extractor."""
+    hrs: dict[str, float]
+    """HR estimate (frames per beat) of each branch."""
+    roi: RegionOfInterest | RoiSummary
+    """Region of interest identified in the current frame (or its summary)."""
+    roi_mean: Color
+    """Mean color of the ROI."""
+    bg_mean: Color
+    """Mean color of the background."""
+    timestamp: float | None = None
+    """Capture time of the frame (or its position in the video) in seconds."""
+
+    def __getitem__(self, name: str) -> RppgResult:
+        return RppgResult(
+            self.values[name],
+            self.roi,
+            self.roi_mean,
+            self.bg_mean,
+            self.hrs[name],
+            timestamp=self.timestamp,
         )
+
+    @property
+    def columns(self) -> list[str]:
+        """Names of the values returned by `np.array(result)`."""
+        return multi_result_columns(self.values)
+
+    def __array__(self):
+        per_branch = [(self.values[name], self.hrs[name]) for name in self.values]
+        return np.r_[self.roi_mean, self.bg_mean, np.ravel(per_branch)]
+
+    def to_series(self):
+        """Extract the colors and the values of all branches into a Pandas series."""
+        return pd.Series(np.array(self), index=self.columns)
+
+    def lightweight(self) -> "MultiRppgResult":
+        """Get a copy of the result, replacing the ROI with a `RoiSummary`."""
+        return dataclasses.replace(self, roi=RoiSummary.from_roi(self.roi))
+
+
+class RppgResultTable:
+    """Columnar storage for the scalar values of many `RppgResult`s.
+
+    Values are written into a preallocated (capacity x 8) array, which grows
+    by doubling its size when full. This avoids creating a Pandas object per
+    frame, making it suitable for long recordings. The column order is given
+    by `RESULT_COLUMNS`.
+
+    Args:
+        capacity: number of rows to allocate initially. Defaults to 1024.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self._data = np.full((max(capacity, 1), len(RESULT_COLUMNS)), np.nan)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, result: RppgResult) -> None:
+        """Store the scalar values of the given result in the next row."""
+        if self._size == len(self._data):
+            self._grow()
+        roi, bg = result.roi_mean, result.bg_mean
+        row = (result.value, roi.r, roi.g, roi.b, bg.r, bg.g, bg.b, result.hr)
+        self._data[self._size] = row
+        self._size += 1
+
+    def _grow(self) -> None:
+        data = np.full((2 * len(self._data), self._data.shape[1]), np.nan)
+        data[: self._size] = self._data[: self._size]
+        self._data = data
+
+    def to_array(self) -> np.ndarray:
+        """Get a copy of the stored values as an (N x 8) array."""
+        return self._data[: self._size].copy()
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Get the stored values as a data frame with one row per result."""
+        return pd.DataFrame(self.to_array(), columns=RESULT_COLUMNS)
@@ -33,30 +33,70 @@ class FilterConfig:
 class DigitalFilter:
     """Live digital filter processing one sample at a time.
 
+    The filter is implemented as a cascade of second-order sections (SOS),
+    which is numerically more robust than the transfer function form for
+    higher filter orders. `process` updates the state of each section in plain
+    Python (transposed direct form II), avoiding the considerable overhead of
+    calling into SciPy for every sample. `process_signal` uses
+    `scipy.signal.sosfilt` and produces the same output.
+
     Args:
         b: numerator coefficients obtained from scipy.
         a: denominator coefficients obtained from scipy.
-        xi: first signal value used to initialize the filter state.
+        xi: initialize the filter state as if the signal had been constant at
+            this value. Defaults to 0.
+        sos: second-order sections of the filter. If given, these are used
+            instead of converting `b` and `a`. Defaults to None.
     """
 
-    def __init__(self, b: np.ndarray, a: np.ndarray, xi: float = 0):
+    def __init__(
+        self,
+        b: np.ndarray,
+        a: np.ndarray,
+        xi: float = 0,
+        sos: np.ndarray | None = None,
+    ):
         self.b = b
         self.a = a
+        self.sos = scipy.signal.tf2sos(b, a) if sos is None else np.asarray(sos)
+        self._coeffs = [
+            (b0 / a0, b1 / a0, b2 / a0, a1 / a0, a2 / a0)
+            for b0, b1, b2, a0, a1, a2 in self.sos.tolist()
+        ]
         self.reset(xi)
 
+    @classmethod
+    def from_sos(cls, sos: np.ndarray, xi: float = 0) -> "DigitalFilter":
+        """Create a live filter from second-order sections."""
+        b, a = scipy.signal.sos2tf(sos)
+        return cls(b, a, xi=xi, sos=sos)
+
+    @property
+    def zi(self) -> np.ndarray:
+        """Current filter state, one row per second-order section."""
+        return np.array(self._state)
+
+    @zi.setter
+    def zi(self, value: np.ndarray):
+        self._state = np.asarray(value, dtype=float).reshape(-1, 2).tolist()
+
     def process(self, x: float) -> float:
         """Process incoming data and update filter state."""
-        y, self.zi = scipy.signal.lfilter(self.b, self.a, [x], zi=self.zi)
-        return y[0]
+        for (b0, b1, b2, a1, a2), z in zip(self._coeffs, self._state):
+            y = b0 * x + z[0]
+            z[0] = b1 * x - a1 * y + z[1]
+            z[1] = b2 * x - a2 * y
+            x = y
+        return x
 
     def process_signal(self, x: Sequence[float]) -> np.ndarray:
-        """Process an entire signal at once (SciPy's lfilter with current state)."""
-        y, self.zi = scipy.signal.lfilter(self.b, self.a, x, zi=self.zi)
+        """Process an entire signal at once (SciPy's sosfilt with current state)."""
+        y, self.zi = scipy.signal.sosfilt(self.sos, x, zi=self.zi)
         return y
 
     def reset(self, xi: float = 0):
-        """Reset filter state to initial value."""
-        self.zi = scipy.signal.lfiltic(self.b, self.a, [xi], xi)
+        """Reset filter state to the steady state for a constant input `xi`."""
+        self.zi = scipy.signal.sosfilt_zi(self.sos) * xi
 
 
 def filtercoeffs_from_config(cfg: FilterConfig):
@@ -70,7 +110,16 @@ def filtercoeffs_from_config(cfg: FilterConfig):
     return b, a
 
 
+def sos_from_config(cfg: FilterConfig) -> np.ndarray:
+    """Get second-order sections for filter with given settings."""
+    cutoff = [cfg.f1]
+    if cfg.f2:
+        cutoff.append(cfg.f2)
+    return scipy.signal.iirfilter(
+        cfg.order, cutoff, btype=cfg.btype, ftype=cfg.ftype, fs=cfg.fs, output="sos"
+    )
+
+
 def make_digital_filter(cfg: FilterConfig) -> DigitalFilter:
     """Create live digital filter with given settings."""
-    b, a = filtercoeffs_from_config(cfg)
-    return DigitalFilter(b, a)
+    return DigitalFilter.from_sos(sos_from_config(cfg))
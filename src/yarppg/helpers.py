@@ -1,10 +1,13 @@
 """Utility functions and helpers."""
 
 import collections
+import math
 import pathlib
+import queue
+import threading
 import time
 import urllib.request
-from typing import Iterator
+from typing import Any, Iterator
 
 import cv2
 import numpy as np
@@ -26,14 +29,198 @@ def get_cached_resource_path(filename: str, url: str, reload: bool = False):
     return local_file
 
 
-def frames_from_video(filename: str | pathlib.Path) -> Iterator[np.ndarray]:
-    """Read and yield frames from a video file."""
-    cap = cv2.VideoCapture(str(filename))
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            break
-        yield frame
+def frames_from_video(
+    filename: str | pathlib.Path, start: int = 0, stop: int | None = None
+) -> Iterator[np.ndarray]:
+    """Read and yield frames from a video file (in OpenCV's BGR order).
+
+    Frames are decoded ahead on a background thread (see `VideoReader`, which
+    also offers RGB conversion, buffer reuse and timestamps).
+
+    Args:
+        filename: path to the video file.
+        start: index of the first frame to read. Defaults to 0.
+        stop: index of the frame to stop at (exclusive). Defaults to None,
+            reading until the end of the video.
+    """
+    yield from VideoReader(filename, start, stop, rgb=False)
+
+
+class _ReaderError:
+    """Wraps an exception raised while decoding, to be re-raised by the reader."""
+
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+
+
+class VideoReader:
+    """Video file reader decoding frames on a background thread.
+
+    While the consumer processes a frame, the next `prefetch` frames are
+    already decoded. The capture is released as soon as iteration ends, the
+    iterator is closed, or `close` is called (also when used as a context
+    manager). Each iteration opens the file again.
+
+    With `reuse_buffers=True`, frames are decoded into a fixed pool of
+    preallocated arrays (`cap.read(image=buffer)`), avoiding a new allocation
+    for every frame. A yielded frame is then only valid until the next frame is
+    requested: copy it if it needs to be kept (e.g., in non-lightweight
+    results).
+
+    ```python
+    with VideoReader("video.mp4", stride=2, reuse_buffers=True) as reader:
+        for timestamp, frame in reader.with_timestamps():
+            ...
+    ```
+
+    Args:
+        filename: path to the video file.
+        start: index of the first frame to read. Defaults to 0.
+        stop: index of the frame to stop at (exclusive). Defaults to None,
+            reading until the end of the video.
+        stride: read every n-th frame. Skipped frames are not decoded.
+            Defaults to 1.
+        rgb: convert frames from OpenCV's BGR to RGB order (in place).
+            Defaults to True.
+        prefetch: maximum number of frames decoded ahead. Defaults to 4.
+        reuse_buffers: decode into a fixed pool of reused arrays. Defaults to
+            False.
+    """
+
+    def __init__(
+        self,
+        filename: str | pathlib.Path,
+        start: int = 0,
+        stop: int | None = None,
+        stride: int = 1,
+        rgb: bool = True,
+        prefetch: int = 4,
+        reuse_buffers: bool = False,
+    ):
+        self.filename = filename
+        self.start = start
+        self.stop = stop
+        self.stride = stride
+        self.rgb = rgb
+        self.prefetch = prefetch
+        self.reuse_buffers = reuse_buffers
+
+        self._cap: cv2.VideoCapture | None = None
+        self._thread: threading.Thread | None = None
+        self._closing = threading.Event()
+        self._ready: queue.Queue = queue.Queue()
+        self._free: queue.Queue = queue.Queue()
+        self._allocated = 0
+
+    def __enter__(self) -> "VideoReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for _, frame in self.with_timestamps():
+            yield frame
+
+    def with_timestamps(self) -> Iterator[tuple[float, np.ndarray]]:
+        """Yield the frames together with their timestamps in seconds.
+
+        Timestamps are taken from the container (`CAP_PROP_POS_MSEC`), so they
+        also reflect variable frame rates and dropped frames.
+        """
+        self._open()
+        previous = None
+        try:
+            while True:
+                item = self._ready.get()
+                if item is None:
+                    break
+                if isinstance(item, _ReaderError):
+                    raise item.exc
+                if previous is not None:
+                    self._free.put(previous)  # consumer is done with it
+                timestamp, frame = item
+                yield timestamp, frame
+                previous = frame if self.reuse_buffers else None
+        finally:
+            self.close()
+
+    def _open(self) -> None:
+        self.close()
+        filename = self.filename
+        if not pathlib.Path(filename).exists():
+            raise FileNotFoundError(f"{filename=!r} not found.")
+        self._cap = cv2.VideoCapture(str(self.filename))
+        if self.start > 0:
+            self._cap.set(cv2.CAP_PROP_POS_FRAMES, self.start)
+        self._closing.clear()
+        self._ready = queue.Queue(maxsize=self.prefetch)
+        self._free = queue.Queue()
+        self._allocated = 0
+        self._thread = threading.Thread(target=self._decode, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop decoding and release the video capture."""
+        self._closing.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._cap is not None:
+            self._cap.release()
+            self._cap = None
+
+    def _put(self, item) -> bool:
+        while not self._closing.is_set():
+            try:
+                self._ready.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _acquire(self) -> np.ndarray | None:
+        """Get a free buffer (None lets OpenCV allocate a new array)."""
+        if not self.reuse_buffers:
+            return None
+        # prefetched frames + the one being decoded + the one held by the consumer
+        if self._allocated < self.prefetch + 2:
+            try:
+                return self._free.get_nowait()
+            except queue.Empty:
+                self._allocated += 1
+                return None
+        while not self._closing.is_set():
+            try:
+                return self._free.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        return None
+
+    def _decode(self) -> None:
+        cap = self._cap
+        assert cap is not None
+        index = self.start
+        try:
+            while self.stop is None or index < self.stop:
+                buffer = self._acquire()
+                if self._closing.is_set():
+                    return
+                ret, frame = cap.read(buffer) if buffer is not None else cap.read()
+                if not ret:
+                    break
+                timestamp = cap.get(cv2.CAP_PROP_POS_MSEC) / 1000
+                if self.rgb:
+                    cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame)
+                if not self._put((timestamp, frame)):
+                    return
+                index += self.stride
+                for _ in range(self.stride - 1):
+                    cap.grab()
+        except Exception as exc:
+            self._put(_ReaderError(exc))
+            return
+        self._put(None)
 
 
 def get_video_fps(filename: str | pathlib.Path) -> float:
@@ -46,6 +233,16 @@ def get_video_fps(filename: str | pathlib.Path) -> float:
     return fps
 
 
+def get_video_frame_count(filename: str | pathlib.Path) -> int:
+    """Find the number of frames in the given video file (as reported by OpenCV)."""
+    if not pathlib.Path(filename).exists():
+        raise FileNotFoundError(f"{filename=!r} not found.")
+    cap = cv2.VideoCapture(str(filename))
+    count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    cap.release()
+    return count
+
+
 def bpm_from_frames_per_beat(hr: ArrayLike, fps: float) -> np.ndarray:
     """Convert frames per beat to beats per minute (60 * fps / hr)."""
     return 60 * fps / np.asarray(hr)
@@ -79,3 +276,107 @@ class FpsTracker:
         if len(self.dts) > 0:
             return 1 / (sum(self.dts) / len(self.dts))
         return 1
+
+
+class RollingMean:
+    """Mean over a sliding window of values with constant cost per update.
+
+    Values are stored in a fixed-size ring buffer and a running sum is updated
+    with each new value. To avoid accumulating rounding errors, the sum is
+    recomputed from the buffer once per full cycle through the buffer, keeping
+    the amortized cost per update constant. Like `np.mean`, the result is NaN
+    if any value in the window is NaN.
+
+    The window operates on plain Python floats, which is considerably faster
+    than NumPy for the few values per update in a live application.
+
+    Args:
+        winsize: number of values in the window.
+        size: number of elements per value (e.g., 3 for RGB colors). Defaults to
+            None, meaning that values are scalars.
+    """
+
+    def __init__(self, winsize: int, size: int | None = None):
+        self.winsize = winsize
+        self.size = size
+        self.reset()
+
+    def update(self, value) -> Any:
+        """Add a value to the window and return the updated mean.
+
+        Args:
+            value: a float, or a sequence of `size` floats.
+
+        Returns:
+            The mean as a float, or as a tuple of floats if `size` is given.
+        """
+        values = [value] if self.size is None else value
+        if self.count == self.winsize:
+            for i, old in enumerate(self._values[self._pos]):
+                if math.isnan(old):
+                    self._nan_count[i] -= 1
+                else:
+                    self._sum[i] -= old
+        else:
+            self.count += 1
+        self._values[self._pos] = tuple(values)
+        for i, new in enumerate(values):
+            if math.isnan(new):
+                self._nan_count[i] += 1
+            else:
+                self._sum[i] += new
+
+        self._pos += 1
+        if self._pos == self.winsize:
+            self._pos = 0
+            self._sum = [
+                sum(v for v in column if not math.isnan(v))
+                for column in zip(*self._values)
+            ]
+        return self.mean
+
+    @property
+    def mean(self) -> Any:
+        """Mean of the values currently in the window."""
+        means = tuple(
+            math.nan if self.count == 0 or nans > 0 else total / self.count
+            for total, nans in zip(self._sum, self._nan_count)
+        )
+        return means[0] if self.size is None else means
+
+    def reset(self) -> None:
+        """Clear all values from the window."""
+        n = self.size or 1
+        self._values: list[tuple[float, ...]] = [(0.0,) * n] * self.winsize
+        self._sum = [0.0] * n
+        self._nan_count = [0] * n
+        self._pos = 0
+        self.count = 0
+
+
+def rolling_mean(values: ArrayLike, winsize: int) -> np.ndarray:
+    """Vectorized equivalent of feeding all values into a new `RollingMean`.
+
+    The window is computed from cumulative sums along the first axis. For the
+    first `winsize - 1` samples, the mean is taken over the values seen so far.
+    A sample is NaN if any value in its window is NaN.
+
+    Args:
+        values: array of shape (N, ...), e.g., (N, 3) for a trace of RGB colors.
+        winsize: number of values in the window.
+
+    Returns:
+        Array of the same shape as `values`, containing the moving average.
+    """
+    values = np.asarray(values, dtype=float)
+    nans = np.isnan(values)
+    zeros = np.zeros((1,) + values.shape[1:])
+    sums = np.concatenate((zeros, np.cumsum(np.where(nans, 0.0, values), axis=0)))
+    nan_counts = np.concatenate((zeros, np.cumsum(nans, axis=0)))
+
+    stop = np.arange(1, len(values) + 1)
+    start = np.maximum(stop - winsize, 0)
+    counts = (stop - start).reshape((-1,) + (1,) * (values.ndim - 1))
+    means = (sums[stop] - sums[start]) / counts
+    means[nan_counts[stop] > nan_counts[start]] = np.nan
+    return means
@@ -1,6 +1,9 @@
 """Heart rate calculation utilities."""
 
+import copy
+import math
 from collections import deque
+from typing import Callable, Sequence
 
 import numpy as np
 import scipy.signal
@@ -13,13 +16,234 @@ class HrCalculator:
         """Process the new data and update HR estimate."""
         return np.nan
 
+    def process_trace(self, values: Sequence[float]) -> np.ndarray:
+        """Calculate the HR estimates for an entire signal at once.
+
+        The output is identical to calling `update` with each value, starting
+        from a freshly reset calculator. The internal state of this calculator
+        is neither used nor modified. The base implementation simply loops
+        over the values with a reset copy of the calculator; subclasses
+        provide vectorized versions where possible.
+
+        Args:
+            values: the complete signal.
+
+        Returns:
+            Array with the HR estimate after each value.
+        """
+        calculator = copy.deepcopy(self)
+        calculator.reset()
+        return np.array([calculator.update(v) for v in values], dtype=float)
+
     def reset(self) -> None:
         """Clear the the internal state."""
         pass
 
 
+def _update_ends(n: int, winsize: int, update_interval: int) -> np.ndarray:
+    """Indices of the samples after which a windowed HR update happens."""
+    ends = np.arange(winsize - 1, n)
+    return ends[(ends + 1) % update_interval == 0]
+
+
+def _hold(n: int, ends: np.ndarray, estimates: np.ndarray) -> np.ndarray:
+    """Repeat each estimate until the next update (NaN before the first)."""
+    latest = np.searchsorted(ends, np.arange(n), side="right") - 1
+    return np.where(latest >= 0, estimates[np.maximum(latest, 0)], np.nan)
+
+
+def _local_maxima(x: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Find all local maxima (midpoints, left and right edges of flat peaks).
+
+    Vectorized equivalent of the local maxima search in `find_peaks`.
+    """
+    starts = np.flatnonzero(np.r_[True, x[1:] != x[:-1]])
+    stops = np.r_[starts[1:], len(x)] - 1
+    run_values = x[starts]
+    is_peak = (run_values[1:-1] > run_values[:-2]) & (run_values[1:-1] > run_values[2:])
+    left, right = starts[1:-1][is_peak], stops[1:-1][is_peak]
+    return (left + right) // 2, left, right
+
+
+def _select_by_distance(
+    peaks: np.ndarray, heights: np.ndarray, distance: int
+) -> np.ndarray:
+    """Mark the peaks kept after removing lower peaks closer than `distance`.
+
+    Same greedy selection (highest peaks first) as in `find_peaks`.
+    """
+    keep = np.ones(len(peaks), dtype=bool)
+    if len(peaks) < 2 or np.diff(peaks).min() >= distance:
+        return keep
+    for i in np.argsort(heights)[::-1]:
+        if not keep[i]:
+            continue
+        j = i - 1
+        while j >= 0 and peaks[i] - peaks[j] < distance:
+            keep[j] = False
+            j -= 1
+        j = i + 1
+        while j < len(peaks) and peaks[j] - peaks[i] < distance:
+            keep[j] = False
+            j += 1
+    return keep
+
+
+def _windowed_peak_intervals(
+    values: np.ndarray, ends: np.ndarray, winsize: int, distance: int
+) -> np.ndarray:
+    """Mean distance between peaks in the windows ending at the given indices.
+
+    Equivalent to `np.diff(find_peaks(window, distance=distance)[0]).mean()`
+    for each window. Local maxima are searched only once in the entire
+    signal. The selection by distance only interacts within clusters of
+    maxima that are closer than `distance` to their neighbor, so it is also
+    done only once per cluster. Windows that cut through such a cluster, or
+    contain a cluster with equally high maxima (where the order of selection
+    is ambiguous), fall back to `find_peaks` on the window.
+    """
+    estimates = np.full(len(ends), np.nan)
+    peaks, lefts, rights = _local_maxima(values)
+    if len(peaks) == 0:
+        return estimates
+    # candidates fully inside a window have both neighbors of their plateau in it
+    firsts = np.searchsorted(lefts, ends - winsize + 1, side="right")
+    lasts = np.searchsorted(rights, ends, side="left")
+
+    heights = values[peaks]
+    separate = np.diff(peaks) >= distance
+    cluster = np.r_[0, np.cumsum(separate)]
+    starts = np.flatnonzero(np.r_[True, separate])
+    stops = np.r_[starts[1:], len(peaks)]
+
+    keep = np.ones(len(peaks), dtype=bool)
+    ambiguous = np.zeros(len(peaks), dtype=bool)
+    for start, stop in zip(starts[stops - starts > 1], stops[stops - starts > 1]):
+        keep[start:stop] = _select_by_distance(
+            peaks[start:stop], heights[start:stop], distance
+        )
+        if len(np.unique(heights[start:stop])) < stop - start:
+            ambiguous[start:stop] = True
+    kept = peaks[keep]
+    n_kept = np.r_[0, np.cumsum(keep)]
+    n_ambiguous = np.r_[0, np.cumsum(ambiguous)]
+
+    nonempty = lasts > firsts
+    lo, hi = firsts[nonempty], lasts[nonempty]
+    fallback = np.zeros(len(ends), dtype=bool)
+    fallback[nonempty] = (
+        (starts[cluster[lo]] != lo)
+        | (stops[cluster[hi - 1]] != hi)
+        | (n_ambiguous[hi] > n_ambiguous[lo])
+    )
+
+    whole = nonempty & ~fallback
+    lo, hi = firsts[whole], lasts[whole]
+    counts = n_kept[hi] - n_kept[lo]
+    last_kept = kept[np.maximum(n_kept[hi] - 1, 0)]
+    first_kept = kept[np.minimum(n_kept[lo], len(kept) - 1)]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        estimates[whole] = np.where(
+            counts > 1, (last_kept - first_kept) / (counts - 1), np.nan
+        )
+
+    for i in np.flatnonzero(fallback).tolist():
+        window = values[ends[i] - winsize + 1 : ends[i] + 1]
+        selected, _ = scipy.signal.find_peaks(window, distance=distance)
+        if len(selected) > 1:
+            estimates[i] = (selected[-1] - selected[0]) / (len(selected) - 1)
+    return estimates
+
+
+class PeakTracker:
+    """Online peak detection with a minimum distance between peaks.
+
+    Local maxima are detected as soon as the signal decreases again (the
+    middle sample is used for flat peaks, as in `scipy.signal.find_peaks`).
+    A detected peak is pending until no higher peak can occur within
+    `distance` samples and is then confirmed. Only confirmed peaks within the
+    last `winsize` samples are kept. Since these are sorted, the mean
+    interval between them is available in constant time.
+
+    Compared to `find_peaks(values, distance=distance)`, pending peaks are
+    only ever replaced by the next higher peak, so results may differ if
+    several peaks lie closer than `distance` to each other.
+
+    Args:
+        distance: minimum number of samples between neighboring peaks.
+        winsize: number of most recent samples in which peaks are kept.
+    """
+
+    def __init__(self, distance: int, winsize: int):
+        self.distance = distance
+        self.winsize = winsize
+        self.peaks: deque[int] = deque()
+        """Indices of the confirmed peaks inside the window."""
+        self.reset()
+
+    def update(self, value: float) -> None:
+        """Add the next sample and update the confirmed peaks."""
+        t = self.count
+        self.count += 1
+        if value > self._prev:
+            self._rising = True
+            self._flat_start = t
+        elif value < self._prev:
+            if self._rising:
+                self._add_candidate((self._flat_start + t - 1) // 2, self._prev)
+            self._rising = False
+            self._flat_start = t
+        elif math.isnan(value) or math.isnan(self._prev):
+            self._rising = False
+            self._flat_start = t
+        self._prev = value
+
+        if self._pending is not None and t - self._pending[0] >= self.distance:
+            self.peaks.append(self._pending[0])
+            self._pending = None
+        while self.peaks and self.peaks[0] <= t - self.winsize:
+            self.peaks.popleft()
+
+    def _add_candidate(self, index: int, height: float) -> None:
+        if self.peaks and index - self.peaks[-1] < self.distance:
+            return
+        if self._pending is None or height > self._pending[1]:
+            self._pending = (index, height)
+
+    def mean_interval(self) -> float:
+        """Mean number of samples between consecutive confirmed peaks."""
+        if len(self.peaks) < 2:
+            return np.nan
+        return (self.peaks[-1] - self.peaks[0]) / (len(self.peaks) - 1)
+
+    def reset(self) -> None:
+        """Clear all peaks and intermediate values."""
+        self.peaks.clear()
+        self.count = 0
+        self._prev = math.nan
+        self._rising = False
+        self._flat_start = 0
+        self._pending: tuple[int, float] | None = None
+
+
 class PeakBasedHrCalculator(HrCalculator):
-    """Peak-based heart rate calculation."""
+    """Peak-based heart rate calculation.
+
+    By default, `scipy.signal.find_peaks` is applied to the entire window
+    every `update_interval` frames. With `incremental=True`, peaks are
+    tracked as the samples arrive (see [`PeakTracker`][yarppg.PeakTracker]),
+    so that each update takes constant time. HR can then be refreshed with
+    every frame (`update_interval=1`) without periodic latency spikes.
+
+    Args:
+        fs: sampling rate of the signal.
+        window_seconds: length of the window in which peaks are detected.
+            Defaults to 10.
+        distance: minimum time in seconds between two peaks. Defaults to 0.5.
+        update_interval: number of frames between HR updates. Defaults to 10.
+        incremental: track peaks online instead of searching the entire
+            window with each update. Defaults to False.
+    """
 
     def __init__(
         self,
@@ -27,10 +251,12 @@ class PeakBasedHrCalculator(HrCalculator):
         window_seconds: float = 10,
         distance: float = 0.5,
         update_interval: int = 10,
+        incremental: bool = False,
     ):
         self.winsize = int(fs * window_seconds)
         self.values = deque(maxlen=self.winsize)
         self.mindist = int(fs * distance)
+        self.tracker = PeakTracker(self.mindist, self.winsize) if incremental else None
 
         self.update_interval = update_interval
         self.frames_seen = 0
@@ -40,17 +266,224 @@ class PeakBasedHrCalculator(HrCalculator):
         """Process the new data and update HR estimate in frames per beat."""
         self.frames_seen += 1
         self.values.append(value)
+        if self.tracker is not None:
+            self.tracker.update(value)
         if (
             len(self.values) < self.winsize
             or self.frames_seen % self.update_interval != 0
         ):
             return self.last_hr
-        peaks, _ = scipy.signal.find_peaks(self.values, distance=self.mindist)
-        self.last_hr = np.diff(peaks).mean()
+        if self.tracker is not None:
+            self.last_hr = self.tracker.mean_interval()
+        else:
+            peaks, _ = scipy.signal.find_peaks(self.values, distance=self.mindist)
+            self.last_hr = np.diff(peaks).mean()
         return self.last_hr
 
+    def process_trace(self, values: Sequence[float]) -> np.ndarray:
+        """Calculate the HR estimates for an entire signal at once.
+
+        Peaks are searched in the entire signal at once, and the windows are
+        evaluated with vectorized operations where possible (see
+        `_windowed_peak_intervals`). The incremental peak tracker is applied sample by
+        sample, since it already takes constant time per sample.
+        """
+        if self.tracker is not None:
+            return super().process_trace(values)
+        values = np.asarray(values, dtype=float)
+        ends = _update_ends(len(values), self.winsize, self.update_interval)
+        if len(ends) == 0:
+            return np.full(len(values), np.nan)
+        estimates = _windowed_peak_intervals(values, ends, self.winsize, self.mindist)
+        return _hold(len(values), ends, estimates)
+
     def reset(self) -> None:
         """Clear the internal buffer and intermediate values."""
         self.frames_seen = 0
         self.values.clear()
         self.last_hr = np.nan
+        if self.tracker is not None:
+            self.tracker.reset()
+
+
+class SpectralHrCalculator(HrCalculator):
+    """Heart rate from the dominant frequency of a sliding DFT.
+
+    Only the DFT bins inside the physiological band [`fmin`, `fmax`] are
+    computed. The frequency resolution is increased by a factor of `padding`
+    compared to the window length, as in a zero-padded FFT. With each new
+    sample, every bin is updated in constant time with the sliding DFT
+    recurrence, so the cost per sample is proportional to the number of bins
+    instead of the window length. The mean of the window is removed in the
+    frequency domain. To avoid accumulating rounding errors, the bins are
+    recomputed from the window once per full cycle through the window.
+
+    The frequency of the strongest bin can be refined by fitting a parabola
+    through the power of its neighbors. The power spectrum of the latest
+    update is available via `spectrum` (with `frequencies`), and `quality`
+    provides the fraction of the in-band power near the detected peak.
+
+    Args:
+        fs: sampling rate of the signal.
+        window_seconds: length of the analyzed window. Defaults to 10.
+        fmin: lowest frequency (Hz) of the band. Defaults to 0.7.
+        fmax: highest frequency (Hz) of the band. Defaults to 3.0.
+        padding: zero-padding factor, i.e., the number of bins per bin of a
+            DFT of the window length. Defaults to 4.
+        update_interval: number of frames between HR updates. Defaults to 1.
+        interpolate: refine the peak frequency with parabolic interpolation.
+            Defaults to True.
+    """
+
+    def __init__(
+        self,
+        fs: float,
+        window_seconds: float = 10,
+        fmin: float = 0.7,
+        fmax: float = 3.0,
+        padding: int = 4,
+        update_interval: int = 1,
+        interpolate: bool = True,
+    ):
+        self.fs = fs
+        self.winsize = int(fs * window_seconds)
+        self.update_interval = update_interval
+        self.interpolate = interpolate
+
+        self.resolution = fs / (self.winsize * padding)
+        """Distance between the frequencies of neighboring bins (Hz)."""
+        bins = np.arange(
+            math.ceil(fmin / self.resolution), math.floor(fmax / self.resolution) + 1
+        )
+        self.frequencies = bins * self.resolution
+        """Frequencies (Hz) of the computed DFT bins."""
+        omega = 2 * np.pi * self.frequencies / fs
+        self._basis = np.exp(-1j * np.outer(np.arange(self.winsize), omega))
+        self._rotate = np.exp(1j * omega)
+        self._dc = self._basis.sum(axis=0)
+
+        self.values = deque(maxlen=self.winsize)
+        self.reset()
+
+    def update(self, value: float) -> float:
+        """Process the new data and update HR estimate in frames per beat."""
+        self.frames_seen += 1
+        oldest = 0.0
+        if len(self.values) == self.winsize:
+            oldest = self.values[0]
+        self.values.append(value)
+        self._nan_count += math.isnan(value) - math.isnan(oldest)
+
+        # NaN values spoil the recurrence until they leave the window.
+        last_nan_left = math.isnan(oldest) and self._nan_count == 0
+        self._cycle_pos += 1
+        if self._cycle_pos >= self.winsize or last_nan_left:
+            self._recompute()
+        else:
+            self._bins = self._rotate * (self._bins - oldest) + value * self._basis[-1]
+            self._sum += value - oldest
+
+        if (
+            len(self.values) < self.winsize
+            or self.frames_seen % self.update_interval != 0
+        ):
+            return self.last_hr
+        self.last_hr = self.fs / self._peak_frequencies(self.spectrum[None])[0]
+        return self.last_hr
+
+    def _recompute(self) -> None:
+        """Compute the bins and the sum directly from the window."""
+        window = np.zeros(self.winsize)
+        window[self.winsize - len(self.values) :] = self.values
+        self._bins = window @ self._basis
+        self._sum = float(window.sum())
+        self._cycle_pos = 0
+
+    @property
+    def spectrum(self) -> np.ndarray:
+        """Power of the mean-free signal at each of the `frequencies`."""
+        bins = self._bins - self._sum / self.winsize * self._dc
+        return np.abs(bins) ** 2
+
+    def process_trace(self, values: Sequence[float]) -> np.ndarray:
+        """Calculate the HR estimates for an entire signal at once.
+
+        The DFT bins of each window are obtained as the difference of two
+        cumulative sums of the signal multiplied with complex exponentials.
+        These are computed in chunks of samples, so the cost is proportional
+        to the number of bins per sample, regardless of the window length and
+        update interval.
+        """
+        values = np.asarray(values, dtype=float)
+        ends = _update_ends(len(values), self.winsize, self.update_interval)
+        if len(ends) == 0:
+            return np.full(len(values), np.nan)
+        starts = ends - self.winsize + 1
+        finite = np.isfinite(values)
+        signal = np.where(finite, values, 0.0)
+        nan_counts = np.r_[0, np.cumsum(~finite)]
+        sums = np.r_[0, np.cumsum(signal)]
+
+        omega = 2 * np.pi * self.frequencies / self.fs
+        # prefix[i] = sum(signal[:i] * exp(-j * omega * arange(i)))
+        positions = np.union1d(starts, ends + 1)
+        prefix = np.zeros((len(positions), len(omega)), dtype=complex)
+        chunk = 1024
+        block = np.exp(-1j * np.outer(np.arange(chunk), omega))
+        total = np.zeros(len(omega), dtype=complex)
+        for c0 in range(0, len(signal), chunk):
+            c1 = min(c0 + chunk, len(signal))
+            terms = signal[c0:c1, None] * block[: c1 - c0] * np.exp(-1j * omega * c0)
+            cumulative = total + np.cumsum(terms, axis=0)
+            needed = (positions > c0) & (positions <= c1)
+            prefix[needed] = cumulative[positions[needed] - c0 - 1]
+            total = cumulative[-1]
+
+        index = np.searchsorted(positions, np.c_[starts, ends + 1])
+        bins = (prefix[index[:, 1]] - prefix[index[:, 0]]) * np.exp(
+            1j * np.outer(starts, omega)
+        )
+        means = (sums[ends + 1] - sums[starts]) / self.winsize
+        power = np.abs(bins - means[:, None] * self._dc) ** 2
+        power[nan_counts[ends + 1] > nan_counts[starts]] = np.nan
+        estimates = self.fs / self._peak_frequencies(power)
+        return _hold(len(values), ends, estimates)
+
+    def _peak_frequencies(self, power: np.ndarray) -> np.ndarray:
+        """Find the (interpolated) peak frequency for each row of power values."""
+        rows = np.arange(len(power))
+        k = np.argmax(power, axis=1)
+        offset = np.zeros(len(power))
+        if self.interpolate and power.shape[1] > 2:
+            inner = np.clip(k, 1, power.shape[1] - 2)
+            a, b, c = (power[rows, inner + d] for d in (-1, 0, 1))
+            denominator = a - 2 * b + c
+            valid = (inner == k) & (denominator < 0)
+            offset[valid] = 0.5 * (a - c)[valid] / denominator[valid]
+        frequencies = self.frequencies[k] + offset * self.resolution
+        frequencies[~np.isfinite(power).all(axis=1)] = np.nan
+        return frequencies
+
+    def quality(self, width: float = 0.1) -> float:
+        """Fraction of the in-band power within `width` Hz of the peak."""
+        power = self.spectrum
+        if not np.isfinite(power).all() or power.sum() == 0:
+            return np.nan
+        peak = self.frequencies[np.argmax(power)]
+        near = np.abs(self.frequencies - peak) <= width
+        return float(power[near].sum() / power.sum())
+
+    def reset(self) -> None:
+        """Clear the internal buffer and intermediate values."""
+        self.frames_seen = 0
+        self.values.clear()
+        self.last_hr = np.nan
+        self._nan_count = 0
+        self._recompute()
+
+
+calculators: dict[str, Callable[..., HrCalculator]] = {
+    "peak": PeakBasedHrCalculator,
+    "spectral": SpectralHrCalculator,
+}
+"""Heart rate calculators selectable by name (e.g., in the `Settings`)."""
@@ -0,0 +1,285 @@
+"""Adapt the processing quality to hold a target frame rate.
+
+On slow hardware, [`Rppg.process_frame`][yarppg.Rppg.process_frame] may take
+longer than the interval between two camera frames, so that frames queue up
+and the latency grows. A [`LoadController`][yarppg.LoadController] measures
+the time spent in each stage of the pipeline (ROI detection and signal
+extraction) and compares it to the frame budget `1 / target_fps`. If the
+budget is exceeded, it switches to the next cheaper
+[`LoadLevel`][yarppg.load_control.LoadLevel], which reduces the detector's
+input resolution, runs the detection model less often, or skips frames
+entirely. When enough headroom returns, the controller steps back to better
+quality.
+
+```python
+controller = yarppg.LoadController(target_fps=30)
+rppg = yarppg.Rppg(resample=True, load_controller=controller)
+...
+print(controller.telemetry())
+```
+
+Skipping frames requires resampling (see [`Resampler`][yarppg.Resampler]),
+so that filters and HR estimates still see a signal at the nominal rate.
+"""
+
+import dataclasses
+import logging
+from collections import deque
+from typing import Sequence
+
+from .roi import RoiDetector
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True)
+class LoadLevel:
+    """Quality settings of one step of the `LoadController`."""
+
+    scale: float = 1.0
+    """Factor applied to the detector's configured input `scale`."""
+    detect_interval: int = 1
+    """Minimum interval between runs of the detection model (if supported)."""
+    stride: int = 1
+    """Process only every n-th frame."""
+
+
+DEFAULT_LEVELS = (
+    LoadLevel(),
+    LoadLevel(scale=0.75),
+    LoadLevel(scale=0.5),
+    LoadLevel(scale=0.5, detect_interval=2),
+    LoadLevel(scale=0.5, detect_interval=3),
+    LoadLevel(scale=0.5, detect_interval=3, stride=2),
+    LoadLevel(scale=0.35, detect_interval=4, stride=3),
+)
+"""Default quality levels, from full quality to the cheapest setting."""
+
+
+@dataclasses.dataclass
+class LoadControlConfig:
+    """Configuration of a `LoadController` (e.g., in the `Settings`).
+
+    Attributes:
+        target_fps: frame rate that should be sustained.
+        degrade_load: fraction of the frame budget above which quality is
+            reduced.
+        recover_load: fraction of the frame budget below which quality is
+            increased again.
+        cooldown: number of processed frames between two level changes.
+        max_level: index of the cheapest default level that may be used.
+            Defaults to None (all levels).
+    """
+
+    target_fps: float = 30
+    degrade_load: float = 0.9
+    recover_load: float = 0.5
+    cooldown: int = 15
+    max_level: int | None = None
+
+
+@dataclasses.dataclass
+class LoadDecision:
+    """Change of the quality level made by the `LoadController`."""
+
+    frame: int
+    """Number of frames seen by the controller at the time of the change."""
+    old_level: int
+    new_level: int
+    load: float
+    """Measured load (fraction of the frame budget) that led to the change."""
+
+
+@dataclasses.dataclass
+class LoadTelemetry:
+    """Snapshot of the measurements and the state of the `LoadController`."""
+
+    level: int
+    """Index of the active quality level."""
+    settings: LoadLevel
+    """Settings of the active quality level."""
+    latency: dict[str, float]
+    """Smoothed time (seconds) per processed frame spent in each stage."""
+    load: float
+    """Smoothed fraction of the frame budget used per incoming frame."""
+    frames_processed: int
+    frames_skipped: int
+    decisions: list[LoadDecision]
+    """Most recent level changes, oldest first."""
+
+
+class LoadController:
+    """Choose the quality level that keeps the processing within a frame budget.
+
+    The latency of each stage is smoothed with an exponential moving average.
+    The load is the smoothed total latency per processed frame, divided by the
+    `stride` of the active level and by the frame budget `1 / target_fps`.
+    If the load exceeds `degrade_load`, the next cheaper level is selected.
+    If it falls below `recover_load`, the controller returns to the previous
+    level, unless that level was recently measured to be too slow. Levels are
+    only changed after `cooldown` processed frames at the current level.
+
+    The controller adjusts the attached detector's `scale` and, if available,
+    its `detect_interval` relative to the values configured when attaching.
+
+    Args:
+        target_fps: frame rate that should be sustained. Defaults to 30.
+        levels: quality levels, from best to cheapest. Defaults to
+            `DEFAULT_LEVELS`.
+        degrade_load: load above which quality is reduced. Defaults to 0.9.
+        recover_load: load below which quality is increased. Defaults to 0.5.
+        cooldown: number of processed frames between two level changes.
+            Defaults to 15.
+        smoothing: weight of the newest latency in the moving average.
+            Defaults to 0.1.
+    """
+
+    def __init__(
+        self,
+        target_fps: float = 30,
+        levels: Sequence[LoadLevel] = DEFAULT_LEVELS,
+        degrade_load: float = 0.9,
+        recover_load: float = 0.5,
+        cooldown: int = 15,
+        smoothing: float = 0.1,
+    ):
+        if not levels:
+            raise ValueError("At least one quality level is required.")
+        self.target_fps = target_fps
+        self.levels = tuple(levels)
+        self.degrade_load = degrade_load
+        self.recover_load = recover_load
+        self.cooldown = cooldown
+        self.smoothing = smoothing
+        self.decisions: deque[LoadDecision] = deque(maxlen=100)
+        """Most recent level changes."""
+
+        self._detector: RoiDetector | None = None
+        self._base_scale = 1.0
+        self._base_interval: int | None = None
+        self.level = 0
+        self.reset()
+
+    @classmethod
+    def from_config(cls, cfg: LoadControlConfig) -> "LoadController":
+        """Create a controller with the given configuration."""
+        levels = DEFAULT_LEVELS[: None if cfg.max_level is None else cfg.max_level + 1]
+        return cls(
+            cfg.target_fps,
+            levels,
+            degrade_load=cfg.degrade_load,
+            recover_load=cfg.recover_load,
+            cooldown=cfg.cooldown,
+        )
+
+    @property
+    def budget(self) -> float:
+        """Time per frame (seconds) available at the target frame rate."""
+        return 1 / self.target_fps
+
+    @property
+    def skips_frames(self) -> bool:
+        """True if any of the levels skips frames."""
+        return any(level.stride > 1 for level in self.levels)
+
+    def attach(self, detector: RoiDetector) -> None:
+        """Control the given detector, starting from its current configuration."""
+        self._detector = detector
+        self._base_scale = detector.scale
+        self._base_interval = getattr(detector, "detect_interval", None)
+        self._apply()
+
+    def should_process(self) -> bool:
+        """Count an incoming frame and decide whether it should be processed."""
+        process = self._frames_since_change % self.levels[self.level].stride == 0
+        self._frames_since_change += 1
+        self.frames_processed += process
+        self.frames_skipped += not process
+        return process
+
+    def update(self, latencies: dict[str, float]) -> None:
+        """Add the stage latencies (seconds) of a processed frame.
+
+        May change the quality level for the following frames.
+        """
+        alpha = self.smoothing
+        for stage, seconds in latencies.items():
+            previous = self._latency.get(stage, seconds)
+            self._latency[stage] = (1 - alpha) * previous + alpha * seconds
+        self._processed_at_level += 1
+        self._updates += 1
+        cost = sum(self._latency.values())
+        self._level_costs[self.level] = (cost, self._updates)
+
+        if self._processed_at_level < self.cooldown:
+            return
+        load = self.load
+        if load > self.degrade_load and self.level < len(self.levels) - 1:
+            self._change_level(self.level + 1, load)
+        elif load < self.recover_load and self.level > 0:
+            predicted = self._predicted_load(self.level - 1)
+            if predicted is None or predicted < self.degrade_load:
+                self._change_level(self.level - 1, load)
+
+    @property
+    def load(self) -> float:
+        """Smoothed fraction of the frame budget used per incoming frame."""
+        cost = sum(self._latency.values())
+        return cost / self.levels[self.level].stride / self.budget
+
+    def _predicted_load(self, level: int) -> float | None:
+        """Load measured at the given level, unless outdated."""
+        if level not in self._level_costs:
+            return None
+        cost, measured_at = self._level_costs[level]
+        if self._updates - measured_at > 10 * self.cooldown:
+            return None  # conditions may have changed, try again
+        return cost / self.levels[level].stride / self.budget
+
+    def _change_level(self, level: int, load: float) -> None:
+        frame = self.frames_processed + self.frames_skipped
+        self.decisions.append(LoadDecision(frame, self.level, level, load))
+        logger.info(
+            "Load %.2f, switching from level %d to %d (%s).",
+            load, self.level, level, self.levels[level],
+        )  # fmt: skip
+        self.level = level
+        self._latency.clear()
+        self._processed_at_level = 0
+        self._frames_since_change = 0
+        self._apply()
+
+    def _apply(self) -> None:
+        """Configure the attached detector for the active level."""
+        if self._detector is None:
+            return
+        settings = self.levels[self.level]
+        self._detector.scale = self._base_scale * settings.scale
+        if self._base_interval is not None:
+            interval = max(self._base_interval, settings.detect_interval)
+            self._detector.detect_interval = interval  # type: ignore
+
+    def telemetry(self) -> LoadTelemetry:
+        """Get the current measurements and decisions."""
+        return LoadTelemetry(
+            level=self.level,
+            settings=self.levels[self.level],
+            latency=dict(self._latency),
+            load=self.load,
+            frames_processed=self.frames_processed,
+            frames_skipped=self.frames_skipped,
+            decisions=list(self.decisions),
+        )
+
+    def reset(self) -> None:
+        """Return to the best quality level and clear all measurements."""
+        self.level = 0
+        self.frames_processed = 0
+        self.frames_skipped = 0
+        self.decisions.clear()
+        self._latency: dict[str, float] = {}
+        self._level_costs: dict[int, tuple[float, int]] = {}
+        self._updates = 0
+        self._processed_at_level = 0
+        self._frames_since_change = 0
+        self._apply()
@@ -4,6 +4,7 @@ import hydra
 import omegaconf
 
 import yarppg
+import yarppg.batch
 import yarppg.ui
 
 
@@ -22,5 +23,28 @@ def run_yarppg():
     main()  # type: ignore
 
 
+@hydra.main(version_base=None, config_name="batch_config")
+def batch_main(cfg: omegaconf.DictConfig):
+    """Process all video files given in the CLI arguments."""
+    config: yarppg.settings.BatchSettings = omegaconf.OmegaConf.to_object(cfg)  # type: ignore
+    results = yarppg.batch.process_videos(
+        config.inputs,
+        config,
+        outdir=config.outdir,
+        workers=config.workers,
+        overwrite=config.overwrite,
+    )
+    failed = [result for result in results if not result.ok]
+    print(f"Processed {len(results) - len(failed)} of {len(results)} videos.")
+    for result in failed:
+        print(f"Failed: {result.filename} ({result.error})")
+
+
+def run_yarppg_batch():
+    """Register structured configs and run the batch processing."""
+    yarppg.settings.register_schemas()
+    batch_main()  # type: ignore
+
+
 if __name__ == "__main__":
     run_yarppg()
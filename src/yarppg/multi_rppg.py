@@ -0,0 +1,157 @@
+"""Provides an orchestrator running several rPPG algorithms on one ROI pass.
+
+Comparing algorithms with separate [`Rppg`][yarppg.Rppg] instances repeats the
+entire pipeline for each algorithm, although ROI detection and color averaging
+produce the same output every time. [`MultiRppg`][yarppg.MultiRppg] detects
+the ROI and computes the mean colors only once per frame. These colors are then
+passed to each branch's processor (see
+[`process_color`][yarppg.Processor.process_color]) and HR calculator. An
+additional branch therefore only costs the few operations of its algorithm.
+
+```python
+import yarppg
+
+multi = yarppg.MultiRppg(
+    processors={"green": yarppg.Processor(), "chrom": yarppg.ChromProcessor()}
+)
+result = multi.process_frame(frame)
+print(result.values["chrom"], result["green"].hr)
+```
+"""
+
+import pathlib
+import time
+from typing import Literal, overload
+
+import numpy as np
+import pandas as pd
+
+from . import helpers, hr_calculator, roi
+from .containers import MultiRppgResult, RegionOfInterest, multi_result_columns
+from .processors import ChromProcessor, Processor
+from .processors.processor import roi_colors
+
+
+class MultiRppg:
+    """Orchestrator feeding one ROI detection into several rPPG branches.
+
+    Each branch consists of a processor and a HR calculator, identified by
+    the same name.
+
+    Args:
+        roi_detector: detector for identifying the region of interest. Defaults
+            to the [`FaceMeshDetector`][yarppg.FaceMeshDetector].
+        processors: signal extraction algorithm of each branch. Defaults to the
+            base `Processor` ("green") and the `ChromProcessor` ("chrom").
+        hr_calcs: HR calculator of each branch. Branches without an entry use
+            a [`PeakBasedHrCalculator`][yarppg.PeakBasedHrCalculator].
+            Defaults to None.
+        fps: expected frames per second of the camera/video.
+    """
+
+    def __init__(
+        self,
+        roi_detector: roi.RoiDetector | None = None,
+        processors: dict[str, Processor] | None = None,
+        hr_calcs: dict[str, hr_calculator.HrCalculator] | None = None,
+        fps: float = 30,
+    ):
+        self.roi_detector = roi_detector or roi.FaceMeshDetector()
+        self.processors = processors or {
+            "green": Processor(),
+            "chrom": ChromProcessor(),
+        }
+        hr_calcs = hr_calcs or {}
+        self.hr_calculators = {
+            name: hr_calcs.get(name) or hr_calculator.PeakBasedHrCalculator(fps)
+            for name in self.processors
+        }
+
+    def process_frame(
+        self, frame: np.ndarray, lightweight=False, timestamp: float | None = None
+    ) -> MultiRppgResult:
+        """Process a single frame from video or live stream.
+
+        Args:
+            frame: (h x w x 3)-image array.
+            lightweight: if True, the frame and masks are dropped from the result
+                (see [`Rppg.process_frame`][yarppg.Rppg.process_frame]).
+                Defaults to False.
+            timestamp: capture time of the frame (or its position in the video)
+                in seconds. Defaults to the current time (`time.perf_counter`).
+        """
+        if timestamp is None:
+            timestamp = time.perf_counter()
+        roi = self.roi_detector.detect_at(frame, timestamp)
+        return self.process_roi(roi, lightweight, timestamp)
+
+    def process_roi(
+        self, roi: RegionOfInterest, lightweight=False, timestamp: float | None = None
+    ) -> MultiRppgResult:
+        """Compute the mean colors once and update all branches."""
+        roi_mean, bg_mean = roi_colors(roi)
+        values, hrs = {}, {}
+        for name, processor in self.processors.items():
+            values[name] = processor.process_color(roi_mean, bg_mean)
+            hrs[name] = self.hr_calculators[name].update(values[name])
+
+        result = MultiRppgResult(values, hrs, roi, roi_mean, bg_mean, timestamp)
+        if lightweight:
+            return result.lightweight()
+        return result
+
+    @overload
+    def process_video(
+        self,
+        filename: ...,
+        as_dataframe: Literal[True],
+        lightweight: bool = ...,
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def process_video(
+        self,
+        filename: ...,
+        as_dataframe: Literal[False] = ...,
+        lightweight: bool = ...,
+    ) -> list[MultiRppgResult]: ...
+
+    def process_video(
+        self, filename: str | pathlib.Path, as_dataframe=False, lightweight=False
+    ):
+        """Convenience function to process an entire video file at once.
+
+        Args:
+            filename: path to the video file. Frames are decoded ahead on a
+                background thread and converted to RGB, unless the ROI
+                detector accepts BGR frames (see
+                [`VideoReader`][yarppg.helpers.VideoReader]).
+            as_dataframe: if True, return a data frame with one row per frame,
+                holding the mean colors and each branch's value and HR (see
+                [`multi_result_columns`][yarppg.containers.multi_result_columns]).
+                Defaults to False.
+            lightweight: if True, the returned results do not hold on to the
+                frames and masks. Defaults to False.
+
+        As in [`Rppg.process_video`][yarppg.Rppg.process_video], each frame is
+        timestamped with its position in the video, and the ROI detector is
+        reset before the first frame.
+        """
+        self.roi_detector.reset()
+        reuse = lightweight or as_dataframe  # no result holds on to the frames
+        rgb = self.roi_detector.channel_order == "rgb"
+        reader = helpers.VideoReader(filename, rgb=rgb, reuse_buffers=reuse)
+        frames = reader.with_timestamps()
+        if not as_dataframe:
+            return [self.process_frame(frame, lightweight, t) for t, frame in frames]
+        rows = [np.array(self.process_frame(frame, timestamp=t)) for t, frame in frames]
+        columns = multi_result_columns(self.processors)
+        return pd.DataFrame(np.reshape(rows, (-1, len(columns))), columns=columns)
+
+    def reset(self) -> None:
+        """Reset the ROI detector and the processors and HR calculators."""
+        self.roi_detector.reset()
+        for processor in self.processors.values():
+            processor.reset()
+        for hrcalc in self.hr_calculators.values():
+            hrcalc.reset()
@@ -0,0 +1,112 @@
+"""Utilities to run processing steps concurrently in a staged pipeline.
+
+Offline processing consists of several steps per frame (decoding, ROI
+detection, signal extraction), which are executed one after another. Many of
+these steps spend most of their time in OpenCV or MediaPipe code that releases
+the GIL. [`run_pipelined`][yarppg.pipeline.run_pipelined] runs each step in a
+dedicated thread, connected by bounded queues, so that the steps can overlap.
+
+Every stage is processed by exactly one thread, so items pass through the
+pipeline in their original order and stateful steps see the same sequence of
+inputs as in a sequential loop.
+"""
+
+import queue
+import threading
+from typing import Any, Callable, Iterable, Iterator
+
+_DONE = object()
+
+
+class _StageError:
+    """Wraps an exception raised inside a stage, to be re-raised by the consumer."""
+
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+
+
+def _put(q: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _get(q: queue.Queue, stop: threading.Event) -> Any:
+    while not stop.is_set():
+        try:
+            return q.get(timeout=0.1)
+        except queue.Empty:
+            pass
+    return _DONE
+
+
+def _feed(items: Iterable, out: queue.Queue, stop: threading.Event) -> None:
+    try:
+        for item in items:
+            if not _put(out, item, stop):
+                return
+    except Exception as exc:
+        _put(out, _StageError(exc), stop)
+        return
+    _put(out, _DONE, stop)
+
+
+def _work(
+    func: Callable, inp: queue.Queue, out: queue.Queue, stop: threading.Event
+) -> None:
+    while True:
+        item = _get(inp, stop)
+        if item is _DONE or isinstance(item, _StageError):
+            _put(out, item, stop)
+            return
+        try:
+            result = func(item)
+        except Exception as exc:
+            _put(out, _StageError(exc), stop)
+            return
+        if not _put(out, result, stop):
+            return
+
+
+def run_pipelined(
+    items: Iterable, stages: list[Callable[[Any], Any]], maxsize: int = 8
+) -> Iterator:
+    """Apply the given stages to all items, each stage in its own thread.
+
+    Iterating `items` happens in a separate thread as well. The output is
+    identical to `for item in items: yield stage_n(...stage_1(item))`.
+    Exceptions raised in any stage are re-raised in the consuming thread.
+
+    Args:
+        items: iterable of input items, e.g., frames from a video.
+        stages: functions applied one after another to each item.
+        maxsize: capacity of the queues between stages. Defaults to 8.
+
+    Yields:
+        The output of the last stage for each input item, in input order.
+    """
+    stop = threading.Event()
+    queues = [queue.Queue(maxsize=maxsize) for _ in range(len(stages) + 1)]
+    threads = [threading.Thread(target=_feed, args=(items, queues[0], stop))]
+    for func, inp, out in zip(stages, queues[:-1], queues[1:]):
+        threads.append(threading.Thread(target=_work, args=(func, inp, out, stop)))
+
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    try:
+        while True:
+            item = queues[-1].get()
+            if item is _DONE:
+                break
+            if isinstance(item, _StageError):
+                raise item.exc
+            yield item
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
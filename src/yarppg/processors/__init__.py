@@ -9,6 +9,19 @@ Note that this is a stateful function, for most processors. Many algorithms use
 internal buffer of previous values to provide a more robust calculation.
 To clear the internal buffer, we can call [`reset`][yarppg.Processor.reset]
 
+For offline analysis of previously extracted color traces, all processors also
+provide [`process_trace`][yarppg.Processor.process_trace], which computes the
+signal for an entire (N, 3) array of ROI colors at once.
+
+If the ROI detector splits the face into several labeled regions, the mean
+colors of all regions are passed to
+[`process_regions`][yarppg.Processor.process_regions] as an (n_regions, 3)
+array, and each region is processed with its own copy of the processor.
+
+The [`PatchGridProcessor`][yarppg.processors.PatchGridProcessor] front-end
+additionally computes the colors and signals of a fixed grid of patches over
+the face.
+
 Processors can be wrapped in a [`FilteredProcessor`][yarppg.FilteredProcessor]
 allowing for ad-hoc signal smoothing with each signal update.
 
@@ -25,6 +38,7 @@ Implements the chrominance-based algorithm by
 from typing import Callable
 
 from .chrom import ChromProcessor
+from .patch_grid import PatchGridProcessor
 from .processor import FilteredProcessor, Processor
 
 algorithms: dict[str, Callable[..., Processor]] = {
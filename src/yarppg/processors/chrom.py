@@ -9,13 +9,18 @@ from typing import Literal
 
 import numpy as np
 
-from ..containers import Color, RegionOfInterest, RppgResult
+from ..containers import Color
+from ..helpers import RollingMean, rolling_mean
 from .processor import Processor
 
 
 class ChromProcessor(Processor):
     """Chrominance-based rPPG algorithm by de Haan & Jeanne (2013).
 
+    Moving averages are computed over fixed-size ring buffers (see
+    [`RollingMean`][yarppg.helpers.RollingMean]), so that each update takes
+    constant time and memory does not grow in long-running applications.
+
     Args:
         winsize: window size for moving average calculations. Defaults to 45.
         method: method to use. Can be 'xovery' or 'fixed'. Defaults to "xovery".
@@ -29,48 +34,61 @@ class ChromProcessor(Processor):
         self.winsize = winsize
         self.method = method
 
-        self._rgbs: list[Color] = []
-        self._xs: list[float] = []
-        self._ys: list[float] = []
+        self._rgb_mean = RollingMean(winsize, size=3)
+        self._xy_mean = RollingMean(winsize, size=2)
 
-    def process(self, roi: RegionOfInterest) -> RppgResult:
+    def process_color(self, roi_mean: Color, bg_mean: Color) -> float:  # noqa: ARG002
         """Calculate pulse signal update according to Chrom algorithm."""
-        result = super().process(roi)
-        self._rgbs.append(result.roi_mean)
-
         if self.method == "fixed":
-            result.value = self._calculate_fixed_update()
-
-        elif self.method == "xovery":
-            result.value = self._calculate_xovery_update()
-
-        return result
-
-    def _calculate_fixed_update(self) -> float:
-        rgbmean = Color.from_array(np.mean(self._rgbs[-self.winsize :], axis=0))
+            return self._calculate_fixed_update(roi_mean)
+        if self.method == "xovery":
+            return self._calculate_xovery_update(roi_mean)
+        return roi_mean.g
+
+    def process_trace(
+        self,
+        roi_mean: np.ndarray,
+        bg_mean: np.ndarray | None = None,  # noqa: ARG002
+    ) -> np.ndarray:
+        """Calculate the Chrom signal for a complete trace of ROI colors at once.
+
+        Moving averages are computed from cumulative sums (see
+        [`rolling_mean`][yarppg.helpers.rolling_mean]).
+        """
+        rgb = np.asarray(roi_mean, dtype=float)
+        r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+        if self.method == "fixed":
+            rgbmean = rolling_mean(rgb, self.winsize)
+            rn, gn, bn = np.moveaxis(rgb / np.where(rgbmean == 0, 1.0, rgbmean), -1, 0)
+            x = 3 * rn - 2 * gn
+            y = 1.5 * rn + gn - 1.5 * bn
+        else:
+            xy = np.stack((r - g, 0.5 * r + 0.5 * g - b), axis=-1)
+            x, y = np.moveaxis(rolling_mean(xy, self.winsize), -1, 0)
+        return x / np.where(y == 0, 1.0, y) - 1
 
-        rn = self._rgbs[-1].r / (rgbmean.r or 1.0)
-        gn = self._rgbs[-1].g / (rgbmean.g or 1.0)
-        bn = self._rgbs[-1].b / (rgbmean.b or 1.0)
+    def _calculate_fixed_update(self, rgb: Color) -> float:
+        rgbmean = Color(*self._rgb_mean.update((rgb.r, rgb.g, rgb.b)))
 
-        self._xs.append(3 * rn - 2 * gn)
-        self._ys.append(1.5 * rn + gn - 1.5 * bn)
+        rn = rgb.r / (rgbmean.r or 1.0)
+        gn = rgb.g / (rgbmean.g or 1.0)
+        bn = rgb.b / (rgbmean.b or 1.0)
 
-        return self._xs[-1] / (self._ys[-1] or 1.0) - 1
+        x = 3 * rn - 2 * gn
+        y = 1.5 * rn + gn - 1.5 * bn
 
-    def _calculate_xovery_update(self) -> float:
-        rgb = self._rgbs[-1]
+        return x / (y or 1.0) - 1
 
-        self._xs.append(rgb.r - rgb.g)
-        self._ys.append(0.5 * rgb.r + 0.5 * rgb.g - rgb.b)
+    def _calculate_xovery_update(self, rgb: Color) -> float:
+        x = rgb.r - rgb.g
+        y = 0.5 * rgb.r + 0.5 * rgb.g - rgb.b
 
-        xmean = np.mean(self._xs[-self.winsize :])
-        ymean = np.mean(self._ys[-self.winsize :])
+        xmean, ymean = self._xy_mean.update((x, y))
 
         return float(xmean / (ymean or 1) - 1)
 
     def reset(self):
         """Reset internal state and intermediate values."""
-        self._rgbs.clear()
-        self._xs.clear()
-        self._ys.clear()
+        super().reset()
+        self._rgb_mean.reset()
+        self._xy_mean.reset()
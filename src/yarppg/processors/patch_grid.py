@@ -0,0 +1,106 @@
+"""Processor front-end extracting color traces on a grid of face patches.
+
+Robust rPPG methods combine the signals of many small skin patches instead of
+relying on a single average over the face. The
+[`PatchGridProcessor`][yarppg.processors.PatchGridProcessor] divides the face
+rectangle into a fixed grid of patches and computes all patch colors at once
+(see [`patch_grid`][yarppg.roi.roi_tools.patch_grid]). Each result then holds a
+compact (G x G x 3) array of patch colors, and the signal value of every
+patch.
+
+```python
+processor = yarppg.PatchGridProcessor(yarppg.ChromProcessor(), grid=8)
+result = processor.process(roi)
+print(result.patch_means.shape, result.patch_values.shape)  # (8, 8, 3) (8, 8)
+```
+
+For offline analysis, the (N x G x G x 3) trace of patch colors can be passed
+to the [`process_trace`][yarppg.Processor.process_trace] method of any
+processor.
+"""
+
+import copy
+
+import numpy as np
+
+from ..containers import Color, RegionOfInterest, RppgResult
+from ..roi.roi_tools import patch_grid
+from .processor import Processor
+
+
+def patch_colors(roi: RegionOfInterest, grid: int, masked=True) -> np.ndarray:
+    """Calculate the (grid x grid x 3) patch colors of the face rectangle.
+
+    Args:
+        roi: region of interest with the face rectangle.
+        grid: number of patches along each side.
+        masked: only average the pixels inside the ROI mask. Defaults to True.
+    """
+    if roi.face_rect is None:
+        return np.full((grid, grid, 3), np.nan)
+    if not masked:
+        return patch_grid(
+            roi.baseimg, roi.face_rect, grid, channel_order=roi.channel_order
+        )
+    return patch_grid(
+        roi.baseimg,
+        roi.face_rect,
+        grid,
+        roi.mask,
+        roi.mask_rect,
+        channel_order=roi.channel_order,
+    )
+
+
+class PatchGridProcessor(Processor):
+    """Front-end adding the colors and signals of a grid of face patches.
+
+    The wrapped processor computes the signal value of the ROI as usual. A
+    separate copy of it processes the patch colors, keeping an independent
+    history for each patch (see [`process_regions`][yarppg.Processor.process_regions]).
+
+    Args:
+        processor: processor applied to the ROI and each patch. Defaults to
+            the base `Processor`.
+        grid: number of patches along each side of the face rectangle.
+            Defaults to 8.
+        masked: only average the pixels inside the ROI mask (e.g., skin).
+            Defaults to True.
+    """
+
+    def __init__(
+        self, processor: Processor | None = None, grid: int = 8, masked: bool = True
+    ):
+        self.processor = processor or Processor()
+        self.grid = grid
+        self.masked = masked
+        self._patch_processor = copy.deepcopy(self.processor)
+        self._patch_processor.reset()
+
+    def process(self, roi: RegionOfInterest) -> RppgResult:
+        """Calculate the processor output and the signals of all patches."""
+        result = self.processor.process(roi)
+        result.patch_means = patch_colors(roi, self.grid, self.masked)
+        result.patch_values = self._patch_processor.process_regions(
+            result.patch_means.reshape(-1, 3), result.bg_mean
+        ).reshape(self.grid, self.grid)
+        return result
+
+    def process_color(self, roi_mean: Color, bg_mean: Color) -> float:
+        """Calculate the output of the wrapped processor."""
+        return self.processor.process_color(roi_mean, bg_mean)
+
+    def process_trace(
+        self, roi_mean: np.ndarray, bg_mean: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Calculate the output of the wrapped processor for a complete trace.
+
+        Pass an (N x G x G x 3) trace of patch colors to get the (N x G x G)
+        signals of all patches.
+        """
+        return self.processor.process_trace(roi_mean, bg_mean)
+
+    def reset(self) -> None:
+        """Reset internal state and intermediate values."""
+        self.processor.reset()
+        self._patch_processor.reset()
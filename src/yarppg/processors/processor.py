@@ -1,27 +1,116 @@
 """Provides base classes for rPPG signal computation."""
 
+import copy
+
 import numpy as np
 
 from ..containers import Color, RegionOfInterest, RppgResult
 from ..digital_filter import DigitalFilter
-from ..roi.roi_tools import masked_average
+from ..roi.roi_tools import masked_average, masked_averages
+
+
+def roi_colors(roi: RegionOfInterest) -> tuple[Color, Color]:
+    """Calculate the mean colors of the ROI and the background (or NaN)."""
+    avg = masked_average(roi.baseimg, roi.mask, roi.mask_rect, roi.channel_order)
+    bg_mean = Color.null()
+    if roi.bg_mask is not None:
+        bg_mean = masked_average(
+            roi.baseimg, roi.bg_mask, channel_order=roi.channel_order
+        )
+    return avg, bg_mean
+
+
+def region_colors(roi: RegionOfInterest) -> np.ndarray | None:
+    """Calculate the (n_regions x 3) mean colors of the labeled regions, if any."""
+    if roi.labels is None:
+        return None
+    n_labels = len(roi.region_names or ()) or int(roi.labels.max(initial=0))
+    return masked_averages(
+        roi.baseimg, roi.labels, n_labels, roi.labels_rect, roi.channel_order
+    )
 
 
 class Processor:
     """Base rPPG processor, extracting the average green channel from the ROI."""
 
     def process(self, roi: RegionOfInterest) -> RppgResult:
-        """Calculate average green channel in the roi area."""
-        avg = masked_average(roi.baseimg, roi.mask)
-        bg_mean = Color.null()
-        if roi.bg_mask is not None:
-            bg_mean = masked_average(roi.baseimg, roi.bg_mask)
+        """Calculate average green channel in the roi area.
+
+        If the ROI holds additional labeled regions, the mean colors of all
+        regions are passed to `process_regions` as well.
+        """
+        avg, bg_mean = roi_colors(roi)
+        value = self.process_color(avg, bg_mean)
+        result = RppgResult(value, roi, roi_mean=avg, bg_mean=bg_mean)
+        result.region_means = region_colors(roi)
+        if result.region_means is not None:
+            result.region_values = self.process_regions(result.region_means, bg_mean)
+        return result
+
+    def process_color(self, roi_mean: Color, bg_mean: Color) -> float:  # noqa: ARG002
+        """Calculate the signal update from the mean colors of ROI and background.
+
+        This is the part of `process` that follows the color averaging. Several
+        processors can thus share the (expensive) averaging of the same ROI
+        (see [`MultiRppg`][yarppg.MultiRppg]).
+        """
+        return roi_mean.g
+
+    def process_regions(self, region_means: np.ndarray, bg_mean: Color) -> np.ndarray:
+        """Calculate the signal update of each labeled region.
+
+        Every region is processed by its own copy of this processor (see
+        `process_color`), so that stateful algorithms keep a separate history
+        per region. The copies are created from a reset processor whenever the
+        number of regions changes.
+
+        Args:
+            region_means: (n_regions x 3)-array of mean region colors.
+            bg_mean: mean color of the background.
 
-        return RppgResult(avg.g, roi, roi_mean=avg, bg_mean=bg_mean)
+        Returns:
+            (n_regions,) array of signal values.
+        """
+        branches = getattr(self, "_region_processors", [])
+        if len(branches) != len(region_means):
+            self._region_processors: list[Processor] = []
+            branches = [copy.deepcopy(self) for _ in region_means]
+            for branch in branches:
+                branch.reset()
+            self._region_processors = branches
+        return np.array(
+            [
+                branch.process_color(Color(*mean), bg_mean)
+                for branch, mean in zip(branches, region_means)
+            ]
+        )
+
+    def process_trace(
+        self,
+        roi_mean: np.ndarray,
+        bg_mean: np.ndarray | None = None,  # noqa: ARG002
+    ) -> np.ndarray:
+        """Calculate the rPPG signal from a complete trace of ROI colors at once.
+
+        This is the vectorized equivalent of calling `process` for each frame,
+        starting from a freshly reset processor, and is intended for offline
+        re-analysis of previously extracted color traces. The processor's
+        internal state is neither used nor modified.
+
+        Args:
+            roi_mean: (N, 3) array of average RGB colors inside the ROI. Traces
+                of several regions can be given as (N, ..., 3) array, e.g.,
+                (N, n_regions, 3), each region being processed independently.
+            bg_mean: (N, 3) array of average background colors. Defaults to None.
+
+        Returns:
+            (N,) array of signal values, or (N, ...) for several regions.
+        """
+        return np.asarray(roi_mean, dtype=float)[..., 1].copy()
 
     def reset(self) -> None:
         """Reset internal state and intermediate values."""
-        pass  # no persistent values in base class
+        self._region_processors = []
 
 
 class FilteredProcessor(Processor):
@@ -30,17 +119,62 @@ class FilteredProcessor(Processor):
     def __init__(self, processor: Processor, livefilter: DigitalFilter | None = None):
         self.processor = processor
         self.livefilter = livefilter
+        self._region_filters: list[DigitalFilter] = []
 
     def process(self, roi: RegionOfInterest) -> RppgResult:
         """Calculate processor output and apply digital filter."""
         result = self.processor.process(roi)
-        if self.livefilter is not None and np.isfinite(result.value):
-            # only calculate filter update if not NaN
-            result.value = self.livefilter.process(result.value)
+        result.value = self._filter(result.value)
+        if result.region_values is not None:
+            result.region_values = self._filter_regions(result.region_values)
         return result
 
+    def process_color(self, roi_mean: Color, bg_mean: Color) -> float:
+        """Calculate processor output from the mean colors and apply the filter."""
+        return self._filter(self.processor.process_color(roi_mean, bg_mean))
+
+    def _filter(self, value: float) -> float:
+        if self.livefilter is not None and np.isfinite(value):
+            # only calculate filter update if not NaN
+            return self.livefilter.process(value)
+        return value
+
+    def _filter_regions(self, values: np.ndarray) -> np.ndarray:
+        if self.livefilter is None:
+            return values
+        if len(self._region_filters) != len(values):
+            self._region_filters = [copy.deepcopy(self.livefilter) for _ in values]
+            for livefilter in self._region_filters:
+                livefilter.reset()
+        return np.array(
+            [
+                livefilter.process(value) if np.isfinite(value) else value
+                for livefilter, value in zip(self._region_filters, values)
+            ]
+        )
+
+    def process_trace(
+        self, roi_mean: np.ndarray, bg_mean: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Calculate processor output for a complete trace and apply the filter.
+
+        A reset copy of the live filter is applied to all finite values of the
+        signal, so the filter state of this processor remains untouched.
+        """
+        values = self.processor.process_trace(roi_mean, bg_mean)
+        if self.livefilter is None:
+            return values
+        columns = values.reshape(len(values), -1)
+        for column in columns.T:  # filter each region separately
+            livefilter = copy.deepcopy(self.livefilter)
+            livefilter.reset()
+            finite = np.isfinite(column)
+            column[finite] = livefilter.process_signal(column[finite])
+        return columns.reshape(values.shape)
+
     def reset(self) -> None:
         """Reset internal state and intermediate values."""
         self.processor.reset()
+        self._region_filters = []
         if self.livefilter is not None:
             self.livefilter.reset()
@@ -0,0 +1,123 @@
+"""Resample irregularly timed samples onto a uniform time grid.
+
+Filters and HR calculators assume that samples arrive at a fixed rate. This
+no longer holds when frames are skipped, either deliberately to save CPU or
+because processing cannot keep up, or when a camera does not deliver a
+stable frame rate. A [`Resampler`][yarppg.Resampler] linearly interpolates
+timestamped samples at the times `k / fs`, so that all following stages see
+a signal with the nominal sampling rate `fs`.
+
+```python
+resampler = yarppg.Resampler(fs=30)
+reader = yarppg.VideoReader("video_30fps.mp4", stride=3)  # every third frame
+for timestamp, frame in reader.with_timestamps():
+    for sample in resampler.update(timestamp, frame.mean(axis=(0, 1))):
+        ...  # three samples per frame
+```
+"""
+
+import math
+from typing import Sequence
+
+import numpy as np
+
+_EPS = 1e-6
+"""Tolerance (in grid steps) for timestamps coinciding with a grid point."""
+
+
+class Resampler:
+    """Online linear interpolation of timestamped samples on a uniform grid.
+
+    Grid points are placed at the absolute times `k / fs`, so that resamplers
+    with the same rate produce the same grid, no matter at which time they
+    start. Each new sample yields the grid points between the previous and
+    the new sample (zero, one or several). Samples with a timestamp that is
+    not later than the previous one are ignored.
+
+    Args:
+        fs: sampling rate of the uniform grid (Hz).
+    """
+
+    def __init__(self, fs: float):
+        self.fs = fs
+        self.reset()
+
+    def update(self, timestamp: float, sample: Sequence[float]) -> np.ndarray:
+        """Add a sample and interpolate the grid points up to its timestamp.
+
+        Args:
+            timestamp: time of the sample in seconds.
+            sample: vector of values measured at this time.
+
+        Returns:
+            (k x d)-array with the values at the k new grid points.
+        """
+        sample = np.asarray(sample, dtype=float).ravel()
+        if self._last_time is not None and timestamp <= self._last_time:
+            return np.empty((0, len(sample)))
+        last = math.floor(timestamp * self.fs + _EPS)
+        if self._last_time is None:
+            self._next_index = math.ceil(timestamp * self.fs - _EPS)
+            new = np.repeat(sample[None], max(last - self._next_index + 1, 0), axis=0)
+        else:
+            grid = np.arange(self._next_index, last + 1) / self.fs
+            new = _interpolate(
+                grid, self._last_time, timestamp, self._last_sample, sample
+            )
+        self._next_index = max(self._next_index, last + 1)
+        self._last_time, self._last_sample = timestamp, sample
+        return new
+
+    def process_trace(
+        self, timestamps: Sequence[float], samples: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Resample an entire trace at once.
+
+        The output is identical to calling `update` with each sample, starting
+        from a freshly reset resampler. The internal state of this resampler
+        is neither used nor modified.
+
+        Args:
+            timestamps: (N,) array of sample times in seconds.
+            samples: (N x d)-array of samples.
+
+        Returns:
+            The (M x d)-array of values at the grid points, and the index of
+            the sample with which each grid point becomes available (i.e.,
+            the `update` call returning it).
+        """
+        times = np.asarray(timestamps, dtype=float)
+        samples = np.asarray(samples, dtype=float).reshape(len(times), -1)
+        previous_max = np.maximum.accumulate(np.r_[-np.inf, times[:-1]])
+        kept = np.flatnonzero(times > previous_max)
+        if len(kept) == 0:
+            return np.empty((0, samples.shape[1])), np.empty(0, dtype=int)
+        times, samples = times[kept], samples[kept]
+
+        first = math.ceil(times[0] * self.fs - _EPS)
+        lasts = np.floor(times * self.fs + _EPS).astype(int)
+        indices = np.arange(first, lasts[-1] + 1)
+        # j-th kept sample emits the grid points up to lasts[j]
+        j = np.searchsorted(lasts, indices, side="left")
+        prev = np.maximum(j - 1, 0)
+        values = _interpolate(
+            indices / self.fs, times[prev], times[j], samples[prev], samples[j]
+        )
+        values[j == 0] = samples[0]
+        return values, kept[j]
+
+    def reset(self) -> None:
+        """Forget the previous sample and restart the grid with the next one."""
+        self._last_time: float | None = None
+        self._last_sample: np.ndarray | None = None
+        self._next_index = 0
+
+
+def _interpolate(
+    grid: np.ndarray, t0, t1, s0: np.ndarray, s1: np.ndarray
+) -> np.ndarray:
+    """Interpolate between (t0, s0) and (t1, s1) at the grid times."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weight = np.clip((grid - t0) / (t1 - t0), 0, 1)
+    weight = np.reshape(weight, (-1, 1))
+    return s0 + weight * (s1 - s0)
@@ -9,19 +9,47 @@ detectors are currently implemented:
 - [`SelfieDetector`][yarppg.SelfieDetector] - uses MediaPipe's SelfieSegmenter
   solution. Selfie segmentation is slower than FaceMesh and may not work in a
   real-time application.
+- [`SkinDetector`][yarppg.roi.skin_detector.SkinDetector] - selects
+  skin-colored pixels inside the face found by an OpenCV Haar cascade. It needs
+  no model download and runs at hundreds of frames per second on the CPU.
+- [`ReplayDetector`][yarppg.roi.landmark_store.ReplayDetector] - builds the ROI
+  from face landmarks recorded in a
+  [`LandmarkStore`][yarppg.roi.landmark_store.LandmarkStore], without running
+  any model.
 
 Detectors return a [`RegionOfInterest`][yarppg.RegionOfInterest] container
 that stores the original image, the ROI mask and an optional background mask.
+The FaceMesh detector produces compact ROI masks that only cover the bounding
+box of the region. Use [`full_mask`][yarppg.RegionOfInterest.full_mask] to get
+a mask in the size of the image.
+
+The FaceMesh and replay detectors can additionally split the face into several
+regions (e.g., forehead and cheeks, see
+[`FACE_REGIONS`][yarppg.roi.landmark_store.FACE_REGIONS]). These are stored
+as one integer label image, so that the mean colors of all regions are computed
+in a single pass (see [`masked_averages`][yarppg.roi.roi_tools.masked_averages]).
 """
 
 from typing import Callable
 
 from .detector import RoiDetector
-from .facemesh_segmenter import FaceMeshDetector
-from .roi_tools import contour_to_mask, overlay_mask, pixelate, pixelate_mask
+from .facemesh_segmenter import FaceMeshDetector, record_landmarks
+from .landmark_store import FACE_REGIONS, LandmarkStore, ReplayDetector
+from .roi_tools import (
+    contour_to_local_mask,
+    contour_to_mask,
+    contours_to_local_labels,
+    masked_averages,
+    overlay_mask,
+    patch_grid,
+    pixelate,
+    pixelate_mask,
+)
 from .selfie_segmenter import SelfieDetector
+from .skin_detector import SkinDetector
 
 detectors: dict[str, Callable[..., RoiDetector]] = {
     "facemesh": FaceMeshDetector,
     "selfie": SelfieDetector,
+    "skin": SkinDetector,
 }
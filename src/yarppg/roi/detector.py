@@ -1,17 +1,144 @@
 """Provides the base class of the ROI detector."""
 
+import time
+from typing import Any, Literal
+
+import cv2
 import numpy as np
 
 from ..containers import RegionOfInterest
 
+_PARAM_TYPES = (bool, int, float, str, tuple, list, type(None))
+
 
 class RoiDetector:
-    """Base class for ROI detectors."""
+    """Base class for ROI detectors.
+
+    The base class offers helpers to reduce the cost of model inference on large
+    frames. Detectors may run their model on a downscaled copy of the frame or on
+    a crop around the face found in the previous frame (see `inference_input`).
+    Resulting coordinates and masks are mapped back to the full resolution, so
+    that color averages still use the native pixels.
+
+    Frames can be passed in RGB or in OpenCV's native BGR order (`channel_order`).
+    BGR frames are never converted as a whole: only the (cropped and downscaled)
+    model input is converted to RGB, and the channels of the averaged colors
+    are swapped (see [`RegionOfInterest`][yarppg.RegionOfInterest]).
+
+    Args:
+        scale: factor by which the model input is resized. Defaults to 1.
+        crop_margin: if given, the model input is cropped around the previous
+            face rectangle, enlarged by this fraction of its size on each side.
+            Defaults to None (no cropping).
+        channel_order: channel order of the input frames, "rgb" or "bgr".
+            Defaults to "rgb".
+    """
+
+    def __init__(
+        self,
+        scale: float = 1.0,
+        crop_margin: float | None = None,
+        channel_order: Literal["rgb", "bgr"] = "rgb",
+    ):
+        self.scale = scale
+        self.crop_margin = crop_margin
+        self.channel_order = channel_order
+        self._last_face_rect: tuple[int, int, int, int] | None = None
+        self._last_timestamp_ms = -1
+        self._timestamp_offset = 0
+        self._frame_time: float | None = None
 
     def detect(self, frame: np.ndarray) -> RegionOfInterest:
         """Find region of interest in the given frame."""
         raise NotImplementedError("Detect method needs to be overwritten.")
 
+    def detect_at(self, frame: np.ndarray, timestamp: float) -> RegionOfInterest:
+        """Find region of interest in a frame captured at the given time.
+
+        Detectors running a video model use the timestamp (in seconds, e.g.,
+        the capture time or the position in the video) instead of the time
+        of the call.
+        """
+        self._frame_time = timestamp
+        try:
+            return self.detect(frame)
+        finally:
+            self._frame_time = None
+
     def __call__(self, frame: np.ndarray) -> RegionOfInterest:
         """Apply detector on the given frame."""
         return self.detect(frame)
+
+    def reset(self) -> None:
+        """Forget the previous frames, e.g., before processing another video.
+
+        Afterwards, the frame times (see `detect_at`) may start again at any
+        value. Models keep receiving increasing timestamps, since later frame
+        times are shifted past the last timestamp passed to the model.
+        """
+        self._last_face_rect = None
+        self._timestamp_offset = self._last_timestamp_ms + 1
+
+    def get_params(self) -> dict[str, Any]:
+        """Get the detector's configuration, e.g., to identify cached results.
+
+        Includes all public attributes with simple values (numbers, strings,
+        tuples, ...), but not models or other internal state.
+        """
+        return {
+            name: value
+            for name, value in vars(self).items()
+            if not name.startswith("_") and isinstance(value, _PARAM_TYPES)
+        }
+
+    def _next_timestamp_ms(self) -> int:
+        """Get the frame time in ms, strictly increasing with every call.
+
+        This is the time passed to `detect_at`, or the current time, shifted
+        by the offset set in `reset`.
+        """
+        frame_time = self._frame_time
+        now = int((time.perf_counter() if frame_time is None else frame_time) * 1000)
+        now += self._timestamp_offset
+        self._last_timestamp_ms = max(now, self._last_timestamp_ms + 1)
+        return self._last_timestamp_ms
+
+    def crop_rect(self, frame: np.ndarray) -> tuple[int, int, int, int]:
+        """Get the region (x, y, w, h) of the frame used as model input."""
+        height, width = frame.shape[:2]
+        if self.crop_margin is None or self._last_face_rect is None:
+            return 0, 0, width, height
+        x, y, w, h = self._last_face_rect
+        dx, dy = int(w * self.crop_margin), int(h * self.crop_margin)
+        x1, y1 = max(x - dx, 0), max(y - dy, 0)
+        x2, y2 = min(x + w + dx, width), min(y + h + dy, height)
+        if x2 <= x1 or y2 <= y1:
+            return 0, 0, width, height
+        return x1, y1, x2 - x1, y2 - y1
+
+    def inference_input(
+        self, frame: np.ndarray, full_frame: bool = False
+    ) -> tuple[np.ndarray, tuple[int, int, int, int]]:
+        """Prepare the (cropped and downscaled) model input.
+
+        Args:
+            frame: full-resolution input frame.
+            full_frame: ignore the previous face rectangle and use the entire
+                frame. Defaults to False.
+
+        Returns:
+            The contiguous model input image in RGB order and the region
+            (x, y, w, h) of the frame it covers.
+        """
+        if full_frame:
+            rect = (0, 0, frame.shape[1], frame.shape[0])
+        else:
+            rect = self.crop_rect(frame)
+        x, y, w, h = rect
+        img = frame[y : y + h, x : x + w]
+        if self.scale != 1.0:
+            size = (max(round(w * self.scale), 1), max(round(h * self.scale), 1))
+            img = cv2.resize(img, size, interpolation=cv2.INTER_AREA)
+        if self.channel_order == "bgr":
+            return cv2.cvtColor(img, cv2.COLOR_BGR2RGB), rect
+        return np.ascontiguousarray(img), rect
@@ -13,9 +13,11 @@ by Li et al. (2014)[^1].
     [doi:10.1109/CVPR.2014.543](https://doi.org/10.1109/CVPR.2014.543)
 """
 
-import time
+import pathlib
 import warnings
+from typing import Sequence
 
+import cv2
 import mediapipe as mp
 import numpy as np
 from mediapipe.framework.formats import landmark_pb2
@@ -24,9 +26,10 @@ from mediapipe.tasks.python.components.containers import (
 )
 
 from ..containers import RegionOfInterest
-from ..helpers import get_cached_resource_path
+from ..helpers import VideoReader, get_cached_resource_path, get_video_frame_count
 from .detector import RoiDetector
-from .roi_tools import contour_to_mask
+from .landmark_store import LOWER_FACE, LandmarkStore, add_region_labels
+from .roi_tools import contour_to_local_mask, track_points
 
 MEDIAPIPE_MODELS_BASE = "https://storage.googleapis.com/mediapipe-models/"
 LANDMARKER_TASK = "face_landmarker/face_landmarker/float16/latest/face_landmarker.task"
@@ -60,13 +63,72 @@ def get_boundingbox_from_coords(coords: np.ndarray) -> np.ndarray:
     return np.r_[xy, wh]
 
 
+def _landmark_array(results, rect) -> np.ndarray | None:
+    """Get all landmarks (x, y, z) in pixel coordinates of the full frame."""
+    if len(results.face_landmarks) < 1:
+        return None
+    x, y, w, h = rect
+    xyz = [(lm.x, lm.y, lm.z) for lm in results.face_landmarks[0]]
+    return np.multiply(xyz, [w, h, w]) + (x, y, 0)
+
+
 class FaceMeshDetector(RoiDetector):
-    """Face detector using MediaPipe's face landmarker."""
+    """Face detector using MediaPipe's face landmarker.
+
+    Running the landmarker is the most expensive step in the rPPG pipeline. With
+    `detect_interval > 1`, the landmarker only runs on every n-th frame. In the
+    frames in between, the corners of the ROI polygon are tracked with sparse
+    optical flow (see [`track_points`][yarppg.roi.roi_tools.track_points]).
+    If tracking becomes unreliable, the landmarker is run again immediately.
 
-    _lower_face = [200, 431, 411, 340, 349, 120, 111, 187, 211]
+    Args:
+        draw_landmarks: draw the face mesh onto the input frame. Defaults to False.
+        detect_interval: run the landmarker every n frames and track the ROI in
+            between. Defaults to 1 (no tracking).
+        min_tracking_quality: minimum fraction of reliably tracked polygon
+            points. Below this value, the landmarker is run again. Defaults
+            to 0.8.
+        record_to: if given, the landmarks of each frame are appended to this
+            [`LandmarkStore`][yarppg.roi.landmark_store.LandmarkStore]. Frames
+            in which the ROI is tracked are recorded as invalid, so
+            `detect_interval` should be 1 when recording. Defaults to None.
+        regions: additional named regions, given by the indices of their
+            polygon landmarks (e.g.,
+            [`FACE_REGIONS`][yarppg.roi.landmark_store.FACE_REGIONS]). The ROI
+            then holds a label image of these regions, and processors compute a
+            separate signal for each. Defaults to None.
+        **kwargs: `scale` and `crop_margin` to run the landmarker on a smaller
+            input, and the `channel_order` of the frames (see
+            [`RoiDetector`][yarppg.RoiDetector]).
+    """
 
-    def __init__(self, draw_landmarks=False, **kwargs):
+    _lower_face = LOWER_FACE
+
+    def __init__(
+        self,
+        draw_landmarks=False,
+        detect_interval: int = 1,
+        min_tracking_quality: float = 0.8,
+        record_to: LandmarkStore | None = None,
+        regions: dict[str, Sequence[int]] | None = None,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
+        self.landmarker = self._create_landmarker()
+        self.draw_landmarks = draw_landmarks
+        self.detect_interval = detect_interval
+        self.min_tracking_quality = min_tracking_quality
+        self.record_to = record_to
+        self.regions = regions and {name: list(p) for name, p in regions.items()}
+
+        self._prev_gray: np.ndarray | None = None
+        self._polygon: np.ndarray | None = None
+        self._face_rect: np.ndarray | None = None
+        self._regions: dict[str, np.ndarray] = {}
+        self._frames_tracked = 0
+
+    @staticmethod
+    def _create_landmarker():
         modelpath = get_face_landmarker_modelfile()
         if modelpath is None:
             raise FileNotFoundError("Could not find or download landmarker model file.")
@@ -75,40 +137,144 @@ class FaceMeshDetector(RoiDetector):
             base_options=base_options,
             running_mode=mp.tasks.vision.RunningMode.VIDEO,
         )
-        self.landmarker = mp.tasks.vision.FaceLandmarker.create_from_options(
-            landmarker_options
-        )
-        self.draw_landmarks = draw_landmarks
+        return mp.tasks.vision.FaceLandmarker.create_from_options(landmarker_options)
 
     def __del__(self):
-        self.landmarker.close()
+        if hasattr(self, "landmarker"):
+            self.landmarker.close()
+
+    def __getstate__(self):
+        # The MediaPipe landmarker cannot be pickled, it is recreated instead.
+        state = self.__dict__.copy()
+        del state["landmarker"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.landmarker = self._create_landmarker()
+
+    def reset(self) -> None:
+        """Forget the previous frames and the tracked polygon.
 
-    def _process_landmarks(self, frame, results) -> tuple[np.ndarray, np.ndarray]:
-        height, width = frame.shape[:2]
-        coords = get_landmark_coords(results.face_landmarks[0], width, height)[:, :2]
+        The landmarker is kept, so that the model is only loaded once.
+        """
+        super().reset()
+        self._prev_gray = None
+        self._polygon = None
+        self._face_rect = None
+        self._regions = {}
+        self._frames_tracked = 0
+
+    def _process_landmarks(
+        self, results, rect
+    ) -> tuple[np.ndarray, np.ndarray, dict[str, np.ndarray]]:
+        x, y, w, h = rect
+        coords = get_landmark_coords(results.face_landmarks[0], w, h)[:, :2] + (x, y)
         face_rect = get_boundingbox_from_coords(coords)
 
-        mask = contour_to_mask((height, width), coords[self._lower_face])
-        return mask, face_rect
+        polygon = coords[self._lower_face]
+        regions = {name: coords[p] for name, p in (self.regions or {}).items()}
+        return face_rect, polygon, regions
 
-    def detect(self, frame: np.ndarray) -> RegionOfInterest:
-        """Find face landmarks and create ROI around the lower face region."""
-        rawimg = frame.copy()
-        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=frame)
+    def _find_landmarks(self, frame: np.ndarray, full_frame=False):
+        img, rect = self.inference_input(frame, full_frame=full_frame)
+        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=img)
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
             results = self.landmarker.detect_for_video(
-                mp_image, int(time.perf_counter() * 1000)
+                mp_image, self._next_timestamp_ms()
             )
+        return results, rect
+
+    def _track(self, gray: np.ndarray) -> bool:
+        """Move the previous ROI polygon along with the optical flow."""
+        if (
+            self._prev_gray is None
+            or self._polygon is None
+            or self._face_rect is None
+            or self._frames_tracked + 1 >= self.detect_interval
+        ):
+            return False
+        points, quality = track_points(self._prev_gray, gray, self._polygon)
+        if quality < self.min_tracking_quality:
+            return False
+
+        shift = np.median(points - self._polygon, axis=0)
+        self._face_rect = self._face_rect + np.r_[shift, 0, 0]
+        self._regions = {name: p + shift for name, p in self._regions.items()}
+        self._polygon = points
+        self._prev_gray = gray
+        self._frames_tracked += 1
+        return True
+
+    def detect(self, frame: np.ndarray) -> RegionOfInterest:
+        """Find face landmarks and create ROI around the lower face region."""
+        rawimg = frame.copy()
+        gray = None
+        if self.detect_interval > 1:
+            bgr = self.channel_order == "bgr"
+            gray = cv2.cvtColor(
+                frame, cv2.COLOR_BGR2GRAY if bgr else cv2.COLOR_RGB2GRAY
+            )
+            if self._track(gray):
+                roi = self._make_roi(
+                    rawimg, self._polygon, self._face_rect, self._regions
+                )
+                self._last_face_rect = roi.face_rect
+                if self.record_to is not None:
+                    self.record_to.append(None)
+                return roi
+
+        results, rect = self._find_landmarks(frame)
+        if len(results.face_landmarks) < 1 and rect[2:] != frame.shape[1::-1]:
+            # face may have left the cropped region, search the entire frame.
+            results, rect = self._find_landmarks(frame, full_frame=True)
+
+        if self.record_to is not None:
+            self.record_to.append(_landmark_array(results, rect))
 
         if len(results.face_landmarks) < 1:
-            return RegionOfInterest(np.zeros_like(frame), baseimg=frame)
+            self._polygon = None
+            self._last_face_rect = None
+            empty = np.zeros((0, 0), dtype=np.uint8)
+            return RegionOfInterest(
+                empty,
+                baseimg=frame,
+                mask_rect=(0, 0, 0, 0),
+                channel_order=self.channel_order,
+            )
 
         if self.draw_landmarks:
-            self.draw_facemesh(frame, results.face_landmarks[0], tesselate=True)
+            x, y, w, h = rect
+            self.draw_facemesh(
+                frame[y : y + h, x : x + w], results.face_landmarks[0], tesselate=True
+            )
 
-        mask, face_rect = self._process_landmarks(frame, results)
-        return RegionOfInterest(mask, baseimg=rawimg, face_rect=tuple(face_rect))
+        face_rect, polygon, regions = self._process_landmarks(results, rect)
+        self._last_face_rect = tuple(face_rect)
+        if gray is not None:
+            self._prev_gray = gray
+            self._polygon = polygon.astype(np.float32)
+            self._face_rect = face_rect.astype(np.float32)
+            self._regions = {k: p.astype(np.float32) for k, p in regions.items()}
+            self._frames_tracked = 0
+        return self._make_roi(rawimg, polygon, face_rect, regions)
+
+    def _make_roi(self, rawimg, polygon, face_rect, regions=None) -> RegionOfInterest:
+        polygon = np.round(polygon).astype(int)
+        mask, mask_rect = contour_to_local_mask(rawimg.shape[:2], polygon)
+        roi = RegionOfInterest(
+            mask,
+            rawimg,
+            face_rect=tuple(int(v) for v in np.round(face_rect)),
+            polygon=polygon,
+            mask_rect=mask_rect,
+            channel_order=self.channel_order,
+        )
+        if regions:
+            regions = {k: np.round(p).astype(int) for k, p in regions.items()}
+            add_region_labels(roi, regions)
+        return roi
 
     def draw_facemesh(
         self,
@@ -152,3 +318,25 @@ class FaceMeshDetector(RoiDetector):
                 landmark_drawing_spec=None,
                 connection_drawing_spec=IRISES_SPEC,
             )
+
+
+def record_landmarks(
+    filename: str | pathlib.Path, path: str | pathlib.Path, **kwargs
+) -> LandmarkStore:
+    """Run the face landmarker on a video and record all landmarks.
+
+    Args:
+        filename: path to the video file.
+        path: prefix of the landmark store files (see `LandmarkStore`).
+        **kwargs: additional arguments for the `FaceMeshDetector`.
+
+    Returns:
+        The landmark store holding one entry per frame of the video.
+    """
+    store = LandmarkStore.create(path, get_video_frame_count(filename))
+    detector = FaceMeshDetector(record_to=store, **kwargs)
+    rgb = detector.channel_order == "rgb"
+    for frame in VideoReader(filename, rgb=rgb, reuse_buffers=True):
+        detector.detect(frame)
+    store.flush()
+    return store
@@ -0,0 +1,232 @@
+"""Record face landmarks to disk and replay them without the landmarker model.
+
+Running MediaPipe's face landmarker over a corpus of videos takes hours, while
+experimenting with different ROI polygons only requires the landmark
+positions. A [`LandmarkStore`][yarppg.roi.landmark_store.LandmarkStore] keeps
+the landmarks of every frame in a memory-mapped `.npy` array of shape
+(N_frames x 478 x 3), together with a vector marking the frames in which a
+face was found. Only the accessed frames are loaded into memory.
+
+Landmarks are recorded by passing a store to the
+[`FaceMeshDetector`][yarppg.FaceMeshDetector] (or with
+[`record_landmarks`][yarppg.roi.facemesh_segmenter.record_landmarks]). The
+[`ReplayDetector`][yarppg.roi.landmark_store.ReplayDetector] then builds the
+ROI from any subset of landmarks, using only the store and the decoded frames:
+
+```python
+store = record_landmarks("video.mp4", "video_landmarks")
+forehead = ReplayDetector(store, polygon=[67, 109, 10, 338, 297, 336, 9, 107])
+results = yarppg.Rppg(forehead).process_video("video.mp4")
+```
+"""
+
+import os
+import pathlib
+from typing import Sequence
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from ..containers import RegionOfInterest
+from .detector import RoiDetector
+from .roi_tools import contour_to_local_mask, contours_to_local_labels
+
+N_LANDMARKS = 478
+"""Number of landmarks provided by MediaPipe's face landmarker."""
+LOWER_FACE = [200, 431, 411, 340, 349, 120, 111, 187, 211]
+"""Landmark indices of the lower face polygon used by `FaceMeshDetector`."""
+FACE_REGIONS = {
+    "forehead": [109, 10, 338, 337, 151, 108],
+    "right_cheek": [117, 118, 101, 36, 205, 187, 123],
+    "left_cheek": [346, 347, 330, 266, 425, 411, 352],
+}
+"""Landmark indices of forehead and cheek polygons (from the subject's view)."""
+
+
+class LandmarkStore:
+    """Memory-mapped storage of the face landmarks of consecutive frames.
+
+    The store consists of two files next to each other: `<path>.landmarks.npy`
+    holds the landmark coordinates (x, y, z) in pixels of the full frame, and
+    `<path>.valid.npy` marks the frames with a detected face. Use `create` to
+    start a new recording. The capacity is doubled if more frames are appended
+    than initially allocated.
+
+    Args:
+        path: common prefix of the two files.
+        mode: memory-map mode, "r" for read-only access or "r+" to modify an
+            existing store. Defaults to "r".
+    """
+
+    def __init__(self, path: str | pathlib.Path, mode: str = "r"):
+        self.path = str(path)
+        self.mode = mode
+        self.landmarks = open_memmap(self.landmarks_file, mode=mode)
+        self.valid = open_memmap(self.valid_file, mode=mode)
+        self.count = len(self.valid)
+        """Number of frames written to the store."""
+
+    @property
+    def landmarks_file(self) -> pathlib.Path:
+        """File holding the (N_frames x N_landmarks x 3) coordinate array."""
+        return pathlib.Path(self.path + ".landmarks.npy")
+
+    @property
+    def valid_file(self) -> pathlib.Path:
+        """File holding the (N_frames,) validity vector."""
+        return pathlib.Path(self.path + ".valid.npy")
+
+    @classmethod
+    def create(
+        cls,
+        path: str | pathlib.Path,
+        n_frames: int,
+        n_landmarks: int = N_LANDMARKS,
+    ) -> "LandmarkStore":
+        """Create a new, empty store with room for `n_frames` frames."""
+        _allocate(str(path), max(n_frames, 1), n_landmarks)
+        store = cls(path, mode="r+")
+        store.count = 0
+        return store
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> np.ndarray | None:
+        """Get the landmarks of the given frame (None if no face was found)."""
+        if not 0 <= index < self.count or not self.valid[index]:
+            return None
+        return np.asarray(self.landmarks[index])
+
+    def append(self, landmarks: np.ndarray | None) -> None:
+        """Write the landmarks of the next frame (None if no face was found)."""
+        if self.count == len(self.valid):
+            self._grow()
+        if landmarks is not None:
+            self.landmarks[self.count] = landmarks
+        self.valid[self.count] = landmarks is not None
+        self.count += 1
+
+    def _grow(self) -> None:
+        n = len(self.valid)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        landmarks, valid = _allocate(tmp, 2 * n, self.landmarks.shape[1])
+        landmarks[:n] = self.landmarks
+        valid[:n] = self.valid
+        landmarks.flush()
+        valid.flush()
+        del self.landmarks, self.valid, landmarks, valid
+        os.replace(tmp + ".landmarks.npy", self.landmarks_file)
+        os.replace(tmp + ".valid.npy", self.valid_file)
+        self.landmarks = open_memmap(self.landmarks_file, mode=self.mode)
+        self.valid = open_memmap(self.valid_file, mode=self.mode)
+
+    def flush(self) -> None:
+        """Write pending changes to disk."""
+        if self.mode != "r":
+            self.landmarks.flush()
+            self.valid.flush()
+
+
+def _allocate(path: str, n_frames: int, n_landmarks: int):
+    landmarks = open_memmap(
+        path + ".landmarks.npy",
+        mode="w+",
+        dtype=np.float32,
+        shape=(n_frames, n_landmarks, 3),
+    )
+    valid = open_memmap(path + ".valid.npy", mode="w+", dtype=bool, shape=(n_frames,))
+    return landmarks, valid
+
+
+class ReplayDetector(RoiDetector):
+    """ROI detector reading face landmarks from a `LandmarkStore`.
+
+    The detector does not load any model. It expects to receive the frames of
+    the recorded video in order, starting with the first frame (see `seek`).
+    [`Rppg.process_video`][yarppg.Rppg.process_video] seeks to the first
+    processed frame automatically, and `reset` rewinds to the first frame.
+    The ROI is the polygon spanned by the selected landmarks, and the face
+    rectangle is the bounding box of all landmarks, as in the
+    [`FaceMeshDetector`][yarppg.FaceMeshDetector].
+
+    Args:
+        store: landmark store, or the path of a store to open.
+        polygon: indices of the landmarks forming the ROI polygon. Defaults to
+            the lower face region (`LOWER_FACE`).
+        regions: additional named regions, given by the indices of their
+            polygon landmarks (e.g., `FACE_REGIONS`). These are provided as a
+            label image in the ROI. Defaults to None.
+        **kwargs: `channel_order` of the frames (see
+            [`RoiDetector`][yarppg.RoiDetector]).
+    """
+
+    def __init__(
+        self,
+        store: LandmarkStore | str | pathlib.Path,
+        polygon: Sequence[int] = LOWER_FACE,
+        regions: dict[str, Sequence[int]] | None = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        if not isinstance(store, LandmarkStore):
+            store = LandmarkStore(store)
+        self.store = store
+        self.path = store.path
+        self.polygon = list(polygon)
+        self.regions = regions and {name: list(p) for name, p in regions.items()}
+        self._index = 0
+
+    def seek(self, index: int = 0) -> None:
+        """Set the index of the frame passed to the next `detect` call."""
+        self._index = index
+
+    def reset(self) -> None:
+        """Rewind to the first frame of the store."""
+        super().reset()
+        self.seek(0)
+
+    def detect(self, frame: np.ndarray) -> RegionOfInterest:
+        """Create the ROI from the stored landmarks of the next frame."""
+        landmarks = self.store[self._index]
+        self._index += 1
+        if landmarks is None:
+            self._last_face_rect = None
+            empty = np.zeros((0, 0), dtype=np.uint8)
+            return RegionOfInterest(
+                empty,
+                baseimg=frame,
+                mask_rect=(0, 0, 0, 0),
+                channel_order=self.channel_order,
+            )
+
+        coords = landmarks[:, :2].astype(int)
+        xy = coords.min(axis=0)
+        face_rect = tuple(int(v) for v in np.r_[xy, coords.max(axis=0) - xy])
+        polygon = coords[self.polygon]
+        mask, mask_rect = contour_to_local_mask(frame.shape[:2], polygon)
+        self._last_face_rect = face_rect
+        roi = RegionOfInterest(
+            mask,
+            frame.copy(),
+            face_rect=face_rect,
+            polygon=polygon,
+            mask_rect=mask_rect,
+            channel_order=self.channel_order,
+        )
+        if self.regions:
+            polygons = [coords[p] for p in self.regions.values()]
+            add_region_labels(roi, dict(zip(self.regions, polygons)))
+        return roi
+
+
+def add_region_labels(
+    roi: RegionOfInterest, polygons: dict[str, np.ndarray]
+) -> RegionOfInterest:
+    """Add the label image of the named region polygons to the ROI."""
+    labels, rect = contours_to_local_labels(
+        roi.baseimg.shape[:2], list(polygons.values())
+    )
+    roi.labels, roi.labels_rect = labels, rect
+    roi.region_names = tuple(polygons)
+    return roi
@@ -42,6 +42,101 @@ def contour_to_mask(size: tuple[int, int], points: ArrayLike) -> np.ndarray:
     return cv2.drawContours(mask, contours, 0, color=1, thickness=cv2.FILLED)  # type: ignore
 
 
+def track_points(
+    prev_gray: np.ndarray,
+    gray: np.ndarray,
+    points: np.ndarray,
+    max_error: float = 1.0,
+) -> tuple[np.ndarray, float]:
+    """Track points between two grayscale images with sparse optical flow.
+
+    Points are tracked with the pyramidal Lucas-Kanade method
+    (`cv2.calcOpticalFlowPyrLK`) from the previous to the current image and
+    back again. A point is tracked reliably, if it returns to within
+    `max_error` pixels of its original position. Unreliable points are moved
+    by the median displacement of the reliable ones.
+
+    Args:
+        prev_gray: previous grayscale image.
+        gray: current grayscale image.
+        points: (n x 2)-array of point coordinates in the previous image.
+        max_error: maximum forward-backward error in pixels. Defaults to 1.
+
+    Returns:
+        The new point coordinates (as float32) and the fraction of reliably
+        tracked points (tracking quality between 0 and 1).
+    """
+    prev_pts = np.asarray(points, dtype=np.float32).reshape(-1, 1, 2)
+    pts, status, _ = cv2.calcOpticalFlowPyrLK(
+        prev_gray, gray, prev_pts, None, winSize=(21, 21), maxLevel=3
+    )
+    back, back_status, _ = cv2.calcOpticalFlowPyrLK(
+        gray, prev_gray, pts, None, winSize=(21, 21), maxLevel=3
+    )
+    fb_error = np.linalg.norm(back - prev_pts, axis=-1).ravel()
+    good = (status.ravel() == 1) & (back_status.ravel() == 1) & (fb_error < max_error)
+
+    prev_pts, pts = prev_pts.reshape(-1, 2), pts.reshape(-1, 2)
+    if not np.any(good):
+        return prev_pts, 0.0
+    shift = np.median(pts[good] - prev_pts[good], axis=0)
+    pts[~good] = prev_pts[~good] + shift
+    return pts, float(np.mean(good))
+
+
+def contour_to_local_mask(
+    size: tuple[int, int], points: ArrayLike
+) -> tuple[np.ndarray, tuple[int, int, int, int]]:
+    """Create a binary mask covering only the bounding box of the given polygon.
+
+    Args:
+        size: height and width of the target image.
+        points: list of polygon coordinates.
+
+    Returns:
+        The binary mask filled inside the polygon and the bounding box
+        (x, y, w, h) of the polygon within the image, i.e., the image region
+        the mask refers to.
+    """
+    points = np.asarray(points, dtype=np.int32)
+    x, y, w, h = cv2.boundingRect(points)
+    x1, y1 = max(x, 0), max(y, 0)
+    x2, y2 = min(x + w, size[1]), min(y + h, size[0])
+    if x2 <= x1 or y2 <= y1:
+        return np.zeros((0, 0), dtype="uint8"), (0, 0, 0, 0)
+    mask = contour_to_mask((y2 - y1, x2 - x1), points - (x1, y1))
+    return mask, (x1, y1, x2 - x1, y2 - y1)
+
+
+def contours_to_local_labels(
+    size: tuple[int, int], polygons: list[ArrayLike]
+) -> tuple[np.ndarray, tuple[int, int, int, int]]:
+    """Create a label image covering only the bounding box of all polygons.
+
+    Pixels inside the i-th polygon are labeled `i + 1`, all other pixels are 0.
+    Where polygons overlap, the later polygon wins.
+
+    Args:
+        size: height and width of the target image.
+        polygons: list of polygons, each given as a list of coordinates.
+
+    Returns:
+        The label image and the bounding box (x, y, w, h) of all polygons
+        within the image, i.e., the image region the labels refer to.
+    """
+    polygons = [np.asarray(points, dtype=np.int32) for points in polygons]
+    x, y, w, h = cv2.boundingRect(np.concatenate(polygons))
+    x1, y1 = max(x, 0), max(y, 0)
+    x2, y2 = min(x + w, size[1]), min(y + h, size[0])
+    if x2 <= x1 or y2 <= y1:
+        return np.zeros((0, 0), dtype="uint8"), (0, 0, 0, 0)
+    labels = np.zeros((y2 - y1, x2 - x1), dtype="uint8")
+    for label, points in enumerate(polygons, start=1):
+        contours = np.reshape(points - (x1, y1), (1, -1, 1, 2))
+        cv2.drawContours(labels, contours, 0, color=label, thickness=cv2.FILLED)
+    return labels, (x1, y1, x2 - x1, y2 - y1)
+
+
 def overlay_mask(
     img: np.ndarray,
     mask: np.ndarray,
@@ -66,9 +161,137 @@ def overlay_mask(
     return cv2.addWeighted(overlay, alpha, img, 1 - alpha, 0)
 
 
-def masked_average(frame: np.ndarray, mask: np.ndarray) -> Color:
-    """Calculate average color of the masked region."""
-    if mask.sum() == 0:
+def masked_average(
+    frame: np.ndarray,
+    mask: np.ndarray,
+    rect: tuple[int, int, int, int] | None = None,
+    channel_order: str = "rgb",
+) -> Color:
+    """Calculate average color of the masked region.
+
+    Args:
+        frame: image to average.
+        mask: binary mask of the region.
+        rect: region (x, y, w, h) of the frame covered by the mask. Defaults to
+            None, meaning that the mask covers the full frame.
+        channel_order: channel order of the frame, "rgb" or "bgr". The average
+            is always returned as RGB color. Defaults to "rgb".
+    """
+    if rect is not None:
+        x, y, w, h = rect
+        frame = frame[y : y + h, x : x + w]
+    if mask.size == 0 or cv2.countNonZero(mask) == 0:
         return Color.null()
-    r, g, b, _ = cv2.mean(frame, mask)
-    return Color(r, g, b)
+    c0, g, c2, _ = cv2.mean(frame, mask)
+    return Color.from_channels(c0, g, c2, channel_order)
+
+
+def masked_averages(
+    frame: np.ndarray,
+    labels: np.ndarray,
+    n_labels: int,
+    rect: tuple[int, int, int, int] | None = None,
+    channel_order: str = "rgb",
+) -> np.ndarray:
+    """Calculate the average colors of all labeled regions in one pass.
+
+    Instead of one `masked_average` call per region, the pixel sums and counts
+    of all labels are accumulated together with `np.bincount`.
+
+    Args:
+        frame: image to average.
+        labels: integer label image, with 0 marking pixels outside all regions
+            and 1 to `n_labels` marking the regions.
+        n_labels: number of regions.
+        rect: region (x, y, w, h) of the frame covered by the labels. Defaults
+            to None, meaning that the labels cover the full frame.
+        channel_order: channel order of the frame, "rgb" or "bgr". Defaults
+            to "rgb".
+
+    Returns:
+        (n_labels x 3)-array of average RGB colors, NaN for empty regions.
+    """
+    if rect is not None:
+        x, y, w, h = rect
+        frame = frame[y : y + h, x : x + w]
+    if labels.size == 0:
+        return np.full((n_labels, 3), np.nan)
+    flat = labels.ravel()
+    pixels = frame.reshape(flat.size, -1)
+    counts = np.bincount(flat, minlength=n_labels + 1)[1 : n_labels + 1]
+    sums = np.column_stack(
+        [
+            np.bincount(flat, weights=pixels[:, c], minlength=n_labels + 1)
+            for c in range(3)
+        ]
+    )[1 : n_labels + 1]
+    if channel_order == "bgr":
+        sums = sums[:, ::-1]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return sums / counts[:, np.newaxis]
+
+
+def patch_grid(
+    frame: np.ndarray,
+    rect: tuple[int, int, int, int],
+    grid: int = 8,
+    mask: np.ndarray | None = None,
+    mask_rect: tuple[int, int, int, int] | None = None,
+    channel_order: str = "rgb",
+) -> np.ndarray:
+    """Calculate the average colors of a grid of patches covering a rectangle.
+
+    All patch sums are read from one summed-area table (`cv2.integral`) of the
+    region, which is much cheaper than averaging each patch with its own mask.
+    If a mask is given, only masked pixels contribute to the patch averages.
+
+    Args:
+        frame: image to average.
+        rect: region (x, y, w, h) of the frame divided into patches, e.g., the
+            face rectangle.
+        grid: number of patches along each side. Defaults to 8.
+        mask: binary mask of the pixels to include. Defaults to None (all
+            pixels).
+        mask_rect: region (x, y, w, h) of the frame covered by the mask.
+            Defaults to None, meaning that the mask covers the full frame.
+        channel_order: channel order of the frame, "rgb" or "bgr". Defaults
+            to "rgb".
+
+    Returns:
+        (grid x grid x 3)-array of average RGB colors, NaN for patches without
+        any (masked) pixels.
+    """
+    x, y, w, h = rect
+    x1, y1 = max(x, 0), max(y, 0)
+    x2, y2 = min(x + w, frame.shape[1]), min(y + h, frame.shape[0])
+    if x2 - x1 < grid or y2 - y1 < grid:
+        return np.full((grid, grid, 3), np.nan)
+    crop = frame[y1:y2, x1:x2]
+    rows = np.linspace(0, y2 - y1, grid + 1).round().astype(int)
+    cols = np.linspace(0, x2 - x1, grid + 1).round().astype(int)
+
+    if mask is None:
+        counts = np.outer(np.diff(rows), np.diff(cols))
+    else:
+        weights = np.zeros(crop.shape[:2], dtype=np.uint8)
+        mx, my = mask_rect[:2] if mask_rect is not None else (0, 0)
+        ox1, oy1 = max(x1, mx), max(y1, my)
+        ox2, oy2 = min(x2, mx + mask.shape[1]), min(y2, my + mask.shape[0])
+        if ox2 > ox1 and oy2 > oy1:
+            weights[oy1 - y1 : oy2 - y1, ox1 - x1 : ox2 - x1] = mask[
+                oy1 - my : oy2 - my, ox1 - mx : ox2 - mx
+            ]
+        cv2.threshold(weights, 0, 1, cv2.THRESH_BINARY, dst=weights)
+        crop = cv2.bitwise_and(crop, crop, mask=weights)
+        counts = _grid_sums(cv2.integral(weights), rows, cols)
+    sums = _grid_sums(cv2.integral(crop), rows, cols)
+    if channel_order == "bgr":
+        sums = sums[..., ::-1]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return sums / counts[..., np.newaxis]
+
+
+def _grid_sums(table: np.ndarray, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+    """Get the sums of all grid cells from a summed-area table."""
+    corners = table[np.ix_(rows, cols)].astype(float)
+    return corners[1:, 1:] - corners[:-1, 1:] - corners[1:, :-1] + corners[:-1, :-1]
@@ -1,14 +1,16 @@
 """Detect the face skin region with MediaPipe's selfie segmentation.
 
 This method is very slow (150-200ms per frame) and will not properly work in
-a real-time setting. `FaceMeshDetector` should be used instead.
+a real-time setting. `FaceMeshDetector` should be used instead. Running the
+segmenter on a downscaled input (`scale`) or on a crop around the previous face
+(`crop_margin`) reduces the cost considerably (see
+[`RoiDetector`][yarppg.RoiDetector]).
 
 More information on the selfie segmenter can be found here:
 <https://ai.google.dev/edge/mediapipe/solutions/vision/image_segmenter#multiclass-model>
 """
 
-import time
-
+import cv2
 import mediapipe as mp
 import numpy as np
 
@@ -32,7 +34,10 @@ class SelfieDetector(RoiDetector):
     def __init__(self, confidence=0.5, **kwargs):
         super().__init__(**kwargs)
         self.confidence = confidence
+        self.segmenter = self._create_segmenter()
 
+    @staticmethod
+    def _create_segmenter():
         modelpath = get_selfie_segmenter_modelfile()
         if modelpath is None:
             raise FileNotFoundError("Could not find or download segmenter model file.")
@@ -41,24 +46,57 @@ class SelfieDetector(RoiDetector):
         segmenter_options = mp.tasks.vision.ImageSegmenterOptions(
             base_options=base_options, running_mode=mp.tasks.vision.RunningMode.VIDEO
         )
-        self.segmenter = mp.tasks.vision.ImageSegmenter.create_from_options(
-            segmenter_options
-        )
+        return mp.tasks.vision.ImageSegmenter.create_from_options(segmenter_options)
 
     def __del__(self):
-        self.segmenter.close()
+        if hasattr(self, "segmenter"):
+            self.segmenter.close()
+
+    def __getstate__(self):
+        # The MediaPipe segmenter cannot be pickled, it is recreated instead.
+        state = self.__dict__.copy()
+        del state["segmenter"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.segmenter = self._create_segmenter()
+
+    def _segment(self, frame: np.ndarray, full_frame=False):
+        img, rect = self.inference_input(frame, full_frame=full_frame)
+        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=img)
+        results = self.segmenter.segment_for_video(mp_image, self._next_timestamp_ms())
+
+        x, y, w, h = rect
+        masks = []
+        for index in [3, 0]:  # face skin and background
+            confidence = results.confidence_masks[index].numpy_view()
+            if confidence.shape[:2] != (h, w):
+                confidence = cv2.resize(confidence, (w, h))
+            mask = np.zeros(frame.shape[:2], dtype=np.uint8)
+            mask[y : y + h, x : x + w] = confidence > self.confidence
+            masks.append(mask)
+        return masks[0], masks[1], rect
 
     def detect(self, frame: np.ndarray) -> RegionOfInterest:
-        """Identify face skin region and background in the given image."""
-        rawimg = frame.copy()
-        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=frame)
+        """Identify face skin region and background in the given image.
 
-        results = self.segmenter.segment_for_video(
-            mp_image, int(time.perf_counter() * 1000)
-        )
-
-        face_mask = results.confidence_masks[3].numpy_view() > self.confidence
-        bg_mask = results.confidence_masks[0].numpy_view() > self.confidence
+        If the model input is cropped around the previous face (`crop_margin`),
+        the background mask only covers the cropped region.
+        """
+        rawimg = frame.copy()
+        face_mask, bg_mask, rect = self._segment(frame)
+        if not face_mask.any() and rect[2:] != frame.shape[1::-1]:
+            face_mask, bg_mask, rect = self._segment(frame, full_frame=True)
+
+        face_rect = None
+        if face_mask.any():
+            face_rect = tuple(cv2.boundingRect(face_mask))
+        self._last_face_rect = face_rect
         return RegionOfInterest(
-            face_mask.astype(np.uint8), baseimg=rawimg, bg_mask=bg_mask.astype(np.uint8)
+            face_mask,
+            baseimg=rawimg,
+            bg_mask=bg_mask,
+            face_rect=face_rect,
+            channel_order=self.channel_order,
         )
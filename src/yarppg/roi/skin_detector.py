@@ -0,0 +1,198 @@
+"""Detect skin pixels with a fixed color range, without any learned model.
+
+Skin tones cluster in a compact range of the chrominance channels (Cr, Cb) of
+the YCrCb color space, largely independent of the brightness (Y)[^1]. The
+[`SkinDetector`][yarppg.roi.skin_detector.SkinDetector] marks all pixels
+within this range as ROI. Since the range is a box in YCrCb space, the test is
+separable into per-channel thresholds and runs as a single `cv2.inRange` call
+on the converted image.
+
+To exclude skin-colored background and other body parts, the search can be
+limited to the bounding box of a face found by one of OpenCV's bundled Haar
+cascades (`cv2.data.haarcascades`). Both steps run on the CPU without any
+downloads and take only a few milliseconds per HD frame.
+
+[^1]: D. Chai and K. N. Ngan, "Face segmentation using skin-color map in
+    videophone applications", IEEE Transactions on Circuits and Systems for
+    Video Technology, 9(4), pp. 551-564, 1999
+    [doi:10.1109/76.767122](https://doi.org/10.1109/76.767122)
+"""
+
+from typing import Literal
+
+import cv2
+import numpy as np
+
+from ..containers import RegionOfInterest
+from .detector import RoiDetector
+
+FACE_CASCADE = "haarcascade_frontalface_default.xml"
+_TARGET_FACE_SIZE = 96  # face size (px) in the cascade input when tracking
+
+
+class SkinDetector(RoiDetector):
+    """Model-free ROI detector, selecting skin-colored pixels.
+
+    The face cascade runs on the (downscaled, see `scale`) model input every
+    `detect_interval` frames. In between, the previous face rectangle is
+    reused. The skin mask is always computed from the full-resolution pixels
+    inside the face rectangle and returned in compact form (see
+    [`RegionOfInterest.mask_rect`][yarppg.RegionOfInterest.mask_rect]).
+
+    Args:
+        cr_range: inclusive range of skin values in the Cr channel. Defaults
+            to (133, 173).
+        cb_range: inclusive range of skin values in the Cb channel. Defaults
+            to (77, 127).
+        face_cascade: limit the skin mask to the face found by a Haar cascade.
+            If False, the whole frame is searched for skin. Defaults to True.
+        detect_interval: run the face cascade every n frames. Defaults to 5.
+        min_face_size: minimum size of the face relative to the smaller side
+            of the frame. Defaults to 0.2.
+        scale: factor by which the cascade input is resized. Defaults to 0.25.
+        crop_margin: run the cascade on a crop around the previous face,
+            enlarged by this fraction of its size on each side (see
+            [`RoiDetector`][yarppg.RoiDetector]). Only faces of similar size
+            as before are searched in the crop, which is downscaled further
+            for large faces. Defaults to 0.5.
+        channel_order: channel order of the input frames, "rgb" or "bgr".
+            Defaults to "rgb".
+    """
+
+    def __init__(
+        self,
+        cr_range: tuple[int, int] = (133, 173),
+        cb_range: tuple[int, int] = (77, 127),
+        face_cascade: bool = True,
+        detect_interval: int = 5,
+        min_face_size: float = 0.2,
+        scale: float = 0.25,
+        crop_margin: float | None = 0.5,
+        channel_order: Literal["rgb", "bgr"] = "rgb",
+    ):
+        super().__init__(scale, crop_margin, channel_order)
+        self.cr_range = tuple(cr_range)
+        self.cb_range = tuple(cb_range)
+        self.face_cascade = face_cascade
+        self.detect_interval = detect_interval
+        self.min_face_size = min_face_size
+
+        self._lower = np.array([0, cr_range[0], cb_range[0]], dtype=np.uint8)
+        self._upper = np.array([255, cr_range[1], cb_range[1]], dtype=np.uint8)
+        self._cascade = self._create_cascade() if face_cascade else None
+        self._frames_since_detection = 0
+
+    @staticmethod
+    def _create_cascade():
+        cascade = cv2.CascadeClassifier(cv2.data.haarcascades + FACE_CASCADE)  # type: ignore
+        if cascade.empty():
+            raise FileNotFoundError(f"Could not load OpenCV's {FACE_CASCADE}.")
+        return cascade
+
+    def __getstate__(self):
+        # OpenCV's cascade classifier cannot be pickled, it is recreated instead.
+        state = self.__dict__.copy()
+        state["_cascade"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.face_cascade:
+            self._cascade = self._create_cascade()
+
+    def reset(self) -> None:
+        """Forget the previous face, so that the next frame is searched again."""
+        super().reset()
+        self._frames_since_detection = 0
+
+    def _color_code(self, target: str) -> int:
+        return getattr(cv2, f"COLOR_{self.channel_order.upper()}2{target}")
+
+    def _find_face(
+        self, frame: np.ndarray, full_frame=False
+    ) -> tuple[int, int, int, int] | None:
+        height, width = frame.shape[:2]
+        x, y, w, h = (0, 0, width, height) if full_frame else self.crop_rect(frame)
+        scale = self.scale
+        min_size, max_size = self.min_face_size * min(height, width), max(h, w)
+        if self._last_face_rect is not None and (w, h) != (width, height):
+            # search for a face of similar size, at the lowest useful resolution
+            size = max(self._last_face_rect[2:])
+            min_size, max_size = max(0.7 * size, min_size), 1.4 * size
+            scale = min(scale, _TARGET_FACE_SIZE / size)
+        img = cv2.resize(
+            frame[y : y + h, x : x + w],
+            (max(round(w * scale), 1), max(round(h * scale), 1)),
+            interpolation=cv2.INTER_LINEAR,
+        )
+        min_size = max(int(min_size * scale), 24)
+        max_size = max(int(max_size * scale), min_size + 1)
+        faces = self._cascade.detectMultiScale(  # type: ignore
+            cv2.cvtColor(img, self._color_code("GRAY")),
+            scaleFactor=1.1,
+            minNeighbors=5,
+            minSize=(min_size, min_size),
+            maxSize=(max_size, max_size),
+        )
+        if len(faces) == 0:
+            return None
+        fx, fy, fw, fh = max(faces, key=lambda f: f[2] * f[3]) / scale
+        return int(x + fx), int(y + fy), int(fw), int(fh)
+
+    def _face_rect(self, frame: np.ndarray) -> tuple[int, int, int, int] | None:
+        if (
+            self._last_face_rect is not None
+            and self._frames_since_detection + 1 < self.detect_interval
+        ):
+            self._frames_since_detection += 1
+            return self._last_face_rect
+        self._frames_since_detection = 0
+        rect = self._find_face(frame)
+        if rect is None and self._last_face_rect is not None:
+            # face may have left the cropped region, search the entire frame.
+            rect = self._find_face(frame, full_frame=True)
+        return rect
+
+    def skin_mask(self, img: np.ndarray) -> np.ndarray:
+        """Get the binary mask of skin-colored pixels in the image."""
+        ycrcb = cv2.cvtColor(img, self._color_code("YCrCb"))
+        mask = cv2.inRange(ycrcb, self._lower, self._upper)
+        return cv2.threshold(mask, 0, 1, cv2.THRESH_BINARY, dst=mask)[1]
+
+    def detect(self, frame: np.ndarray) -> RegionOfInterest:
+        """Find skin pixels in the face region (or the entire frame)."""
+        if self._cascade is None:
+            mask = self.skin_mask(frame)
+            face_rect = None
+            if mask.any():
+                face_rect = tuple(cv2.boundingRect(mask))
+            self._last_face_rect = face_rect
+            return RegionOfInterest(
+                mask,
+                baseimg=frame,
+                face_rect=face_rect,
+                channel_order=self.channel_order,
+            )
+
+        rect = self._face_rect(frame)
+        self._last_face_rect = rect
+        if rect is None:
+            empty = np.zeros((0, 0), dtype=np.uint8)
+            return RegionOfInterest(
+                empty,
+                baseimg=frame,
+                mask_rect=(0, 0, 0, 0),
+                channel_order=self.channel_order,
+            )
+
+        x, y, w, h = rect
+        x1, y1 = max(x, 0), max(y, 0)
+        x2, y2 = min(x + w, frame.shape[1]), min(y + h, frame.shape[0])
+        mask = self.skin_mask(frame[y1:y2, x1:x2])
+        return RegionOfInterest(
+            mask,
+            baseimg=frame,
+            face_rect=rect,
+            mask_rect=(x1, y1, x2 - x1, y2 - y1),
+            channel_order=self.channel_order,
+        )
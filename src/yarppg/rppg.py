@@ -11,6 +11,11 @@ steps from above in order and produces an [yarppg.containers.RppgResult][] that
 holds the extracted rPPG signal value as well as the frame, ROI and some
 additional information.
 
+With `resample=True`, the mean colors are interpolated at a fixed rate `fps`
+based on the frame timestamps, before signal extraction and HR estimation
+(see [`Resampler`][yarppg.Resampler]). Frames can then be skipped to save CPU
+or arrive at irregular times without distorting filters and HR estimates.
+
 ```python
 import yarppg
 
@@ -23,16 +28,25 @@ print(result.hr)
 
 """
 
+import concurrent.futures
+import dataclasses
+import functools
+import itertools
 import pathlib
-from typing import Literal, overload
+import time
+from typing import Iterable, Iterator, Literal, overload
 
 import numpy as np
 import pandas as pd
 import scipy.signal
 
-from . import digital_filter, helpers, hr_calculator, processors, roi
-from .containers import RppgResult
+from . import digital_filter, helpers, hr_calculator, pipeline, processors, roi
+from .containers import Color, RegionOfInterest, RoiSummary, RppgResult, RppgResultTable
+from .load_control import LoadController
+from .processors.processor import roi_colors
+from .resampling import Resampler
 from .settings import Settings
+from .trace_cache import RoiTrace, TraceCache
 
 
 class Rppg:
@@ -49,6 +63,15 @@ class Rppg:
        processor: rPPG signal extraction algorithm.
        hr_calc: heart rate calculation algorithm.
        fps: expected frames per second of the camera/video
+       resample: resample the mean colors at `fps` based on the frame
+           timestamps. HR estimates are then given in frames per beat at
+           `fps`, no matter how many frames are actually processed. Only the
+           ROI signal is computed, labeled regions and patches are ignored.
+           Defaults to False.
+       load_controller: if given, adapts the detector's settings and skips
+           frames in `process_frame` to hold its target frame rate (see
+           [`LoadController`][yarppg.LoadController]). Skipping frames
+           requires `resample=True`. Defaults to None.
     """
 
     def __init__(
@@ -57,45 +80,320 @@ class Rppg:
         processor: processors.Processor | None = None,
         hr_calc: hr_calculator.HrCalculator | None = None,
         fps: float = 30,
+        resample: bool = False,
+        load_controller: LoadController | None = None,
     ):
         self.roi_detector = roi_detector or roi.FaceMeshDetector()
         self.processor = processor or processors.Processor()
         self.hr_calculator = hr_calc or hr_calculator.PeakBasedHrCalculator(fps)
+        self.fps = fps
+        self.resampler = Resampler(fps) if resample else None
+        self._last_value = self._last_hr = np.nan
+
+        self.load_controller = load_controller
+        self._last_result: RppgResult | None = None
+        if load_controller is not None:
+            if load_controller.skips_frames and not resample:
+                raise ValueError("Skipping frames requires resampling (resample=True).")
+            load_controller.attach(self.roi_detector)
+
+    def process_frame(
+        self, frame: np.ndarray, lightweight=False, timestamp: float | None = None
+    ) -> RppgResult:
+        """Process a single frame from video or live stream.
+
+        Args:
+            frame: (h x w x 3)-image array.
+            lightweight: if True, the frame and masks are dropped from the result
+                and only a [`RoiSummary`][yarppg.RoiSummary] is kept. Defaults
+                to False.
+            timestamp: capture time of the frame (or its position in the video)
+                in seconds. Defaults to the current time (`time.perf_counter`).
+
+        If the load controller decides to skip the frame, the previous result
+        is returned again, with the timestamp of the skipped frame.
+        """
+        if timestamp is None:
+            timestamp = time.perf_counter()
+        controller = self.load_controller
+        if controller is None:
+            return self._process_frame(frame, lightweight, timestamp)
 
-    def process_frame(self, frame: np.ndarray) -> RppgResult:
-        """Process a single frame from video or live stream."""
-        roi = self.roi_detector.detect(frame)
-        result = self.processor.process(roi)
-        result.hr = self.hr_calculator.update(result.value)
+        if not controller.should_process() and self._last_result is not None:
+            return dataclasses.replace(self._last_result, timestamp=timestamp)
+        start = time.perf_counter()
+        roi = self.roi_detector.detect_at(frame, timestamp)
+        detected = time.perf_counter()
+        result = self._extract(roi, lightweight, timestamp)
+        controller.update(
+            {"detect": detected - start, "extract": time.perf_counter() - detected}
+        )
+        self._last_result = result
+        return result
+
+    def _process_frame(
+        self, frame: np.ndarray, lightweight: bool, timestamp: float
+    ) -> RppgResult:
+        roi = self.roi_detector.detect_at(frame, timestamp)
+        return self._extract(roi, lightweight, timestamp)
+
+    def _extract(
+        self, roi: RegionOfInterest, lightweight=False, timestamp: float | None = None
+    ) -> RppgResult:
+        if self.resampler is None or timestamp is None:
+            result = self.processor.process(roi)
+            result.hr = self.hr_calculator.update(result.value)
+        else:
+            result = self._extract_resampled(roi, timestamp)
+        result.timestamp = timestamp
 
+        if lightweight:
+            return result.lightweight()
         return result
 
+    def _extract_resampled(self, roi: RegionOfInterest, timestamp: float):
+        """Feed the resampled colors to processor and HR calculator.
+
+        The result holds the latest signal value and HR, which are repeated
+        if no grid point has passed since the previous frame.
+        """
+        roi_mean, bg_mean = roi_colors(roi)
+        colors = np.r_[np.array(roi_mean), np.array(bg_mean)]
+        for sample in self.resampler.update(timestamp, colors):  # type: ignore
+            self._last_value = self.processor.process_color(
+                Color(*sample[:3]), Color(*sample[3:])
+            )
+            self._last_hr = self.hr_calculator.update(self._last_value)
+        return RppgResult(self._last_value, roi, roi_mean, bg_mean, self._last_hr)
+
     @overload
-    def process_video(self, filename: ..., as_dataframe: Literal[True]) -> pd.DataFrame:
+    def process_video(
+        self,
+        filename: ...,
+        as_dataframe: Literal[True],
+        lightweight: bool = ...,
+        pipelined: bool = ...,
+        segments: int = ...,
+        overlap: float = ...,
+        cache: TraceCache | None = ...,
+        stride: int = ...,
+    ) -> pd.DataFrame:
         ...
 
     @overload
     def process_video(
-        self, filename: ..., as_dataframe: Literal[False] = ...
+        self,
+        filename: ...,
+        as_dataframe: Literal[False] = ...,
+        lightweight: bool = ...,
+        pipelined: bool = ...,
+        segments: int = ...,
+        overlap: float = ...,
+        cache: TraceCache | None = ...,
+        stride: int = ...,
     ) -> list[RppgResult]:
         ...
 
-    def process_video(self, filename: str | pathlib.Path, as_dataframe=False):
-        """Convenience function to process an entire video file at once."""
-        results = []
-        for frame in helpers.frames_from_video(filename):
-            result = self.process_frame(frame)
-            if as_dataframe:
-                results.append(result.to_series())
-            else:
-                results.append(result)
+    def process_video(
+        self,
+        filename: str | pathlib.Path,
+        as_dataframe=False,
+        lightweight=False,
+        pipelined=False,
+        segments: int = 1,
+        overlap: float = 15.0,
+        cache: TraceCache | None = None,
+        stride: int = 1,
+    ):
+        """Convenience function to process an entire video file at once.
+
+        Args:
+            filename: path to the video file. Frames are decoded ahead on a
+                background thread and converted to RGB, unless the ROI
+                detector accepts BGR frames (see
+                [`VideoReader`][yarppg.helpers.VideoReader]).
+            as_dataframe: if True, only the scalar values of each result are
+                collected in a [`RppgResultTable`][yarppg.RppgResultTable] and
+                returned as a data frame with one row per frame (see
+                [`RESULT_COLUMNS`][yarppg.containers.RESULT_COLUMNS]).
+                Otherwise, a list of `RppgResult` containers is returned.
+                Defaults to False.
+            lightweight: if True, the returned results do not hold on to the
+                frames and masks (see `process_frame`), so that memory usage
+                does not depend on the video resolution. Defaults to False.
+            pipelined: if True, decoding, ROI detection and signal extraction
+                run concurrently in separate threads (see
+                [`run_pipelined`][yarppg.pipeline.run_pipelined]). The results
+                are identical to the sequential processing. Defaults to False.
+            segments: number of time segments processed in parallel by separate
+                worker processes, each with a copy of this orchestrator. The
+                results are always lightweight in this case. Defaults to 1.
+            overlap: number of seconds processed before each segment (and then
+                discarded) to warm up filters and windows. This should be at
+                least the window length of the HR calculator plus the settling
+                time of the filter. Defaults to 15.
+            cache: if given, the ROI colors of each frame are stored in this
+                [`TraceCache`][yarppg.trace_cache.TraceCache]. If the video was
+                processed with an identically configured detector before, the
+                cached colors are used and decoding and ROI detection are
+                skipped. Defaults to None.
+            stride: process only every n-th frame (the others are skipped
+                without decoding). This requires resampling (see `Rppg`), and
+                cannot be combined with `segments`, `cache`, or a detector
+                replaying recorded landmarks (see
+                [`ReplayDetector`][yarppg.roi.landmark_store.ReplayDetector]).
+                Defaults to 1.
+
+        When processing in segments, each segment starts from a reset state.
+        After the warm-up, windowed computations are identical to a sequential
+        run, while IIR filters only deviate by their decaying initial
+        transient. With the default filter (2nd order, 0.5 Hz cut-off) and
+        overlap, the stitched signal differs from a sequential run by less
+        than 1e-3 of its standard deviation. Accurate results require a video
+        format that supports frame-accurate seeking.
+
+        Results loaded from the cache are always lightweight and hold no
+        polygons. The signal and HR are computed with the vectorized
+        `process_trace` methods of the processor and HR calculator, which match
+        the output of a freshly reset orchestrator.
+
+        Each frame is timestamped with its position in the video. The ROI
+        detector is reset before the first frame, so that it does not track
+        the face of a previous video. The load controller is not used here,
+        all (or every `stride`-th) frames are processed with the detector's
+        current settings.
+        """
+        if stride > 1 and self.resampler is None:
+            raise ValueError("Skipping frames requires resampling (resample=True).")
+        if stride > 1 and (segments > 1 or cache is not None):
+            raise ValueError("Skipping frames is not supported with segments/cache.")
+        if stride > 1 and hasattr(self.roi_detector, "seek"):
+            raise ValueError("Skipping frames is not supported when replaying.")
+
+        trace = key = None
+        if cache is not None:
+            key = cache.key(filename, self.roi_detector)
+            trace = cache.load(key)
+
+        if trace is not None:
+            results = self._results_from_trace(trace)
+        elif segments > 1:
+            results = self._process_segments(filename, segments, overlap, pipelined)
+        else:
+            # frames can only be reused if no result holds on to them
+            reuse = not pipelined and (lightweight or as_dataframe)
+            self.roi_detector.reset()  # new video, rewinds replaying detectors
+            rgb = self.roi_detector.channel_order == "rgb"
+            frames = helpers.VideoReader(
+                filename, stride=stride, rgb=rgb, reuse_buffers=reuse
+            )
+            results = self._iter_results(
+                frames.with_timestamps(), lightweight, pipelined
+            )
+
+        if cache is not None and trace is None:
+            fps = helpers.get_video_fps(filename)
+            results = _record_trace(results, fps, functools.partial(cache.save, key))
+
         if as_dataframe:
-            return pd.concat(results).T
-        return results
+            table = RppgResultTable()
+            for result in results:
+                table.append(result)
+            return table.to_dataframe()
+        return list(results)
+
+    def _iter_results(
+        self,
+        frames: Iterable[tuple[float, np.ndarray]],
+        lightweight=False,
+        pipelined=False,
+    ) -> Iterator[RppgResult]:
+        """Process pairs of timestamp and frame (see `VideoReader.with_timestamps`)."""
+        if not pipelined:
+            return (self._process_frame(frame, lightweight, t) for t, frame in frames)
+
+        def detect(item: tuple[float, np.ndarray]):
+            return item[0], self.roi_detector.detect_at(item[1], item[0])
+
+        def extract(item: tuple[float, RegionOfInterest]):
+            return self._extract(item[1], lightweight, item[0])
+
+        return pipeline.run_pipelined(frames, [detect, extract])
+
+    def _results_from_trace(self, trace: RoiTrace) -> Iterator[RppgResult]:
+        roi_means, bg_means = trace.roi_mean, trace.bg_mean
+        if self.resampler is not None:
+            samples, sources = self.resampler.process_trace(
+                trace.timestamps, np.c_[roi_means, bg_means]
+            )
+            roi_means, bg_means = samples[:, :3], samples[:, 3:]
+        values = self.processor.process_trace(roi_means, bg_means)
+        hrs = self.hr_calculator.process_trace(values)
+        if self.resampler is not None:
+            # each frame holds the latest value computed up to that frame
+            latest = np.searchsorted(sources, np.arange(len(trace)), side="right")
+            values, hrs = np.r_[np.nan, values][latest], np.r_[np.nan, hrs][latest]
+        for value, roi_mean, bg_mean, face_rect, hr, timestamp in zip(
+            values.tolist(),
+            trace.roi_mean.tolist(),
+            trace.bg_mean.tolist(),
+            trace.face_rects(),
+            hrs.tolist(),
+            trace.timestamps.tolist(),
+        ):
+            roi_summary = RoiSummary(face_rect=face_rect)
+            yield RppgResult(
+                value,
+                roi_summary,
+                Color(*roi_mean),
+                Color(*bg_mean),
+                hr,
+                timestamp=timestamp,
+            )
+
+    def _process_segments(
+        self, filename: str | pathlib.Path, segments: int, overlap: float, pipelined
+    ) -> Iterator[RppgResult]:
+        n_frames = helpers.get_video_frame_count(filename)
+        warmup_frames = int(overlap * helpers.get_video_fps(filename))
+        # Start the warm-up in phase with the HR calculator's update interval,
+        # so that HR updates happen at the same frames as in a sequential run.
+        interval = getattr(self.hr_calculator, "update_interval", 1)
+        bounds = np.linspace(0, n_frames, segments + 1).astype(int)
+
+        with concurrent.futures.ProcessPoolExecutor(segments) as executor:
+            futures = []
+            for start, stop in zip(bounds[:-1], bounds[1:]):
+                warm_start = max(0, start - warmup_frames)
+                warm_start -= warm_start % interval
+                futures.append(
+                    executor.submit(
+                        _process_segment,
+                        self,
+                        filename,
+                        warm_start,
+                        None if stop == n_frames else stop,
+                        start - warm_start,
+                        pipelined,
+                    )
+                )
+            for future in futures:
+                yield from future.result()
 
     def reset(self) -> None:
         """Reset internal elements."""
         self.processor.reset()
+        self.hr_calculator.reset()
+        if self.resampler is not None:
+            self.resampler.reset()
+        self.roi_detector.reset()
+        self._last_value = self._last_hr = np.nan
+        self._last_result = None
+
+    def _seek(self, index: int) -> None:
+        """Move a replaying detector to the given frame (see `ReplayDetector`)."""
+        if hasattr(self.roi_detector, "seek"):
+            self.roi_detector.seek(index)
 
     @classmethod
     def from_settings(cls, settings: Settings) -> "Rppg":
@@ -109,4 +407,47 @@ class Rppg:
             else:
                 livefilter = digital_filter.make_digital_filter(settings.filter)
             processor = processors.FilteredProcessor(processor, livefilter)
-        return cls(detector, processor)
+        hr_calc = hr_calculator.calculators[settings.hr_calculator](settings.fps)
+        controller = None
+        if settings.load_control is not None:
+            controller = LoadController.from_config(settings.load_control)
+        return cls(
+            detector,
+            processor,
+            hr_calc,
+            fps=settings.fps,
+            resample=settings.resample or controller is not None,
+            load_controller=controller,
+        )
+
+
+def _record_trace(
+    results: Iterable[RppgResult], fps: float, save
+) -> Iterator[RppgResult]:
+    """Pass on the results and save their trace once all have been consumed."""
+    collected = []
+    for result in results:
+        collected.append(result.lightweight())  # do not keep frames alive
+        yield result
+    save(RoiTrace.from_results(collected, fps))
+
+
+def _process_segment(
+    rppg: Rppg,
+    filename: str | pathlib.Path,
+    start: int,
+    stop: int | None,
+    warmup: int,
+    pipelined: bool,
+) -> list[RppgResult]:
+    """Process frames [start, stop) and discard the first `warmup` results."""
+    rppg.reset()
+    rppg._seek(start)
+    rgb = rppg.roi_detector.channel_order == "rgb"
+    frames = helpers.VideoReader(
+        filename, start, stop, rgb=rgb, reuse_buffers=not pipelined
+    )
+    results = rppg._iter_results(
+        frames.with_timestamps(), lightweight=True, pipelined=pipelined
+    )
+    return list(itertools.islice(results, warmup, None))
@@ -9,6 +9,7 @@ import hydra.core.config_store
 import hydra.utils
 
 from .digital_filter import FilterConfig
+from .load_control import LoadControlConfig
 
 
 @dataclasses.dataclass
@@ -48,6 +49,10 @@ class Settings(HydraSettings):
         default_factory=lambda: FilterConfig(30, 0.5, 2, btype="bandpass")
     )
     algorithm: str = "green"
+    hr_calculator: str = "peak"
+    fps: float = 30
+    resample: bool = False
+    load_control: LoadControlConfig | None = None
     defaults: Any = dataclasses.field(
         default_factory=lambda: [
             {"ui": "simplest"},
@@ -56,6 +61,20 @@ class Settings(HydraSettings):
     )
 
 
+@dataclasses.dataclass
+class BatchSettings(Settings):
+    """Configuration for batch processing of video files (`run-yarppg-batch`)."""
+
+    inputs: list[str] = dataclasses.field(default_factory=list)
+    """Video files or glob patterns to process."""
+    outdir: str = "."
+    """Directory where the results are stored (one CSV file per video)."""
+    workers: int | None = None
+    """Number of worker processes. Uses all CPUs if unspecified."""
+    overwrite: bool = False
+    """Process videos again, even if their output file exists already."""
+
+
 def available_ui_configs():
     """Check availability of UIs and return each corresponding settings container."""
     import yarppg.ui.simplest
@@ -75,6 +94,7 @@ def register_schemas():
     """Register base schema and settings for available UI implementations."""
     cs = hydra.core.config_store.ConfigStore.instance()
     cs.store(name="config", node=Settings)
+    cs.store(name="batch_config", node=BatchSettings)
     for name, cfg_class in available_ui_configs().items():
         cs.store(name=name, node=cfg_class, group="ui")
 
@@ -0,0 +1,202 @@
+"""Cache the color traces extracted from video files on disk.
+
+ROI detection usually dominates the cost of processing a video, while its
+output rarely changes when experimenting with different signal processors,
+filters or HR calculators. A [`TraceCache`][yarppg.trace_cache.TraceCache]
+stores the per-frame ROI and background colors, face rectangles and timestamps
+of a video in a compressed `.npz` file. The cache key combines a hash of the
+video content with the detector class and its parameters (see
+[`RoiDetector.get_params`][yarppg.RoiDetector.get_params]), so that any change
+to the input or the detection invalidates the cached trace.
+
+```python
+cache = yarppg.TraceCache("~/.cache/yarppg", max_bytes=500_000_000)
+rppg = yarppg.Rppg(processor=yarppg.ChromProcessor())
+df = rppg.process_video("video.mp4", as_dataframe=True, cache=cache)
+```
+
+On a cache hit, [`Rppg.process_video`][yarppg.Rppg.process_video] skips
+decoding and ROI detection entirely and computes the signal with the
+processor's vectorized [`process_trace`][yarppg.Processor.process_trace].
+"""
+
+import dataclasses
+import hashlib
+import json
+import os
+import pathlib
+import time
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from .containers import RppgResult
+from .roi import RoiDetector
+
+
+@dataclasses.dataclass
+class RoiTrace:
+    """Per-frame output of the ROI detection stage of a video."""
+
+    roi_mean: np.ndarray
+    """(N, 3) array of mean ROI colors (RGB)."""
+    bg_mean: np.ndarray
+    """(N, 3) array of mean background colors (NaN without background)."""
+    face_rect: np.ndarray
+    """(N, 4) array of face rectangles (x, y, w, h), NaN if no face was found."""
+    timestamps: np.ndarray
+    """(N,) array of frame timestamps in seconds."""
+
+    def __len__(self) -> int:
+        return len(self.roi_mean)
+
+    @classmethod
+    def from_results(cls, results: Iterable[RppgResult], fps: float) -> "RoiTrace":
+        """Collect the trace from the results of consecutive video frames.
+
+        The timestamps are taken from the results. If any result has no
+        timestamp, a constant frame rate `fps` is assumed instead.
+        """
+        roi_mean, bg_mean, face_rect, timestamps = [], [], [], []
+        for result in results:
+            roi_mean.append(np.array(result.roi_mean))
+            bg_mean.append(np.array(result.bg_mean))
+            rect = result.roi.face_rect
+            face_rect.append(np.full(4, np.nan) if rect is None else rect)
+            timestamps.append(np.nan if result.timestamp is None else result.timestamp)
+        n = len(roi_mean)
+        times = np.array(timestamps, dtype=float)
+        if np.isnan(times).any():  # results without timestamps
+            times = np.arange(n) / fps
+        return cls(
+            roi_mean=np.array(roi_mean, dtype=float).reshape(n, 3),
+            bg_mean=np.array(bg_mean, dtype=float).reshape(n, 3),
+            face_rect=np.array(face_rect, dtype=float).reshape(n, 4),
+            timestamps=times,
+        )
+
+    def face_rects(self) -> Iterator[tuple[int, int, int, int] | None]:
+        """Iterate over the face rectangles as tuples (None if not found)."""
+        for rect in self.face_rect:
+            yield None if np.isnan(rect).any() else tuple(int(v) for v in rect)
+
+
+def file_hash(filename: str | pathlib.Path, chunk_size: int = 1 << 20) -> str:
+    """Compute the SHA-256 hash of the file content."""
+    digest = hashlib.sha256()
+    with open(filename, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class TraceCache:
+    """Directory of cached ROI traces with optional size and age limits.
+
+    Every load of a cached trace refreshes its modification time. Entries that
+    have not been used for more than `max_age` seconds are removed, and if the
+    total size exceeds `max_bytes`, the least recently used entries are removed
+    until it fits. Eviction runs whenever a new trace is saved, or when calling
+    `evict` explicitly.
+
+    Args:
+        directory: folder in which the cache files are stored.
+        max_bytes: maximum total size of all cache files. Defaults to None
+            (unlimited).
+        max_age: maximum time in seconds since an entry was last used. Defaults
+            to None (unlimited).
+    """
+
+    suffix = ".trace.npz"
+
+    def __init__(
+        self,
+        directory: str | pathlib.Path,
+        max_bytes: int | None = None,
+        max_age: float | None = None,
+    ):
+        self.directory = pathlib.Path(directory).expanduser()
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._hashes: dict[tuple, str] = {}
+
+    def key(self, filename: str | pathlib.Path, detector: RoiDetector) -> str:
+        """Get the cache key for processing the given video with the detector.
+
+        The content hash is remembered for the file's path, size and
+        modification time, so that it is only computed once per session.
+        """
+        path = pathlib.Path(filename).resolve()
+        stat = path.stat()
+        file_id = (path, stat.st_size, stat.st_mtime_ns)
+        if file_id not in self._hashes:
+            self._hashes[file_id] = file_hash(path)
+        detector_id = json.dumps(
+            [type(detector).__qualname__, detector.get_params()],
+            sort_keys=True,
+            default=str,
+        )
+        digest = hashlib.sha256(self._hashes[file_id].encode())
+        digest.update(detector_id.encode())
+        return digest.hexdigest()
+
+    def path(self, key: str) -> pathlib.Path:
+        """Get the file storing the trace for the given key."""
+        return self.directory / (key + self.suffix)
+
+    def load(self, key: str) -> RoiTrace | None:
+        """Load a cached trace, or return None if there is no (valid) entry."""
+        path = self.path(key)
+        try:
+            with np.load(path) as data:
+                fields = dataclasses.fields(RoiTrace)
+                trace = RoiTrace(**{f.name: data[f.name] for f in fields})
+        except (OSError, KeyError, ValueError):
+            return None
+        path.touch()
+        return trace
+
+    def save(self, key: str, trace: RoiTrace) -> None:
+        """Store a trace in the cache and apply the eviction rules."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path(key)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            np.savez_compressed(f, **dataclasses.asdict(trace))
+        os.replace(tmp, path)  # atomic, readers never see partial files
+        self.evict()
+
+    def entries(self) -> list[pathlib.Path]:
+        """Get all cache files, least recently used first."""
+        if not self.directory.is_dir():
+            return []
+        files = self.directory.glob("*" + self.suffix)
+        return sorted(files, key=lambda p: p.stat().st_mtime)
+
+    def evict(self) -> list[pathlib.Path]:
+        """Remove entries exceeding the age or size limits.
+
+        Returns:
+            The removed cache files.
+        """
+        entries = [(p, p.stat()) for p in self.entries()]
+        removed = []
+        if self.max_age is not None:
+            expired = time.time() - self.max_age
+            removed.extend(p for p, stat in entries if stat.st_mtime < expired)
+        if self.max_bytes is not None:
+            remaining = [(p, stat) for p, stat in entries if p not in removed]
+            total = sum(stat.st_size for _, stat in remaining)
+            for p, stat in remaining:
+                if total <= self.max_bytes:
+                    break
+                removed.append(p)
+                total -= stat.st_size
+        for p in removed:
+            p.unlink(missing_ok=True)
+        return removed
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        for p in self.entries():
+            p.unlink(missing_ok=True)
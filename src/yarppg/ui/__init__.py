@@ -14,7 +14,9 @@ No additional depencies are required for the default interface.
 
 ### Simple Qt6 window
 A small GUI window highlighting the detected ROI and a trace of the extracted
-rPPG signal. Make sure to install extras with:
+rPPG signal. Frames are processed in a worker thread that always picks the
+newest camera frame, so the display does not lag behind if processing is
+slower than the camera. Make sure to install extras with:
 ```bash
 pip install ".[qt6]"
 ```
@@ -7,11 +7,15 @@ from PyQt6.QtCore import QObject, QThread, pyqtSignal
 
 
 class Camera(QThread):
-    """Wraps cv2.VideoCapture and emits Qt signals with frames in RGB format.
+    """Wraps cv2.VideoCapture and emits Qt signals with new frames.
 
     The `run` function launches a loop that waits for new frames in
-    the VideoCapture and emits them with a `new_frame` signal.
-    Calling `stop` stops the loop and releases the camera.
+    the VideoCapture and emits them with a `frame_received` signal. The
+    `frame_captured` signal additionally provides the capture time
+    (`time.perf_counter`) of each frame.
+    Calling `stop` stops the loop and releases the camera. Frames are emitted
+    in RGB format, or in OpenCV's native BGR format if `rgb` is False, which
+    saves converting every full frame.
 
     It is very difficult to set camera properties through OpenCV. Setting
     the `exposure` property may or may not work on your end. Range of required
@@ -25,9 +29,11 @@ class Camera(QThread):
         parent: parent object in Qt context
         delay_frames: delay next read until specified time passed. Defaults to NaN.
         exposure: set fixed exposure instead of auto-exposure. Defaults to None.
+        rgb: convert frames from BGR to RGB before emitting. Defaults to True.
     """
 
     frame_received = pyqtSignal(np.ndarray)
+    frame_captured = pyqtSignal(np.ndarray, float)
 
     def __init__(
         self,
@@ -35,6 +41,7 @@ class Camera(QThread):
         parent: QObject | None = None,
         delay_frames: float = np.nan,
         exposure: float | None = None,
+        rgb: bool = True,
     ):
         QThread.__init__(self, parent=parent)
         self._cap = cv2.VideoCapture(video)
@@ -43,6 +50,7 @@ class Camera(QThread):
             self._cap.set(cv2.CAP_PROP_EXPOSURE, exposure)
         self._running = False
         self.delay_frames = delay_frames
+        self.rgb = rgb
 
     def run(self):
         """Start camera and emit successive frames."""
@@ -55,7 +63,10 @@ class Camera(QThread):
                 self._running = False
                 raise RuntimeError("No frame received")
             else:
-                self.frame_received.emit(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+                if self.rgb:
+                    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                self.frame_received.emit(frame)
+                self.frame_captured.emit(frame, last_time)
 
             while (time.perf_counter() - last_time) < self.delay_frames:
                 # np.nan will always evaluate to False and thus skip this.
@@ -9,7 +9,7 @@ import scipy.signal
 from PyQt6 import QtCore, QtWidgets
 
 import yarppg
-from yarppg.ui.qt6 import camera, utils
+from yarppg.ui.qt6 import camera, utils, worker
 
 
 @dataclasses.dataclass
@@ -46,6 +46,8 @@ class SimpleQt6Window(QtWidgets.QMainWindow):
         self.setWindowTitle("yet another rPPG")
         self._init_ui()
         self.tracker = yarppg.FpsTracker()
+        self.signal_fps: float | None = None
+        """Sampling rate of resampled signals (measured frame rate if None)."""
         self.new_image.connect(self.update_image)
 
     def _init_ui(self) -> None:
@@ -104,17 +106,20 @@ class SimpleQt6Window(QtWidgets.QMainWindow):
         """Update image plot item with new frame."""
         self.img_item.setImage(frame)
 
-    def _handle_roi(
+    def render_frame(
         self, frame: np.ndarray, roi: yarppg.RegionOfInterest
     ) -> np.ndarray:
+        """Create the display image with the ROI overlay (thread-safe)."""
         if self.blursize is not None and roi.face_rect is not None:
             yarppg.pixelate(frame, roi.face_rect, size=self.blursize)
 
+        bgr = roi.channel_order == "bgr"
+        color = (252, 3, 98) if bgr else (98, 3, 252)
         frame = yarppg.roi.overlay_mask(
-            frame, roi.mask == 1, color=(98, 3, 252), alpha=self.roi_alpha
+            frame, roi.full_mask() == 1, color=color, alpha=self.roi_alpha
         )
 
-        return frame
+        return frame[..., ::-1] if bgr else frame  # image item expects RGB
 
     def _handle_signals(self, result: yarppg.RppgResult) -> None:
         rgb = result.roi_mean
@@ -129,20 +134,33 @@ class SimpleQt6Window(QtWidgets.QMainWindow):
     def _handle_hrvalue(self, value: float) -> None:
         """Update user interface with the new HR value."""
         if np.isfinite(value):
-            hr_bpm = self.tracker.fps * 60 / value
+            hr_bpm = (self.signal_fps or self.tracker.fps) * 60 / value
             self.hr_label.setText(f"HR: {hr_bpm:.1f}")
 
-    def _update_fps(self):
+    def _update_fps(self, dropped_frames: int = 0):
         self.tracker.tick()
-        self.fps_label.setText(f"FPS: {self.tracker.fps:.1f}")
+        text = f"FPS: {self.tracker.fps:.1f}"
+        if dropped_frames:
+            text += f" ({dropped_frames} dropped)"
+        self.fps_label.setText(text)
 
     def on_result(self, result: yarppg.RppgResult, frame: np.ndarray) -> None:
         """Update user interface with the new rPPG results."""
-        self._update_fps()
-        self.new_image.emit(self._handle_roi(frame, result.roi))
+        self.show_result(result, self.render_frame(frame, result.roi))
+
+    def show_result(
+        self, result: yarppg.RppgResult, image: np.ndarray, dropped_frames: int = 0
+    ) -> None:
+        """Update user interface with a result and its rendered frame."""
+        self._update_fps(dropped_frames)
+        self.new_image.emit(image)
         self._handle_signals(result)
         self._handle_hrvalue(result.hr)
 
+    def show_error(self, message: str) -> None:
+        """Report that processing failed and no more results will arrive."""
+        self.fps_label.setText(f"Processing failed: {message}")
+
     def keyPressEvent(self, e):  # noqa: N802
         """Handle key presses. Closes the window on Q."""
         if e.key() == ord("Q"):
@@ -154,15 +172,25 @@ def launch_window(rppg: yarppg.Rppg, config: SimpleQt6WindowSettings) -> int:
     app = QtWidgets.QApplication([])
     win = SimpleQt6Window(blursize=config.blursize, roi_alpha=config.roi_alpha)
 
-    cam = camera.Camera(config.video, delay_frames=config.frame_delay)
-    cam.frame_received.connect(
-        lambda frame: win.on_result(rppg.process_frame(frame), frame)
+    # pass camera frames in BGR order, without converting each full frame
+    rppg.roi_detector.channel_order = "bgr"
+    cam = camera.Camera(config.video, delay_frames=config.frame_delay, rgb=False)
+    if rppg.resampler is not None:
+        win.signal_fps = rppg.fps
+    # process the newest frame in a worker thread, keeping the GUI responsive
+    processing = worker.ProcessingWorker(rppg, render=win.render_frame)
+    cam.frame_captured.connect(
+        processing.submit, QtCore.Qt.ConnectionType.DirectConnection
     )
+    processing.result_ready.connect(win.show_result)
+    processing.failed.connect(win.show_error)
+    processing.start()
     cam.start()
 
     win.show()
     ret = app.exec()
     cam.stop()
+    processing.stop()
     return ret
 
 
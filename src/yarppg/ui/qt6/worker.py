@@ -0,0 +1,97 @@
+"""Provides a worker thread running the rPPG pipeline off the GUI thread."""
+
+import logging
+import threading
+from typing import Callable
+
+import numpy as np
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+
+import yarppg
+
+logger = logging.getLogger(__name__)
+
+
+class ProcessingWorker(QThread):
+    """Processes the newest camera frame in a dedicated thread.
+
+    Frames are handed over with `submit`, which can be called from any thread
+    (e.g., directly from the camera thread). Only the newest frame is kept: if
+    a new frame arrives before the previous one was picked up, the previous
+    frame is dropped and counted in `dropped_frames`. The display thus never
+    lags behind the camera by more than one frame, even if processing is
+    slower than the camera.
+
+    After processing, the frame is rendered for display with `render` (still
+    in the worker thread), and the lightweight result is emitted with
+    `result_ready`, together with the rendered image and the number of dropped
+    frames so far.
+
+    If processing a frame raises an exception, it is logged and emitted as a
+    message with `failed`. The worker then stops and ignores further frames.
+
+    Args:
+        rppg: orchestrator processing the frames. It must only be used by
+            this worker while running.
+        render: function creating the display image from the frame and its
+            region of interest. Defaults to None (display the frame as is).
+        parent: parent object in Qt context.
+    """
+
+    result_ready = pyqtSignal(object, np.ndarray, int)
+    failed = pyqtSignal(str)
+
+    def __init__(
+        self,
+        rppg: yarppg.Rppg,
+        render: Callable[[np.ndarray, yarppg.RegionOfInterest], np.ndarray]
+        | None = None,
+        parent: QObject | None = None,
+    ):
+        QThread.__init__(self, parent=parent)
+        self.rppg = rppg
+        self.render = render
+        self.dropped_frames = 0
+        self._latest: tuple[np.ndarray, float] | None = None
+        self._cond = threading.Condition()
+        self._running = True
+
+    def submit(self, frame: np.ndarray, timestamp: float) -> None:
+        """Hand over a new frame, replacing a frame that is still waiting."""
+        with self._cond:
+            if not self._running:
+                return
+            if self._latest is not None:
+                self.dropped_frames += 1
+            self._latest = (frame, timestamp)
+            self._cond.notify()
+
+    def _take(self) -> tuple[np.ndarray, float] | None:
+        with self._cond:
+            while self._running and self._latest is None:
+                self._cond.wait()
+            item, self._latest = self._latest, None
+            return item if self._running else None
+
+    def run(self):
+        """Process frames until `stop` is called."""
+        while (item := self._take()) is not None:
+            frame, timestamp = item
+            try:
+                result = self.rppg.process_frame(frame, timestamp=timestamp)
+                image = frame if self.render is None else self.render(frame, result.roi)
+            except Exception as exc:
+                logger.exception("Processing failed, no more frames are processed.")
+                with self._cond:
+                    self._running = False
+                    self._latest = None
+                self.failed.emit(f"{type(exc).__name__}: {exc}")
+                return
+            self.result_ready.emit(result.lightweight(), image, self.dropped_frames)
+
+    def stop(self):
+        """Stop processing and wait for the thread to finish."""
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        self.wait()
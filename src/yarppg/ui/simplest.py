@@ -1,11 +1,12 @@
 """Provides a simplistic user interface with values printed to console only."""
 import dataclasses
+import time
 
 import cv2
 
 import yarppg
 
-FONT_COLOR = (207, 117, 6)
+FONT_COLOR = (6, 117, 207)  # BGR
 
 
 def _is_window_closed(name: str) -> bool:
@@ -27,23 +28,29 @@ def launch_loop(rppg: yarppg.Rppg, config: SimplestOpenCvWindowSettings) -> int:
         print(f"Could not open {config.video=!r}")
         return -1
 
+    rppg.roi_detector.channel_order = "bgr"  # process camera frames as they are
     tracker = yarppg.FpsTracker()
     while True:
         ret, frame = cam.read()
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         if not ret:
             break
-        result = rppg.process_frame(frame)
+        capture_time = time.perf_counter()
+        result = rppg.process_frame(frame, timestamp=capture_time)
         img = yarppg.roi.overlay_mask(
-            frame, result.roi.mask != 0, alpha=config.roi_alpha
+            frame,
+            result.roi.full_mask() != 0,
+            color=(0, 0, 255),  # red in BGR
+            alpha=config.roi_alpha,
         )
         img = cv2.flip(img, 1)
         tracker.tick()
-        result.hr = 60 * tracker.fps / result.hr
+        # resampled HR refers to the nominal frame rate, not the measured one
+        fps = rppg.fps if rppg.resampler is not None else tracker.fps
+        result.hr = 60 * fps / result.hr
         text = f"{result.hr:.1f} (bpm)"
         pos = (10, img.shape[0] - 10)
         cv2.putText(img, text, pos, cv2.FONT_HERSHEY_COMPLEX, 0.8, color=FONT_COLOR)
-        cv2.imshow("yarPPG", cv2.cvtColor(img, cv2.COLOR_RGB2BGR))
+        cv2.imshow("yarPPG", img)
         print(result.value, result.hr)
         if cv2.waitKey(1) == ord("q") or _is_window_closed("yarPPG"):
             break
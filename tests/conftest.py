@@ -1,5 +1,6 @@
 import pathlib
 
+import cv2
 import numpy as np
 import pytest
 
@@ -27,3 +28,37 @@ def sim_roi() -> yarppg.RegionOfInterest:
     mask[4:-4, 3:-3] = 1
 
     return yarppg.RegionOfInterest(mask, frame.astype("uint8"), bg_mask=bg_mask)
+
+
+class CenterDetector(yarppg.RoiDetector):
+    """Cheap detector selecting the central region of the frame."""
+
+    def detect(self, frame: np.ndarray) -> yarppg.RegionOfInterest:
+        h, w = frame.shape[:2]
+        mask = np.zeros((h, w), dtype="uint8")
+        mask[h // 4 : -h // 4, w // 4 : -w // 4] = 1
+        return yarppg.RegionOfInterest(
+            mask,
+            frame.copy(),
+            face_rect=(w // 4, h // 4, w // 2, h // 2),
+            channel_order=self.channel_order,
+        )
+
+
+@pytest.fixture
+def center_detector() -> CenterDetector:
+    return CenterDetector()
+
+
+@pytest.fixture
+def sim_video(tmp_path: pathlib.Path) -> pathlib.Path:
+    """Write a short video with a pulsating center region (1 Hz at 30 fps)."""
+    filename = tmp_path / "sim_video.avi"
+    fourcc = cv2.VideoWriter.fourcc(*"MJPG")
+    writer = cv2.VideoWriter(str(filename), fourcc, 30, (64, 48))
+    for i in range(300):
+        frame = np.full((48, 64, 3), 100, dtype="uint8")
+        frame[12:36, 16:48, 1] = 120 + 20 * np.sin(2 * np.pi * i / 30)
+        writer.write(frame)
+    writer.release()
+    return filename
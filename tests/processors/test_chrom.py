@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+import yarppg
+
+
+def reference_chrom(rgbs: np.ndarray, winsize: int, method: str) -> np.ndarray:
+    """List-based implementation of the Chrom method (as in yarPPG 1.0)."""
+    values, xs, ys = [], [], []
+    for i, (r, g, b) in enumerate(rgbs):
+        if method == "fixed":
+            mean = np.mean(rgbs[max(0, i + 1 - winsize) : i + 1], axis=0)
+            rn, gn, bn = np.divide((r, g, b), [m or 1.0 for m in mean])
+            x, y = 3 * rn - 2 * gn, 1.5 * rn + gn - 1.5 * bn
+            values.append(x / (y or 1.0) - 1)
+        else:
+            xs.append(r - g)
+            ys.append(0.5 * r + 0.5 * g - b)
+            xmean, ymean = np.mean(xs[-winsize:]), np.mean(ys[-winsize:])
+            values.append(xmean / (ymean or 1) - 1)
+    return np.array(values)
+
+
+def make_rois(n: int, seed=0) -> list[yarppg.RegionOfInterest]:
+    rng = np.random.default_rng(seed)
+    rois = []
+    for i in range(n):
+        img = rng.integers(50, 200, size=(1, 1, 3), dtype="uint8")
+        mask = np.full((1, 1), 0 if 100 <= i < 110 else 1, dtype="uint8")
+        rois.append(yarppg.RegionOfInterest(mask, img))
+    return rois
+
+
+@pytest.mark.parametrize("method", ["fixed", "xovery"])
+def test_chrom_matches_reference(method):
+    rois = make_rois(500)
+    processor = yarppg.ChromProcessor(winsize=45, method=method)
+
+    results = [processor.process(roi) for roi in rois]
+    values = np.array([r.value for r in results])
+    expected = reference_chrom(np.array([r.roi_mean for r in results]), 45, method)
+
+    assert np.allclose(values, expected, equal_nan=True, rtol=1e-9, atol=1e-12)
+    assert np.isnan(values[100:154]).all()
+    assert not np.isnan(values[154:]).any()
+
+
+@pytest.mark.parametrize("method", ["fixed", "xovery"])
+def test_chrom_process_trace(method):
+    rois = make_rois(500)
+    processor = yarppg.ChromProcessor(winsize=45, method=method)
+    results = [processor.process(roi) for roi in rois]
+    values = np.array([r.value for r in results])
+
+    trace = np.array([r.roi_mean for r in results])
+    batch_values = yarppg.ChromProcessor(45, method).process_trace(trace)
+
+    assert np.allclose(batch_values, values, equal_nan=True, rtol=1e-9, atol=1e-12)
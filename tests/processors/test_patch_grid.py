@@ -0,0 +1,42 @@
+import numpy as np
+
+import yarppg
+from yarppg.roi.roi_tools import contour_to_local_mask, patch_grid
+
+
+def test_patch_grid_masked():
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 255, (48, 64, 3), dtype="uint8")
+    mask, rect = contour_to_local_mask((48, 64), [(20, 8), (44, 8), (44, 40)])
+
+    patches = patch_grid(frame, (16, 8, 32, 32), grid=4, mask=mask, mask_rect=rect)
+
+    full_mask = np.zeros((48, 64), dtype=bool)
+    x, y, w, h = rect
+    full_mask[y : y + h, x : x + w] = mask > 0
+    for i in range(4):
+        for j in range(4):
+            cell = np.s_[8 + 8 * i : 16 + 8 * i, 16 + 8 * j : 24 + 8 * j]
+            if full_mask[cell].any():
+                expected = frame[cell][full_mask[cell]].mean(axis=0)
+                assert np.allclose(patches[i, j], expected)
+            else:
+                assert np.all(np.isnan(patches[i, j]))
+
+
+def test_patch_grid_processor():
+    rng = np.random.default_rng(0)
+    frames = rng.integers(50, 200, (60, 8, 8, 3), dtype="uint8")
+    mask = np.ones((8, 8), dtype="uint8")
+    processor = yarppg.PatchGridProcessor(yarppg.ChromProcessor(winsize=5), grid=2)
+
+    results = [
+        processor.process(yarppg.RegionOfInterest(mask, frame, face_rect=(0, 0, 8, 8)))
+        for frame in frames
+    ]
+    patch_means = np.array([result.patch_means for result in results])
+    patch_values = np.array([result.patch_values for result in results])
+
+    assert patch_means.shape == (60, 2, 2, 3)
+    assert np.allclose(patch_means[:, 0, 0], frames[:, :4, :4].mean(axis=(1, 2)))
+    assert np.allclose(patch_values, processor.process_trace(patch_means))
@@ -22,3 +22,88 @@ def test_process(sim_roi: yarppg.RegionOfInterest):
     assert result.value == 2
     assert np.array_equal(result.roi_mean, (56.25, 2, 3))
     assert np.array_equal(result.bg_mean, (4, 5, 6))
+
+
+def test_masked_average_local(sim_roi: yarppg.RegionOfInterest):
+    rect = (3, 4, 10, 8)
+    local_mask = sim_roi.mask[4:12, 3:13]
+
+    roi_avg = yarppg.roi.roi_tools.masked_average(sim_roi.baseimg, local_mask, rect)
+    empty_avg = yarppg.roi.roi_tools.masked_average(
+        sim_roi.baseimg, np.zeros((0, 0), dtype="uint8"), (0, 0, 0, 0)
+    )
+
+    assert np.array_equal(roi_avg, (56.25, 2, 3))
+    assert np.all(np.isnan(empty_avg))
+
+
+def test_masked_average_bgr(sim_roi: yarppg.RegionOfInterest):
+    bgr = np.ascontiguousarray(sim_roi.baseimg[..., ::-1])
+    roi_avg = yarppg.roi.roi_tools.masked_average(
+        bgr, sim_roi.mask, channel_order="bgr"
+    )
+    averages = yarppg.roi.roi_tools.masked_averages(
+        bgr, sim_roi.mask, 1, channel_order="bgr"
+    )
+
+    assert np.array_equal(roi_avg, (56.25, 2, 3))
+    assert np.array_equal(averages, [(56.25, 2, 3)])
+
+
+def test_filtered_process_trace():
+    rng = np.random.default_rng(0)
+    trace = rng.uniform(50, 200, size=(200, 3))
+    trace[50:60] = np.nan
+    cfg = yarppg.digital_filter.FilterConfig(30.0, 0.5, 4.0, btype="band")
+    proc = processor.FilteredProcessor(
+        processor.Processor(), yarppg.digital_filter.make_digital_filter(cfg)
+    )
+
+    rois = [
+        yarppg.RegionOfInterest(np.ones((1, 1), "uint8"), rgb.reshape(1, 1, 3))
+        for rgb in trace
+    ]
+    values = [proc.process(roi).value for roi in rois]
+    batch_values = proc.process_trace(trace)
+
+    assert np.allclose(batch_values, values, equal_nan=True)
+
+
+def test_masked_averages(sim_roi: yarppg.RegionOfInterest):
+    polygons = [[(2, 2), (2, 10), (10, 10)], [(8, 2), (14, 2), (14, 8), (8, 8)]]
+    labels, rect = yarppg.roi.contours_to_local_labels(
+        sim_roi.baseimg.shape[:2], polygons
+    )
+
+    averages = yarppg.roi.masked_averages(sim_roi.baseimg, labels, 3, rect)
+
+    for i in range(2):
+        mask = (labels == i + 1).astype("uint8")
+        expected = yarppg.roi.roi_tools.masked_average(sim_roi.baseimg, mask, rect)
+        assert np.allclose(averages[i], expected)
+    assert np.all(np.isnan(averages[2]))
+
+
+def test_process_regions():
+    rng = np.random.default_rng(0)
+    trace = rng.uniform(50, 200, size=(100, 2, 3))
+    labels = np.array([[1, 2]], dtype="uint8")
+    cfg = yarppg.digital_filter.FilterConfig(30.0, 0.5, 4.0, btype="band")
+    proc = processor.FilteredProcessor(
+        yarppg.ChromProcessor(winsize=10),
+        yarppg.digital_filter.make_digital_filter(cfg),
+    )
+
+    region_values = []
+    for rgb in trace:
+        roi = yarppg.RegionOfInterest(
+            np.ones((1, 2), "uint8"),
+            rgb.reshape(1, 2, 3),
+            labels=labels,
+            region_names=("a", "b"),
+        )
+        result = proc.process(roi)
+        assert np.allclose(result.region_means, rgb)
+        region_values.append(result.region_values)
+
+    assert np.allclose(region_values, proc.process_trace(trace))
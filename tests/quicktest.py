@@ -18,11 +18,11 @@ frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
 detector = yarppg.FaceMeshDetector()
 roi = detector.detect(frame)
 # %%
-plt.imshow(yarppg.roi.overlay_mask(roi.baseimg, roi.mask == 1, alpha=0.3))
+plt.imshow(yarppg.roi.overlay_mask(roi.baseimg, roi.full_mask() == 1, alpha=0.3))
 # %%
 detector = yarppg.SelfieDetector()
 roi = detector.detect(frame)
-plt.imshow(yarppg.roi.overlay_mask(roi.baseimg, roi.mask == 1, alpha=0.3))
+plt.imshow(yarppg.roi.overlay_mask(roi.baseimg, roi.full_mask() == 1, alpha=0.3))
 # %%
 from yarppg_old.rppg.roi.facemesh_detector import (
     FaceMeshDetector as OldFaceMeshDetector,
@@ -0,0 +1,35 @@
+import numpy as np
+
+import yarppg
+
+
+class FakeLandmarker:
+    """Stand-in for MediaPipe's landmarker, recording the timestamps."""
+
+    def __init__(self):
+        self.timestamps = []
+
+    def detect_for_video(self, _image, timestamp_ms):
+        self.timestamps.append(timestamp_ms)
+        return type("Results", (), {"face_landmarks": []})()
+
+    def close(self):
+        pass
+
+
+def test_reset_keeps_landmarker(monkeypatch):
+    monkeypatch.setattr(
+        yarppg.FaceMeshDetector, "_create_landmarker", staticmethod(FakeLandmarker)
+    )
+    detector = yarppg.FaceMeshDetector()
+    landmarker = detector.landmarker
+    frame = np.zeros((48, 64, 3), dtype="uint8")
+
+    for t in [0.0, 0.1]:
+        detector.detect_at(frame, t)
+    detector.reset()
+    for t in [0.0, 0.1]:
+        detector.detect_at(frame, t)
+
+    assert detector.landmarker is landmarker
+    assert landmarker.timestamps == [0, 100, 101, 201]
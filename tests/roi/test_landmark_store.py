@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+import yarppg
+from yarppg.roi import LandmarkStore, ReplayDetector
+
+
+def make_landmarks(x0: float, y0: float) -> np.ndarray:
+    angles = np.linspace(0, 2 * np.pi, 478, endpoint=False)
+    xyz = np.c_[np.cos(angles), np.sin(angles), np.zeros_like(angles)]
+    return (np.round(xyz * (10, 8, 1)) + (x0 + 0.25, y0 + 0.25, 0)).astype(np.float32)
+
+
+def test_store_grows_and_reopens(tmp_path):
+    store = LandmarkStore.create(tmp_path / "store", n_frames=2)
+    for i in range(5):
+        store.append(None if i == 3 else make_landmarks(20 + i, 20))
+    store.flush()
+
+    reopened = LandmarkStore(tmp_path / "store")
+
+    assert len(reopened.valid) >= 5
+    assert reopened[3] is None
+    assert np.array_equal(reopened[4], make_landmarks(24, 20))
+    assert reopened[7] is None
+
+
+def test_replay_detector(tmp_path, sim_video):
+    store = LandmarkStore.create(tmp_path / "store", n_frames=300)
+    for _ in range(299):
+        store.append(make_landmarks(32, 24))
+    store.append(None)
+
+    detector = ReplayDetector(store, polygon=[0, 120, 240, 360])
+    results = yarppg.Rppg(detector).process_video(sim_video)
+
+    assert results[0].roi.face_rect == (22, 16, 20, 16)
+    assert np.array_equal(
+        results[0].roi.polygon, [[42, 24], [32, 32], [22, 24], [32, 16]]
+    )
+    assert np.all(np.isnan(np.array(results[-1].roi_mean)))
+    assert np.isfinite(results[-2].roi_mean.g)
+
+
+def test_replay_detector_segments(tmp_path, sim_video):
+    store = LandmarkStore.create(tmp_path / "store", n_frames=300)
+    for i in range(300):
+        store.append(make_landmarks(22 + i % 20, 24))
+
+    rppg = yarppg.Rppg(ReplayDetector(store, polygon=[0, 120, 240, 360]))
+    expected = rppg.process_video(sim_video, as_dataframe=True)
+    again = rppg.process_video(sim_video, as_dataframe=True)
+    segmented = rppg.process_video(sim_video, as_dataframe=True, segments=3, overlap=1)
+    rppg.reset()
+    first = rppg.process_frame(next(iter(yarppg.VideoReader(sim_video))))
+
+    assert np.array_equal(again["roi_g"], expected["roi_g"])
+    assert np.array_equal(segmented["roi_g"], expected["roi_g"])
+    assert first.roi_mean.g == expected["roi_g"][0]
+
+
+def test_replay_detector_rejects_stride(tmp_path, sim_video):
+    store = LandmarkStore.create(tmp_path / "store", n_frames=300)
+    for i in range(300):
+        store.append(make_landmarks(22 + i % 20, 24))
+
+    rppg = yarppg.Rppg(ReplayDetector(store), resample=True)
+
+    with pytest.raises(ValueError, match="replaying"):
+        rppg.process_video(sim_video, stride=3)
+
+
+def test_replay_detector_regions(tmp_path):
+    store = LandmarkStore.create(tmp_path / "store", n_frames=1)
+    store.append(make_landmarks(32, 24))
+    frame = np.zeros((48, 64, 3), dtype="uint8")
+    frame[:, 32:] = 100
+
+    regions = {"right": [0, 30, 60], "left": [240, 270, 300]}
+    detector = ReplayDetector(store, polygon=[0, 120, 240, 360], regions=regions)
+    result = yarppg.Processor().process(detector.detect(frame))
+
+    assert result.roi.region_names == ("right", "left")
+    assert np.array_equal(result.region_means[:, 1], [100, 0])
+    assert np.array_equal(result.region_values, [100, 0])
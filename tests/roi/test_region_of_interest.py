@@ -1,3 +1,4 @@
+import cv2
 import numpy as np
 
 import yarppg
@@ -20,3 +21,40 @@ def test_contour_to_mask():
 
     assert mask.sum() == 10
     assert mask[mask > 0].mean() == 1
+
+
+def test_track_points():
+    rng = np.random.default_rng(0)
+    img = cv2.GaussianBlur(rng.integers(0, 255, (100, 100), dtype="uint8"), (5, 5), 0)
+    shifted = np.roll(img, (3, 2), axis=(0, 1))  # move 2 px right, 3 px down
+    points = np.array([[40, 40], [50, 60], [60, 45]])
+
+    tracked, quality = yarppg.roi.roi_tools.track_points(img, shifted, points)
+
+    assert quality == 1.0
+    assert np.allclose(tracked, points + [2, 3], atol=0.2)
+
+
+def test_detector_inference_input():
+    frame = np.zeros((48, 64, 3), dtype="uint8")
+    detector = yarppg.RoiDetector(scale=0.5, crop_margin=0.5)
+
+    full_img, full_rect = detector.inference_input(frame)
+    detector._last_face_rect = (20, 10, 20, 10)
+    img, rect = detector.inference_input(frame)
+
+    assert full_rect == (0, 0, 64, 48)
+    assert full_img.shape == (24, 32, 3)
+    assert rect == (10, 5, 40, 20)
+    assert img.shape == (10, 20, 3)
+
+
+def test_contour_to_local_mask():
+    size = (10, 10)
+    points = [(2, 2), (2, 5), (5, 5), (12, 3)]
+
+    mask, rect = yarppg.roi.contour_to_local_mask(size, points)
+    roi = yarppg.RegionOfInterest(mask, np.zeros(size + (3,)), mask_rect=rect)
+
+    assert rect == (2, 2, 8, 4)
+    assert np.array_equal(roi.full_mask(), yarppg.roi.contour_to_mask(size, points))
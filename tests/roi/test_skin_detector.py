@@ -0,0 +1,46 @@
+import pathlib
+import pickle
+
+import cv2
+import numpy as np
+
+import yarppg
+from yarppg.roi import SkinDetector
+
+
+def test_skin_mask_without_cascade():
+    frame = np.full((48, 64, 3), (90, 120, 160), dtype="uint8")  # bluish gray
+    frame[10:30, 20:40] = (200, 150, 120)  # skin tone
+    detector = yarppg.roi.detectors["skin"](face_cascade=False)
+
+    roi = detector.detect(frame)
+
+    assert roi.face_rect == (20, 10, 20, 20)
+    assert roi.mask.sum() == 400
+    assert roi.mask[10:30, 20:40].all()
+
+
+def test_skin_detector_face_example():
+    filename = pathlib.Path(__file__).parents[1] / "face_example1.jpg"
+    frame = cv2.cvtColor(cv2.imread(str(filename)), cv2.COLOR_BGR2RGB)
+    detector = SkinDetector(detect_interval=2)
+
+    roi = detector.detect(frame)
+    roi2 = pickle.loads(pickle.dumps(detector)).detect(frame)
+
+    assert roi.face_rect is not None and roi.mask_rect is not None
+    x, y, w, h = roi.face_rect
+    assert 300 < x + w / 2 < 1300 and 500 < y + h / 2 < 1100
+    assert roi.mask.shape == roi.mask_rect[:1:-1]
+    assert roi.mask.mean() > 0.5
+    assert roi2.face_rect == roi.face_rect
+
+
+def test_skin_detector_bgr():
+    filename = pathlib.Path(__file__).parents[1] / "face_example1.jpg"
+    frame = cv2.imread(str(filename))
+    rgb_roi = SkinDetector().detect(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+    roi = SkinDetector(channel_order="bgr").detect(frame)
+
+    assert roi.face_rect == rgb_roi.face_rect
+    assert np.array_equal(roi.mask, rgb_roi.mask)
@@ -0,0 +1,45 @@
+import pathlib
+import shutil
+
+import pandas as pd
+
+import yarppg
+import yarppg.batch
+
+from .conftest import CenterDetector
+
+
+def test_process_videos(monkeypatch, sim_video: pathlib.Path, tmp_path):
+    monkeypatch.setitem(yarppg.roi.detectors, "center", CenterDetector)
+    corrupt = tmp_path / "corrupt.avi"
+    corrupt.write_bytes(b"not a video")
+    settings = yarppg.Settings(ui=None, detector="center")
+
+    results = yarppg.batch.process_videos(
+        [tmp_path / "*.avi", tmp_path / "missing.avi"],
+        settings,
+        outdir=tmp_path / "out",
+        workers=2,
+    )
+
+    names = [pathlib.Path(r.filename).name for r in results]
+    assert names == ["corrupt.avi", "sim_video.avi", "missing.avi"]
+    assert [r.ok for r in results] == [False, True, False]
+    df = pd.read_csv(results[1].output, index_col="frame")
+    assert len(df) == results[1].n_frames == 300
+
+
+def test_process_videos_same_names(monkeypatch, sim_video: pathlib.Path, tmp_path):
+    monkeypatch.setitem(yarppg.roi.detectors, "center", CenterDetector)
+    for folder in ["a", "b"]:
+        (tmp_path / folder).mkdir()
+        shutil.copy(sim_video, tmp_path / folder / "x.avi")
+    settings = yarppg.Settings(ui=None, detector="center")
+
+    results = yarppg.batch.process_videos(
+        [tmp_path / "*" / "x.avi", sim_video], settings, outdir=tmp_path / "out"
+    )
+
+    assert [r.ok for r in results] == [False, False, True]
+    assert "shared" in str(results[0].error)
+    assert not (tmp_path / "out" / "x.csv").exists()
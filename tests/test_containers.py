@@ -0,0 +1,19 @@
+import numpy as np
+
+import yarppg
+
+
+def test_result_table_grows():
+    table = yarppg.RppgResultTable(capacity=2)
+    roi = yarppg.RegionOfInterest(np.zeros((2, 2)), np.zeros((2, 2, 3)))
+    for i in range(5):
+        color = yarppg.Color(i, i + 1, i + 2)
+        table.append(yarppg.RppgResult(i, roi, color, yarppg.Color.null(), hr=i))
+
+    df = table.to_dataframe()
+
+    assert len(table) == 5
+    assert df.shape == (5, 8)
+    assert list(df.columns) == yarppg.containers.RESULT_COLUMNS
+    assert np.array_equal(df["roi_b"], np.arange(5) + 2)
+    assert df["bg_r"].isna().all()
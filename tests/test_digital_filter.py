@@ -25,3 +25,27 @@ def test_process():
     yfilt_scipy = scipy.signal.lfilter(b, a, ys)
 
     assert np.mean(np.abs(yfilt - yfilt_scipy)) < 1e-7
+
+
+def test_process_matches_process_signal():
+    cfg = digital_filter.FilterConfig(30.0, f1=0.5, f2=4.0, btype="band", order=4)
+    ys = np.random.default_rng(0).normal(size=300)
+
+    live = digital_filter.make_digital_filter(cfg)
+    yfilt = np.array([live.process(y) for y in ys])
+
+    offline = digital_filter.make_digital_filter(cfg)
+    yfilt_offline = np.concatenate(
+        [offline.process_signal(ys[:100]), offline.process_signal(ys[100:])]
+    )
+
+    assert np.array_equal(yfilt, yfilt_offline)
+    assert np.allclose(live.zi, offline.zi)
+
+
+def test_reset_steady_state():
+    cfg = digital_filter.FilterConfig(30.0, f1=2.0, btype="low", order=4)
+    live = digital_filter.make_digital_filter(cfg)
+    live.reset(5.0)
+
+    assert np.allclose([live.process(5.0) for _ in range(10)], 5.0)
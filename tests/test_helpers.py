@@ -1,5 +1,7 @@
 import pathlib
 
+import numpy as np
+
 import yarppg
 
 
@@ -19,3 +21,60 @@ def test_frames_from_video(testfiles_root: pathlib.Path):
 
     assert count == 294
     assert frame.shape == (1080, 1920, 3)
+
+
+def test_frames_from_video_start_stop(sim_video: pathlib.Path):
+    frames = list(yarppg.helpers.frames_from_video(sim_video))
+    segment = list(yarppg.helpers.frames_from_video(sim_video, start=30, stop=40))
+
+    assert yarppg.helpers.get_video_frame_count(sim_video) == len(frames)
+    assert len(segment) == 10
+    assert all(np.array_equal(a, b) for a, b in zip(segment, frames[30:40]))
+
+
+def test_video_reader(sim_video: pathlib.Path):
+    bgr = list(yarppg.helpers.frames_from_video(sim_video))
+    reader = yarppg.helpers.VideoReader(
+        sim_video, start=10, stop=100, stride=3, reuse_buffers=True, prefetch=2
+    )
+
+    timestamps, frames, buffers = [], [], set()
+    for timestamp, frame in reader.with_timestamps():
+        timestamps.append(timestamp)
+        frames.append(frame.copy())
+        buffers.add(id(frame))
+
+    assert len(frames) == 30
+    assert np.allclose(timestamps, np.arange(10, 100, 3) / 30)
+    assert all(np.array_equal(a, b[..., ::-1]) for a, b in zip(frames, bgr[10::3]))
+    assert len(buffers) <= 4
+    assert reader._cap is None and reader._thread is None
+
+
+def test_video_reader_close_early(sim_video: pathlib.Path):
+    with yarppg.helpers.VideoReader(sim_video, prefetch=2) as reader:
+        frames = iter(reader)
+        next(frames)
+    assert reader._cap is None and reader._thread is None
+
+
+def test_rolling_mean():
+    values = np.random.default_rng(0).normal(1e6, 1, size=(1000, 2))
+    values[500, 1] = np.nan
+    rolling = yarppg.helpers.RollingMean(10, size=2)
+
+    means = np.array([rolling.update(v) for v in values])
+    expected = [values[max(0, i - 9) : i + 1].mean(axis=0) for i in range(1000)]
+
+    assert np.allclose(means, expected, equal_nan=True, rtol=1e-12)
+
+
+def test_rolling_mean_vectorized():
+    values = np.random.default_rng(1).normal(size=(100, 2))
+    values[40, 0] = np.nan
+    window = yarppg.helpers.RollingMean(7, size=2)
+
+    expected = np.array([window.update(tuple(v)) for v in values])
+    means = yarppg.helpers.rolling_mean(values, 7)
+
+    assert np.allclose(means, expected, equal_nan=True)
@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+import scipy.signal
+
+import yarppg
+
+from .conftest import CenterDetector
+
+
+def make_pulse_signal(n: int, fs: float = 30, f: float = 1.2) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    t = np.arange(n) / fs
+    signal = np.sin(2 * np.pi * f * t) + 0.3 * rng.normal(size=n)
+    sos = scipy.signal.butter(2, [0.7, 3], btype="band", fs=fs, output="sos")
+    return scipy.signal.sosfiltfilt(sos, signal)
+
+
+def test_peak_tracker_matches_find_peaks():
+    signal = make_pulse_signal(1000)
+    tracker = yarppg.PeakTracker(distance=15, winsize=len(signal))
+    for value in signal:
+        tracker.update(value)
+
+    peaks, _ = scipy.signal.find_peaks(signal, distance=15)
+
+    assert np.array_equal(tracker.peaks, peaks[peaks <= len(signal) - 1 - 15])
+
+
+def test_incremental_hr():
+    signal = make_pulse_signal(3000)
+    hrcalc = yarppg.PeakBasedHrCalculator(30)
+    incremental = yarppg.PeakBasedHrCalculator(30, incremental=True)
+
+    hr = np.array([hrcalc.update(v) for v in signal])
+    hr_incremental = np.array([incremental.update(v) for v in signal])
+
+    assert np.array_equal(np.isnan(hr), np.isnan(hr_incremental))
+    assert np.nanmax(np.abs(hr - hr_incremental)) < 0.5
+    assert abs(np.nanmean(hr_incremental) - 25) < 0.5
+
+
+def test_spectral_hr():
+    fs, n = 30, 1200
+    signal = 100 + make_pulse_signal(n, fs, f=1.23)
+    signal[500:510] = np.nan
+    hrcalc = yarppg.SpectralHrCalculator(fs, window_seconds=10)
+
+    hr = np.array([hrcalc.update(v) for v in signal])
+
+    window = signal[-300:] - signal[-300:].mean()
+    omega = 2 * np.pi * hrcalc.frequencies / fs
+    expected = np.abs(np.exp(-1j * np.outer(omega, np.arange(300))) @ window) ** 2
+    assert np.allclose(hrcalc.spectrum, expected, rtol=1e-9, atol=1e-9)
+    assert np.all(np.isnan(hr[:299]))
+    assert np.all(np.isnan(hr[500:809])) and not np.isnan(hr[809:]).any()
+    assert abs(fs / hr[-1] - 1.23) < 0.02
+    assert hrcalc.quality() > 0.5
+
+
+def test_hr_calculator_from_settings(monkeypatch):
+    monkeypatch.setitem(yarppg.roi.detectors, "center", CenterDetector)
+    settings = yarppg.Settings(
+        ui=None, detector="center", hr_calculator="spectral", fps=60
+    )
+
+    rppg = yarppg.Rppg.from_settings(settings)
+
+    assert isinstance(rppg.hr_calculator, yarppg.SpectralHrCalculator)
+    assert rppg.hr_calculator.fs == 60
+
+
+@pytest.mark.parametrize(
+    "hrcalc",
+    [
+        yarppg.PeakBasedHrCalculator(30),
+        yarppg.PeakBasedHrCalculator(30, window_seconds=5, update_interval=7),
+        yarppg.SpectralHrCalculator(30, update_interval=5),
+    ],
+)
+def test_process_trace(hrcalc):
+    signal = make_pulse_signal(2000)
+    signal[700:720] = np.nan
+    signal[1200:1400] = np.round(signal[1200:1400], 1)  # plateaus and ties
+    hrcalc.update(1.0)  # state should be ignored
+
+    hr = hrcalc.process_trace(signal)
+    hrcalc.reset()
+    expected = [hrcalc.update(v) for v in signal]
+
+    assert np.allclose(hr, expected, equal_nan=True, rtol=1e-9, atol=0)
+
+
+@pytest.mark.parametrize(
+    ("hrcalc", "n"),
+    [
+        (yarppg.PeakBasedHrCalculator(30), 120),  # shorter than the window
+        (yarppg.PeakBasedHrCalculator(30, update_interval=500), 400),
+        (yarppg.SpectralHrCalculator(30), 120),
+    ],
+)
+def test_process_trace_without_update(hrcalc, n):
+    hr = hrcalc.process_trace(make_pulse_signal(n))
+
+    assert hr.shape == (n,) and np.all(np.isnan(hr))
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+import yarppg
+from yarppg.load_control import LoadLevel
+
+
+def test_load_controller_degrades_and_recovers(center_detector):
+    center_detector.detect_interval = 1
+    levels = [LoadLevel(), LoadLevel(scale=0.5, detect_interval=3)]
+    controller = yarppg.LoadController(target_fps=100, levels=levels, cooldown=5)
+    controller.attach(center_detector)
+
+    for _ in range(10):
+        assert controller.should_process()
+        controller.update({"detect": 0.015, "extract": 0.001})  # 1.6x budget
+    assert controller.level == 1
+    assert center_detector.scale == 0.5 and center_detector.detect_interval == 3
+
+    for _ in range(10):
+        controller.update({"detect": 0.002, "extract": 0.001})
+    # the full quality level was measured too slow recently
+    assert controller.level == 1
+
+    for _ in range(200):
+        controller.update({"detect": 0.002, "extract": 0.001})
+    telemetry = controller.telemetry()
+    assert telemetry.level == 0
+    assert center_detector.scale == 1.0 and center_detector.detect_interval == 1
+    assert [(d.old_level, d.new_level) for d in telemetry.decisions] == [(0, 1), (1, 0)]
+    assert telemetry.load == pytest.approx(0.3)
+
+
+def test_rppg_skips_frames(center_detector):
+    levels = [LoadLevel(), LoadLevel(stride=2)]
+    controller = yarppg.LoadController(target_fps=1e6, levels=levels, cooldown=2)
+    with pytest.raises(ValueError, match="resample"):
+        yarppg.Rppg(center_detector, load_controller=controller)
+    rppg = yarppg.Rppg(center_detector, resample=True, load_controller=controller)
+    frame = np.zeros((48, 64, 3), dtype="uint8")
+
+    results = [rppg.process_frame(frame, timestamp=i / 30) for i in range(10)]
+
+    assert controller.level == 1
+    assert controller.frames_skipped == 4
+    assert results[-1].roi is results[-2].roi
+    assert [r.timestamp for r in results] == [i / 30 for i in range(10)]
@@ -0,0 +1,35 @@
+import numpy as np
+
+import yarppg
+
+
+def make_filtered_chrom():
+    cfg = yarppg.digital_filter.FilterConfig(30, 0.5, 2, btype="bandpass")
+    livefilter = yarppg.digital_filter.make_digital_filter(cfg)
+    return yarppg.FilteredProcessor(yarppg.ChromProcessor(), livefilter)
+
+
+def test_multi_rppg_matches_single(sim_video, center_detector):
+    multi = yarppg.MultiRppg(
+        center_detector,
+        processors={"green": yarppg.Processor(), "chrom": make_filtered_chrom()},
+    )
+    results = multi.process_video(sim_video)
+    df = multi.process_video(sim_video, as_dataframe=True)
+
+    for name, processor in [
+        ("green", yarppg.Processor()),
+        ("chrom", make_filtered_chrom()),
+    ]:
+        single = yarppg.Rppg(center_detector, processor).process_video(sim_video)
+        assert np.array_equal(
+            np.array([r[name] for r in results]), np.array(single), equal_nan=True
+        )
+        assert [r[name].timestamp for r in results] == [r.timestamp for r in single]
+    assert list(df.columns[-4:]) == [
+        "value_green",
+        "hr_green",
+        "value_chrom",
+        "hr_chrom",
+    ]
+    assert len(df) == len(results)
@@ -0,0 +1,19 @@
+import pytest
+
+from yarppg import pipeline
+
+
+def test_run_pipelined_keeps_order():
+    results = list(pipeline.run_pipelined(range(100), [str, lambda s: s + "!"], 2))
+
+    assert results == [f"{i}!" for i in range(100)]
+
+
+def test_run_pipelined_raises():
+    def fail_on_five(x):
+        if x == 5:
+            raise ValueError("five")
+        return x
+
+    with pytest.raises(ValueError, match="five"):
+        list(pipeline.run_pipelined(range(10), [fail_on_five]))
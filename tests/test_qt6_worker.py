@@ -0,0 +1,65 @@
+import time
+
+import numpy as np
+import pytest
+
+import yarppg
+
+QtCore = pytest.importorskip("PyQt6.QtCore")
+worker = pytest.importorskip("yarppg.ui.qt6.worker")
+
+
+class SlowDetector(yarppg.RoiDetector):
+    def detect(self, frame: np.ndarray) -> yarppg.RegionOfInterest:
+        time.sleep(0.01)
+        mask = np.ones(frame.shape[:2], dtype="uint8")
+        return yarppg.RegionOfInterest(mask, frame)
+
+
+def test_processing_worker_keeps_latest_frame():
+    app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+    received = []
+    processing = worker.ProcessingWorker(yarppg.Rppg(SlowDetector()))
+    processing.result_ready.connect(lambda *args: received.append(args))
+    processing.start()
+
+    for i in range(50):
+        frame = np.full((4, 4, 3), i, dtype="uint8")
+        processing.submit(frame, timestamp=i / 1000)
+        time.sleep(0.001)
+    deadline = time.perf_counter() + 5
+    while processing.dropped_frames + len(received) < 50:
+        assert time.perf_counter() < deadline
+        app.processEvents()
+        time.sleep(0.001)
+    processing.stop()
+
+    assert 0 < len(received) < 50
+    assert processing.dropped_frames + len(received) == 50
+    result, image, dropped = received[-1]
+    assert isinstance(result.roi, yarppg.RoiSummary)
+    assert image[0, 0, 0] == 49
+    assert dropped == processing.dropped_frames
+
+
+class FailingDetector(yarppg.RoiDetector):
+    def detect(self, frame: np.ndarray) -> yarppg.RegionOfInterest:  # noqa: ARG002
+        raise RuntimeError("detection failed")
+
+
+def test_processing_worker_stops_on_error():
+    app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+    messages = []
+    processing = worker.ProcessingWorker(yarppg.Rppg(FailingDetector()))
+    processing.failed.connect(messages.append)
+    processing.start()
+
+    processing.submit(np.zeros((4, 4, 3), dtype="uint8"), timestamp=0.0)
+    assert processing.wait(5000)
+    app.processEvents()
+    processing.submit(np.zeros((4, 4, 3), dtype="uint8"), timestamp=0.1)
+    processing.submit(np.zeros((4, 4, 3), dtype="uint8"), timestamp=0.2)
+    processing.stop()
+
+    assert messages == ["RuntimeError: detection failed"]
+    assert processing.dropped_frames == 0
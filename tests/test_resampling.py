@@ -0,0 +1,30 @@
+import numpy as np
+
+import yarppg
+
+
+def test_resampler_uniform_input():
+    resampler = yarppg.Resampler(fs=30)
+    times = np.arange(1, 60) / 30
+
+    out = [resampler.update(t, [t, 2 * t]) for t in times]
+
+    assert all(len(samples) == 1 for samples in out)
+    assert np.allclose(np.concatenate(out), np.c_[times, 2 * times])
+
+
+def test_resampler_process_trace():
+    rng = np.random.default_rng(0)
+    times = np.cumsum(rng.uniform(0.01, 0.12, 200)) + 0.123
+    times[50] = times[49]  # repeated timestamps are ignored
+    samples = np.c_[np.sin(times), np.cos(times)]
+    samples[70] = np.nan
+    resampler = yarppg.Resampler(fs=30)
+
+    values, sources = resampler.process_trace(times, samples)
+    online = [resampler.update(t, s) for t, s in zip(times, samples)]
+
+    assert np.allclose(values, np.concatenate(online), equal_nan=True)
+    assert np.array_equal(sources, np.repeat(np.arange(200), [len(o) for o in online]))
+    grid = (np.ceil(times[0] * 30) + np.arange(len(values))) / 30
+    assert np.nanmax(np.abs(values[:, 0] - np.sin(grid))) < 2e-3
@@ -1,7 +1,11 @@
 import pathlib
 
+import numpy as np
+
 import yarppg
 
+from .conftest import CenterDetector
+
 
 def test_process_video(testfiles_root: pathlib.Path):
     filename = testfiles_root / "testvideo_30fps.mp4"
@@ -16,3 +20,114 @@ def test_process_video(testfiles_root: pathlib.Path):
 
     assert len(results) == 294
     assert abs(yarppg.bpm_from_frames_per_beat(results[-1].hr, fps) - 60) < 2.0
+
+
+def test_process_video_as_dataframe(sim_video, center_detector):
+    results = yarppg.Rppg(center_detector).process_video(sim_video)
+    df = yarppg.Rppg(center_detector).process_video(sim_video, as_dataframe=True)
+
+    assert df.shape == (len(results), 8)
+    assert np.allclose(df.to_numpy(), np.array(results), equal_nan=True)
+
+
+def test_process_video_lightweight(sim_video, center_detector):
+    results = yarppg.Rppg(center_detector).process_video(sim_video)
+    light = yarppg.Rppg(center_detector).process_video(sim_video, lightweight=True)
+
+    assert all(isinstance(r.roi, yarppg.RoiSummary) for r in light)
+    assert light[0].roi.face_rect == results[0].roi.face_rect
+    assert np.allclose(np.array(light), np.array(results), equal_nan=True)
+
+
+def test_process_video_bgr(sim_video, center_detector):
+    df = yarppg.Rppg(center_detector).process_video(sim_video, as_dataframe=True)
+    center_detector.channel_order = "bgr"
+    rppg = yarppg.Rppg(center_detector)
+    df_bgr = rppg.process_video(sim_video, as_dataframe=True)
+
+    assert np.allclose(df_bgr.to_numpy(), df.to_numpy(), equal_nan=True)
+
+
+def test_process_video_pipelined(sim_video, center_detector):
+    results = yarppg.Rppg(center_detector).process_video(sim_video)
+    pipelined = yarppg.Rppg(center_detector).process_video(sim_video, pipelined=True)
+
+    assert len(pipelined) == len(results)
+    assert np.array_equal(np.array(pipelined), np.array(results), equal_nan=True)
+
+
+def test_process_video_segments(sim_video, center_detector):
+    def make_rppg():
+        cfg = yarppg.digital_filter.FilterConfig(30, 0.5, 2, btype="bandpass")
+        livefilter = yarppg.digital_filter.make_digital_filter(cfg)
+        processor = yarppg.FilteredProcessor(yarppg.Processor(), livefilter)
+        return yarppg.Rppg(center_detector, processor)
+
+    df = make_rppg().process_video(sim_video, as_dataframe=True)
+    df_seg = make_rppg().process_video(
+        sim_video, as_dataframe=True, segments=2, overlap=4
+    )
+
+    assert len(df_seg) == len(df)
+    assert np.array_equal(df_seg["roi_g"], df["roi_g"])
+    assert np.max(np.abs(df_seg["value"] - df["value"])) < 1e-2 * df["value"].std()
+
+
+def test_process_video_cached(sim_video, center_detector, tmp_path):
+    cache = yarppg.TraceCache(tmp_path / "cache")
+    df = yarppg.Rppg(center_detector).process_video(
+        sim_video, as_dataframe=True, cache=cache
+    )
+    assert len(cache.entries()) == 1
+
+    def fail(_frame):
+        raise AssertionError("ROI detection should be skipped.")
+
+    center_detector.detect = fail
+    processor = yarppg.ChromProcessor()
+    cached = yarppg.Rppg(center_detector, processor).process_video(
+        sim_video, cache=cache
+    )
+    expected = processor.process_trace(df[["roi_r", "roi_g", "roi_b"]].to_numpy())
+
+    assert len(cached) == len(df)
+    assert np.array_equal(np.array([r.roi_mean for r in cached])[:, 1], df["roi_g"])
+    assert np.allclose([r.value for r in cached], expected, equal_nan=True)
+    assert cached[0].roi.face_rect == (16, 12, 32, 24)
+
+
+def test_process_video_resampled(sim_video, center_detector, tmp_path):
+    def make_rppg(**kwargs):
+        hrcalc = yarppg.PeakBasedHrCalculator(30, window_seconds=4, update_interval=1)
+        return yarppg.Rppg(center_detector, hr_calc=hrcalc, **kwargs)
+
+    df = make_rppg().process_video(sim_video, as_dataframe=True)
+    df_res = make_rppg(resample=True).process_video(sim_video, as_dataframe=True)
+    strided = make_rppg(resample=True).process_video(sim_video, stride=3)
+    cache = yarppg.TraceCache(tmp_path / "cache")
+    make_rppg(resample=True).process_video(sim_video, cache=cache)
+    df_cached = make_rppg(resample=True).process_video(
+        sim_video, as_dataframe=True, cache=cache
+    )
+
+    assert np.allclose(df_res.to_numpy(), df.to_numpy(), equal_nan=True)
+    assert np.allclose(df_cached.to_numpy(), df.to_numpy(), equal_nan=True)
+    assert len(strided) == 100
+    assert np.isclose(strided[-1].timestamp, 297 / 30)
+    assert abs(yarppg.bpm_from_frames_per_beat(strided[-1].hr, 30) - 60) < 2.0
+
+
+def test_process_video_detector_timestamps(sim_video):
+    class TimedDetector(CenterDetector):
+        def detect(self, frame):
+            timestamps.append(self._next_timestamp_ms())
+            return super().detect(frame)
+
+    rppg = yarppg.Rppg(TimedDetector())
+    timestamps = []
+    rppg.process_video(sim_video)
+    first, timestamps = timestamps, []
+    rppg.process_video(sim_video)
+
+    assert first[:3] == [0, 33, 66]
+    assert timestamps == [first[-1] + 1 + t for t in first]
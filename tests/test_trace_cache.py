@@ -0,0 +1,54 @@
+import os
+
+import numpy as np
+
+import yarppg
+from yarppg.trace_cache import RoiTrace
+
+
+def make_trace(n: int) -> RoiTrace:
+    rng = np.random.default_rng(n)
+    return RoiTrace(
+        roi_mean=rng.uniform(size=(n, 3)),
+        bg_mean=np.full((n, 3), np.nan),
+        face_rect=np.tile([1.0, 2, 3, 4], (n, 1)),
+        timestamps=np.arange(n) / 30,
+    )
+
+
+def test_save_load(tmp_path):
+    cache = yarppg.TraceCache(tmp_path)
+    trace = make_trace(100)
+
+    assert cache.load("abc") is None
+    cache.save("abc", trace)
+    loaded = cache.load("abc")
+
+    assert loaded is not None
+    assert np.array_equal(loaded.roi_mean, trace.roi_mean)
+    assert list(loaded.face_rects())[0] == (1, 2, 3, 4)
+
+
+def test_key_depends_on_detector_params(tmp_path, sim_video, center_detector):
+    cache = yarppg.TraceCache(tmp_path)
+    key = cache.key(sim_video, center_detector)
+
+    assert cache.key(sim_video, center_detector) == key
+    center_detector.scale = 0.5
+    assert cache.key(sim_video, center_detector) != key
+
+
+def test_evict(tmp_path):
+    cache = yarppg.TraceCache(tmp_path)
+    for i, key in enumerate(["a", "b", "c"]):
+        cache.save(key, make_trace(1000))
+        os.utime(cache.path(key), (1000.0 * i, 1000.0 * i))
+    size = cache.path("c").stat().st_size
+
+    cache.max_bytes = 2 * size + 10
+    assert [p.name for p in cache.evict()] == ["a" + cache.suffix]
+
+    cache.max_age = 60.0
+    os.utime(cache.path("c"))
+    assert cache.evict() == [cache.path("b")]
+    assert cache.entries() == [cache.path("c")]